@@ -1,4 +1,4 @@
-from pygame_gui.core.ui_appearance_theme import UIAppearanceTheme
+from pygame_gui.core.ui_appearance_theme import UIAppearanceTheme, compile_theme
 from pygame_gui.core.ui_container import UIContainer
 from pygame_gui.core.ui_element import UIElement, ObjectID
 from pygame_gui.core.ui_font_dictionary import UIFontDictionary
@@ -9,10 +9,12 @@ from pygame_gui.core.interfaces.window_interface import IWindowInterface
 from pygame_gui.core.colour_gradient import ColourGradient
 from pygame_gui.core.resource_loaders import BlockingThreadedResourceLoader
 from pygame_gui.core.resource_loaders import IncrementalThreadedResourceLoader
+from pygame_gui.core.resource_loaders import StreamingResourceLoader
 from pygame_gui.core.text import TextBoxLayout
 
 __all__ = [
     "UIAppearanceTheme",
+    "compile_theme",
     "UIContainer",
     "UIElement",
     "ObjectID",
@@ -24,5 +26,6 @@ __all__ = [
     "ColourGradient",
     "BlockingThreadedResourceLoader",
     "IncrementalThreadedResourceLoader",
+    "StreamingResourceLoader",
     "TextBoxLayout",
 ]
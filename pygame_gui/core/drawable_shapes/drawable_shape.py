@@ -1,7 +1,7 @@
 import math
 
 from collections import deque
-from typing import Dict, List, Union, Tuple, Optional, Deque
+from typing import Callable, Dict, List, Union, Tuple, Optional, Deque
 
 import pygame
 
@@ -61,18 +61,69 @@ class DrawableShapeState:
                 self.transition = None
 
 
+class StateTransitionBlendBuffers:
+    """
+    The surfaces a drawable shape's state transitions blend into, kept between frames and
+    between transitions so that animating a transition doesn't allocate new surfaces every
+    frame.
+
+    Also remembers the last blend step produced, so asking for the same step again - because
+    the frame rate is higher than the number of blend steps, or because the blended image was
+    requested twice in one frame - just returns the previous result.
+    """
+
+    def __init__(self):
+        self.result_surface: Optional[pygame.Surface] = None
+        self.scratch_surface: Optional[pygame.Surface] = None
+        self.last_blend_key: Optional[Tuple] = None
+
+    def get_surfaces(
+        self, size: Tuple[int, int]
+    ) -> Tuple[pygame.Surface, pygame.Surface]:
+        """
+        Get the result and scratch surfaces, only creating new ones if the size has changed.
+
+        :param size: The size of the states being blended.
+
+        :return: A tuple of the result surface and the scratch surface.
+        """
+        if self.result_surface is None or self.result_surface.get_size() != size:
+            self.result_surface = pygame.surface.Surface(
+                size, flags=pygame.SRCALPHA, depth=32
+            )
+            self.scratch_surface = pygame.surface.Surface(
+                size, flags=pygame.SRCALPHA, depth=32
+            )
+            self.last_blend_key = None
+        return self.result_surface, self.scratch_surface
+
+    def clear(self):
+        """
+        Forget the last blend step, so the next blend is produced afresh. Called whenever the
+        images of the shape's states are redrawn.
+        """
+        self.last_blend_key = None
+
+
 class DrawableStateTransition:
     """
     Starts & controls a transition between two states of a drawable shape.
 
+    The blend between the states is quantised into a fixed number of steps, so the blended
+    image is only rebuilt when the transition moves on to a new step.
+
     :param states: A dictionary of all the drawable states.
     :param start_state_id: The state to start from.
     :param target_state_id: The state to transition to.
     :param duration: The length of the transition
     :param progress: The initial progress along the transition.
+    :param blend_buffers: The surfaces to blend into; normally shared by all the transitions
+                          of a drawable shape. New ones are created if not supplied.
 
     """
 
+    blend_steps = 32
+
     def __init__(
         self,
         states: Dict[str, DrawableShapeState],
@@ -81,6 +132,7 @@ class DrawableStateTransition:
         duration: float,
         *,
         progress: float = 0.0,
+        blend_buffers: Optional[StateTransitionBlendBuffers] = None,
     ):
         self.states = states
         self.duration = duration
@@ -90,6 +142,9 @@ class DrawableStateTransition:
         self.start_stat_id = start_state_id
         self.target_state_id = target_state_id
         self.finished = False
+        if blend_buffers is None:
+            blend_buffers = StateTransitionBlendBuffers()
+        self.blend_buffers = blend_buffers
 
     def update(self, time_delta: float):
         """
@@ -110,33 +165,41 @@ class DrawableStateTransition:
         Produces a blend between the images of our start state and our target state. The
         progression of the blend is dictated by the progress of time through the transition.
 
+        The blend is drawn into the transition's blend buffers, so the returned surface is
+        reused by later blends and must not be modified.
+
         :return: The blended surface.
 
         """
-        result = self.states[self.start_stat_id].surface.copy()
-        blended_target = self.states[self.target_state_id].surface.copy()
-        start_multiply_surface = pygame.surface.Surface(
-            self.states[self.start_stat_id].surface.get_size(),
-            flags=pygame.SRCALPHA,
-            depth=32,
-        )
-        target_multiply_surface = start_multiply_surface.copy()
+        start_surface = self.states[self.start_stat_id].surface
+        target_surface = self.states[self.target_state_id].surface
 
-        start_alpha = int(round(255.0 * self.percentage_start_state))
+        step = int(round(self.percentage_start_state * self.blend_steps))
+        start_alpha = int(round(255.0 * step / self.blend_steps))
         target_alpha = 255 - start_alpha
 
-        start_multiply_surface.fill(
-            pygame.Color(start_alpha, start_alpha, start_alpha, 255)
+        result, scratch = self.blend_buffers.get_surfaces(start_surface.get_size())
+        blend_key = (self.start_stat_id, self.target_state_id, start_alpha)
+        if blend_key == self.blend_buffers.last_blend_key:
+            return result
+
+        # copy the states into the buffers with additive blits on to cleared surfaces, then
+        # scale the colour channels in place; the same maths as the old multiply surfaces
+        # without creating any new surfaces.
+        result.fill((0, 0, 0, 0))
+        result.blit(start_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        result.fill(
+            (start_alpha, start_alpha, start_alpha, 255),
+            special_flags=pygame.BLEND_RGB_MULT,
         )
-        target_multiply_surface.fill(
-            pygame.Color(target_alpha, target_alpha, target_alpha, 255)
+        scratch.fill((0, 0, 0, 0))
+        scratch.blit(target_surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        scratch.fill(
+            (target_alpha, target_alpha, target_alpha, 255),
+            special_flags=pygame.BLEND_RGB_MULT,
         )
-
-        result.blit(start_multiply_surface, (0, 0), special_flags=pygame.BLEND_RGB_MULT)
-        blended_target.blit(
-            target_multiply_surface, (0, 0), special_flags=pygame.BLEND_RGB_MULT
-        )
-        result.blit(blended_target, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+        result.blit(scratch, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+        self.blend_buffers.last_blend_key = blend_key
         return result
 
 
@@ -242,6 +305,7 @@ class DrawableShape:
         self.states = {}
         for state in states:
             self.states[state] = DrawableShapeState(state)
+        self.transition_blend_buffers = StateTransitionBlendBuffers()
 
         if "normal" in states:
             self.active_state = self.states["normal"]
@@ -263,6 +327,10 @@ class DrawableShape:
         self.states_to_redraw_queue: Deque[str] = deque([])
         self.need_to_clean_up = True
 
+        # called when the shape has work to do in update(), so an idle owner knows to start
+        # updating it again
+        self.update_needed_callback: Optional[Callable[[], None]] = None
+
         self.should_trigger_full_rebuild = True
         self.time_until_full_rebuild_after_changing_size = 0.35
         self.full_rebuild_countdown = self.time_until_full_rebuild_after_changing_size
@@ -345,6 +413,7 @@ class DrawableShape:
             self.previous_state = self.active_state
             self.active_state = self.states[state_id]
             self.active_state.has_fresh_surface = True
+            self.schedule_update()
 
             if self.previous_state is not None and (
                 (self.previous_state.state_id, self.active_state.state_id)
@@ -358,7 +427,11 @@ class DrawableShape:
                 if self.previous_state.transition is None:
                     # completely fresh transition
                     self.active_state.transition = DrawableStateTransition(
-                        self.states, prev_id, next_id, duration
+                        self.states,
+                        prev_id,
+                        next_id,
+                        duration,
+                        blend_buffers=self.transition_blend_buffers,
                     )
                 elif (
                     self.previous_state.transition.start_stat_id
@@ -366,7 +439,12 @@ class DrawableShape:
                 ):
                     progress_time = self.previous_state.transition.remaining_time
                     transition = DrawableStateTransition(
-                        self.states, prev_id, next_id, duration, progress=progress_time
+                        self.states,
+                        prev_id,
+                        next_id,
+                        duration,
+                        progress=progress_time,
+                        blend_buffers=self.transition_blend_buffers,
                     )
                     self.active_state.transition = transition
 
@@ -393,6 +471,28 @@ class DrawableShape:
 
         self.active_state.update(time_delta)
 
+    def is_idle(self) -> bool:
+        """
+        Check if the shape has nothing left to do in update(); no states waiting to be redrawn,
+        no transition blending and no fresh surface waiting to be collected.
+
+        :return: True if calling update() would do nothing.
+        """
+        return (
+            not self.states_to_redraw_queue
+            and not self.need_to_clean_up
+            and not self.should_trigger_full_rebuild
+            and self.active_state.transition is None
+            and not self.active_state.has_fresh_surface
+        )
+
+    def schedule_update(self):
+        """
+        Let whoever owns this shape know that it has work to do in update() again.
+        """
+        if self.update_needed_callback is not None:
+            self.update_needed_callback()
+
     def full_rebuild_on_size_change(self):
         """
         Triggered when we've changed the size of the shape and need to rebuild basically everything
@@ -478,6 +578,7 @@ class DrawableShape:
         )
         initial_state = self.states_to_redraw_queue.popleft()
         self.redraw_state(initial_state)
+        self.schedule_update()
 
     def align_all_text_rows(self):
         """
@@ -587,6 +688,7 @@ class DrawableShape:
                                              be adding images and text to.
 
         """
+        self.transition_blend_buffers.clear()
         # Handle images - always look for list-based image parameters
         images_key = image_state_str
         if images_key in self.theming:
@@ -842,6 +944,7 @@ class DrawableShape:
         :param text_shadow_colour_state_str: The string identifying the text shadow
                                              colour to use.
         """
+        self.transition_blend_buffers.clear()
         if self.text_box_layout is not None:
             # copy the pre-text surface & create a new empty text surface for this state
             self.states[state_str].pre_text_surface = self.states[
@@ -881,6 +984,7 @@ class DrawableShape:
         This may be bugged.
 
         """
+        self.transition_blend_buffers.clear()
         if self.text_box_layout is not None:
             for _, state in self.states.items():
                 if (
@@ -968,6 +1072,7 @@ class DrawableShape:
             self.text_box_layout.toggle_cursor()
             self.finalise_text_onto_active_state()
             self.active_state.has_fresh_surface = True
+            self.schedule_update()
 
     def redraw_state(self, state_str: str, add_text: bool = True):
         """
@@ -368,6 +368,7 @@ class EllipseDrawableShape(DrawableShape):
             )
 
         self.states[state_str].has_fresh_surface = True
+        self.schedule_update()
         self.states[state_str].generated = True
 
     @staticmethod
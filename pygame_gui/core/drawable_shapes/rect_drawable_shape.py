@@ -468,4 +468,5 @@ class RectDrawableShape(DrawableShape):
             )
 
         self.states[state_str].has_fresh_surface = True
+        self.schedule_update()
         self.states[state_str].generated = True
@@ -341,10 +341,23 @@ class RoundedRectangleShape(DrawableShape):
         self.click_area_shape.width = int(dimensions[0]) - (2 * self.shadow_width)
         self.click_area_shape.height = int(dimensions[1]) - (2 * self.shadow_width)
 
+        border_overlap = self.theming.get("border_overlap", 0)
         if dimensions[0] <= 0 or dimensions[1] <= 0:
             self.states[
                 "normal"
             ].surface = self.ui_manager.get_universal_empty_surface()
+        elif (
+            self._get_nine_slice_corner_size(
+                self.theming["normal_bg"],
+                self.theming["normal_border"],
+                border_overlap,
+            )
+            is not None
+        ):
+            # nine-slicing is quick enough to skip the temporary shape and rebuild straight away
+            self.has_been_resized = True
+            self.full_rebuild_on_size_change()
+            return True
         else:
             if self.shadow_width > 0:
                 quick_surf = self.ui_manager.get_shadow(
@@ -396,6 +409,7 @@ class RoundedRectangleShape(DrawableShape):
         self.has_been_resized = True
         self.should_trigger_full_rebuild = True
         self.full_rebuild_countdown = self.time_until_full_rebuild_after_changing_size
+        self.schedule_update()
 
         return True
 
@@ -420,10 +434,14 @@ class RoundedRectangleShape(DrawableShape):
             if "border_overlap" in self.theming:
                 border_overlap = self.theming["border_overlap"]
 
+            nine_slice_corner_size = self._get_nine_slice_corner_size(
+                bg_col, border_col, border_overlap
+            )
             found_shape = None
             shape_id = None
             if (
-                "filled_bar" not in self.theming
+                nine_slice_corner_size is None
+                and "filled_bar" not in self.theming
                 and "filled_bar_width_percentage" not in self.theming
             ):
                 shape_id = self.shape_cache.build_cache_id(
@@ -439,6 +457,14 @@ class RoundedRectangleShape(DrawableShape):
                 found_shape = self.shape_cache.find_surface_in_cache(shape_id)
             if found_shape is not None:
                 self.states[state_str].surface = found_shape.copy()
+            elif nine_slice_corner_size is not None:
+                self._redraw_nine_sliced_state(
+                    state_str,
+                    bg_col,
+                    border_col,
+                    border_overlap,
+                    nine_slice_corner_size,
+                )
             else:
                 if self.base_surface is not None:
                     self.states[state_str].surface = self.base_surface.copy()
@@ -562,8 +588,231 @@ class RoundedRectangleShape(DrawableShape):
             )
 
         self.states[state_str].has_fresh_surface = True
+        self.schedule_update()
         self.states[state_str].generated = True
 
+    def _get_nine_slice_corner_size(
+        self,
+        bg_col: Union[pygame.Color, ColourGradient],
+        border_col: Union[pygame.Color, ColourGradient],
+        border_overlap: int,
+    ) -> Optional[int]:
+        """
+        Work out how big the corner slices of this shape need to be to draw it nine-sliced - from
+        a small, cached, copy of the shape with its edges and middle stretched to fit.
+
+        :param bg_col: the colour of the background.
+        :param border_col: the colour of the border.
+        :param border_overlap: the overlap between the border and the background.
+
+        :return: The width and height of the corner slices, or None if the shape can't be
+                 nine-sliced because it has a gradient or a filled bar, or is too small.
+        """
+        border_width = self.border_widths["left"]
+        if (
+            isinstance(bg_col, ColourGradient)
+            or (border_width > 0 and isinstance(border_col, ColourGradient))
+            or "filled_bar" in self.theming
+            or "filled_bar_width_percentage" in self.theming
+        ):
+            return None
+        # everything further in from the edge than this is the same all the way along it
+        corner_size = border_width + max(border_overlap, 0)
+        corner_size += max(self.shape_corner_radius) + 1
+        if min(self.click_area_shape.size) < (corner_size * 2) + 1:
+            return None
+        return corner_size
+
+    def _redraw_nine_sliced_state(
+        self,
+        state_str: str,
+        bg_col: pygame.Color,
+        border_col: pygame.Color,
+        border_overlap: int,
+        corner_size: int,
+    ):
+        """
+        Redraw the shape's surface for a state by stretching the edges and middle of a small
+        copy of the shape, so only the corners are ever drawn anti-aliased.
+
+        :param state_str: The ID string of the state to redraw.
+        :param bg_col: the colour of the background.
+        :param border_col: the colour of the border.
+        :param border_overlap: the overlap between the border and the background.
+        :param corner_size: the width and height of the corner slices.
+        """
+        state = self.states[state_str]
+        if state.cached_background_id is not None:
+            self.shape_cache.remove_user_from_cache_item(state.cached_background_id)
+            state.cached_background_id = None
+        if self.base_surface is not None:
+            state.surface = self.base_surface.copy()
+        else:
+            state.surface = pygame.surface.Surface(
+                self.containing_rect.size, flags=pygame.SRCALPHA, depth=32
+            )
+
+        # shrink the background's corners with the background, as the supersampled path does
+        aa_amount = 4
+        border_width = self.border_widths["left"]
+        width, height = self.click_area_shape.size
+        dimension_scale = min(
+            (width - (2 * border_width)) / width, (height - (2 * border_width)) / height
+        )
+        bg_corner_radii = [
+            int(corner_radius * dimension_scale)
+            for corner_radius in self.shape_corner_radius
+        ]
+        large_bg_corner_radii = [
+            round(corner_radius * aa_amount * dimension_scale)
+            for corner_radius in self.shape_corner_radius
+        ]
+
+        source_size = (corner_size * 2) + 1
+        source_id = self.shape_cache.build_cache_id(
+            f"rounded_rectangle_nine_slice_{border_overlap}",
+            (source_size, source_size),
+            0,
+            self.border_widths,
+            border_col,
+            bg_col,
+            self.shape_corner_radius + bg_corner_radii + large_bg_corner_radii,
+        )
+        source = self.shape_cache.find_surface_in_cache(source_id)
+        if source is None:
+            source = self._create_nine_slice_source(
+                source_size,
+                bg_col,
+                border_col,
+                border_overlap,
+                bg_corner_radii,
+                large_bg_corner_radii,
+                aa_amount,
+            )
+            self.shape_cache.add_surface_to_cache(source, source_id)
+        else:
+            self.shape_cache.remove_user_from_cache_item(source_id)
+
+        # corners, then edges stretched from the one pixel wide strips between them
+        far_corner = corner_size + 1
+        left, top = self.shadow_width, self.shadow_width
+        right, bottom = left + width - corner_size, top + height - corner_size
+        middle_width = width - (2 * corner_size)
+        middle_height = height - (2 * corner_size)
+        for source_x, x in ((0, left), (far_corner, right)):
+            for source_y, y in ((0, top), (far_corner, bottom)):
+                basic_blit(
+                    state.surface,
+                    source,
+                    (x, y),
+                    pygame.Rect(source_x, source_y, corner_size, corner_size),
+                )
+        for source_y, y in ((0, top), (far_corner, bottom)):
+            edge = source.subsurface((corner_size, source_y, 1, corner_size))
+            basic_blit(
+                state.surface,
+                pygame.transform.scale(edge, (middle_width, corner_size)),
+                (left + corner_size, y),
+            )
+        for source_x, x in ((0, left), (far_corner, right)):
+            edge = source.subsurface((source_x, corner_size, corner_size, 1))
+            basic_blit(
+                state.surface,
+                pygame.transform.scale(edge, (corner_size, middle_height)),
+                (x, top + corner_size),
+            )
+
+        middle_rect = pygame.Rect(
+            left + corner_size, top + corner_size, middle_width, middle_height
+        )
+        middle_colour = source.get_at((corner_size, corner_size))
+        if middle_colour.a == 255:
+            # an opaque pre-multiplied blit is a straight copy
+            state.surface.fill(middle_colour, middle_rect)
+        else:
+            middle = source.subsurface((corner_size, corner_size, 1, 1))
+            basic_blit(
+                state.surface,
+                pygame.transform.scale(middle, middle_rect.size),
+                middle_rect,
+            )
+
+    def _create_nine_slice_source(
+        self,
+        size: int,
+        bg_col: pygame.Color,
+        border_col: pygame.Color,
+        border_overlap: int,
+        bg_corner_radii: List[int],
+        large_bg_corner_radii: List[int],
+        aa_amount: int,
+    ) -> pygame.surface.Surface:
+        """
+        Draw a small, square, anti-aliased copy of the shape - without its shadow - to cut the
+        nine slices from.
+
+        :param size: the width and height of the copy.
+        :param bg_col: the colour of the background.
+        :param border_col: the colour of the border.
+        :param border_overlap: the overlap between the border and the background.
+        :param bg_corner_radii: the radii of the background's corners, used to clear a space
+                                for it.
+        :param large_bg_corner_radii: the radii of the background's corners when drawn at the
+                                      supersampled size.
+        :param aa_amount: how many times bigger to draw the shape before scaling it down.
+
+        :return: The new surface.
+        """
+        border_width = self.border_widths["left"]
+        large_surface = pygame.surface.Surface(
+            (size * aa_amount, size * aa_amount), flags=pygame.SRCALPHA, depth=32
+        )
+        large_surface.fill(pygame.Color("#00000000"))
+        border_rect = large_surface.get_rect()
+        background_rect = border_rect.inflate(
+            -2 * border_width * aa_amount, -2 * border_width * aa_amount
+        )
+        if border_width > 0:
+            border_surface = pygame.surface.Surface(
+                border_rect.size, flags=pygame.SRCALPHA, depth=32
+            )
+            border_surface.fill(pygame.Color("#00000000"))
+            RoundedRectangleShape.draw_colourless_rounded_rectangle(
+                [radius * aa_amount for radius in self.shape_corner_radius],
+                border_surface,
+            )
+            apply_colour_to_surface(border_col, border_surface)
+            basic_blit(large_surface, border_surface, border_rect)
+
+        subtract_rect = background_rect.inflate(
+            -2 * border_overlap * aa_amount, -2 * border_overlap * aa_amount
+        )
+        if subtract_rect.width > 0 and subtract_rect.height > 0:
+            subtract_surface = pygame.surface.Surface(
+                subtract_rect.size, flags=pygame.SRCALPHA, depth=32
+            )
+            subtract_surface.fill(pygame.Color("#00000000"))
+            RoundedRectangleShape.draw_colourless_rounded_rectangle(
+                [radius * aa_amount for radius in bg_corner_radii],
+                subtract_surface,
+                aa_amount // 2,
+            )
+            large_surface.blit(
+                subtract_surface, subtract_rect, special_flags=pygame.BLEND_RGBA_SUB
+            )
+
+        bg_surface = pygame.surface.Surface(
+            background_rect.size, flags=pygame.SRCALPHA, depth=32
+        )
+        bg_surface.fill(pygame.Color("#00000000"))
+        RoundedRectangleShape.draw_colourless_rounded_rectangle(
+            large_bg_corner_radii, bg_surface
+        )
+        apply_colour_to_surface(bg_col, bg_surface)
+        basic_blit(large_surface, bg_surface, background_rect)
+
+        return pygame.transform.smoothscale(large_surface, (size, size))
+
     def _redraw_filled_bar(
         self,
         bg_col: Union[pygame.Color, ColourGradient],
@@ -1,7 +1,7 @@
 import io
 
 from abc import ABCMeta, abstractmethod
-from typing import Optional, List, Union, Dict, TypedDict
+from typing import Optional, List, Union, Dict, Set, TypedDict
 from os import PathLike
 
 
@@ -79,6 +79,39 @@ class IUIAppearanceThemeInterface(metaclass=ABCMeta):
         :return bool: True if we need to reload elements because the theme data has changed.
         """
 
+    @abstractmethod
+    def get_changed_theme_categories(self, combined_ids: List[str]) -> Set[str]:
+        """
+        Get the categories of theme data that have changed for an element since the theme
+        changes were last cleared.
+
+        :param combined_ids: A list of IDs representing an element's location in a hierarchy
+                             of elements.
+
+        :return: A set containing any of 'colours', 'font', 'misc' and 'images'.
+        """
+
+    @abstractmethod
+    def clear_theme_changes(self):
+        """
+        Forget the record of which theme data has changed.
+        """
+
+    @abstractmethod
+    def start_background_reload_checks(self, check_interval: float = 1.0):
+        """
+        Start checking the theme file for changes, and reading and validating new versions of
+        it, on a background thread. Changes are then applied by check_need_to_reload().
+
+        :param check_interval: How often to check the file for changes, in seconds.
+        """
+
+    @abstractmethod
+    def stop_background_reload_checks(self):
+        """
+        Stop checking the theme file for changes on a background thread.
+        """
+
     @abstractmethod
     def update_caching(self, time_delta: float):
         """
@@ -170,6 +170,34 @@ class IGUISpriteInterface(metaclass=ABCMeta):
         :param value:
         """
 
+    @abstractmethod
+    def is_idle(self) -> bool:
+        """
+        Check if this sprite has nothing to do in update() right now.
+
+        :return: True if calling update() would do nothing.
+        """
+
+    @abstractmethod
+    def schedule_update(self):
+        """
+        Ask the groups this sprite is in to start calling its update() method again.
+        """
+
+    @abstractmethod
+    def notify_rect_changed(self):
+        """
+        Let the groups this sprite is in know that its rect has been moved or resized in place.
+        """
+
+    @abstractmethod
+    def set_blit_area(self, area):
+        """
+        Set the part of the image that is drawn, or None to draw all of it.
+
+        :param area: A rectangle in image coordinates, or None.
+        """
+
     @property
     @abstractmethod
     def blendmode(self):
@@ -12,6 +12,7 @@ from pygame_gui.core.interfaces.window_stack_interface import IUIWindowStackInte
 from pygame_gui.core.interfaces.tool_tip_interface import IUITooltipInterface
 from pygame_gui.core.object_id import ObjectID
 from pygame_gui.core.layered_gui_group import LayeredGUIGroup
+from pygame_gui.core.ui_profiler import UIProfiler
 
 
 class IUIManagerInterface(metaclass=ABCMeta):
@@ -170,13 +171,71 @@ class IUIManagerInterface(metaclass=ABCMeta):
         """
 
     @abstractmethod
-    def draw_ui(self, window_surface: pygame.surface.Surface):
+    def draw_ui(self, window_surface: pygame.surface.Surface) -> List[pygame.Rect]:
         """
         Draws the UI.
 
         :param window_surface: The screen or window surface on which we are going to draw all of
          our UI Elements.
 
+        :return: A list of the rectangles on the surface that were drawn to.
+        """
+
+    @abstractmethod
+    def set_dirty_rect_mode(
+        self, is_active: bool, background: Optional[pygame.Surface] = None
+    ):
+        """
+        Turn dirty rectangle drawing on or off.
+
+        :param is_active: True to only redraw the changed parts of the UI, False to redraw it all.
+        :param background: A surface used to restore areas under changed UI elements.
+        """
+
+    @abstractmethod
+    def set_profiling_mode(self, is_active: bool, max_frames: Optional[int] = None):
+        """
+        Turn recording of per-frame profiling data on or off.
+
+        :param is_active: True to start recording frames and False to stop.
+        :param max_frames: The number of most recent frame records to keep.
+        """
+
+    @abstractmethod
+    def set_background_theme_reload_mode(
+        self, is_active: bool, rebuild_time_budget: float = 0.004
+    ):
+        """
+        Turn background checking and loading of the live theme file on or off.
+
+        :param is_active: True to check the theme file on a background thread.
+        :param rebuild_time_budget: The most time to spend rebuilding elements with the new
+                                    theme each frame, in seconds.
+        """
+
+    @abstractmethod
+    def set_shape_cache_memory_budget(self, max_memory_bytes: Optional[int]):
+        """
+        Cap the memory used by the theme's cache of drawn shapes.
+
+        :param max_memory_bytes: The most memory the shape cache may use, in bytes. None removes
+                                 the budget.
+        """
+
+    @abstractmethod
+    def get_shape_cache_memory_usage(self) -> int:
+        """
+        Get the memory currently used by the theme's cache of drawn shapes.
+
+        :return: The memory used in bytes.
+        """
+
+    @abstractmethod
+    def get_profiler(self) -> UIProfiler:
+        """
+        Get the profiler that records what the UI does each frame.
+
+        :return: The UIProfiler.
         """
 
     @abstractmethod
@@ -1,12 +1,15 @@
 from operator import truth
 from abc import abstractmethod
 from collections.abc import Iterable
-from typing import Union, Optional, Dict, List
+from typing import Union, Optional, Dict, List, Set
 
 
 import pygame
 from pygame.rect import Rect
 
+from pygame_gui.core.spatial_grid import SpatialGrid
+from pygame_gui.core.ui_profiler import UIProfiler
+
 
 class GUISprite:
     """
@@ -24,9 +27,17 @@ class GUISprite:
 
         self._image = None
         self._rect = None
+        # the part of the image to draw, and where its top left corner lands on screen
+        self._blit_area: Optional[Rect] = None
+        self._blit_dest = Rect(0, 0, 0, 0)
 
         self.blit_data = [self._image, self._rect, None, self._blendmode]
 
+        # Set whenever the image, rect, blend mode or visibility is replaced. Only used by
+        # groups drawing in dirty rectangle mode; set it manually after drawing onto the
+        # existing image surface in place.
+        self.dirty = True
+
         # Default 0 unless initialized differently.
         self._layer = getattr(self, "_layer", 0)
         self.source_rect = None
@@ -150,6 +161,25 @@ class GUISprite:
         :param time_delta: the time passed in seconds between calls to this function.
         """
 
+    def is_idle(self) -> bool:
+        """
+        Check if this sprite has nothing to do in update() right now. Idle sprites are skipped
+        by their groups' update() until schedule_update() is called on them.
+
+        Sprites are never idle unless they override this.
+
+        :return: True if calling update() would do nothing.
+        """
+        return False
+
+    def schedule_update(self):
+        """
+        Ask the groups this sprite is in to start calling its update() method again, after it
+        has been idle. Groups keep updating it until is_idle() returns True.
+        """
+        for group in self.__g:
+            group.schedule_update(self)
+
     @property
     def visible(self):
         """
@@ -161,6 +191,7 @@ class GUISprite:
     @visible.setter
     def visible(self, value):
         self._set_visible(value)
+        self.dirty = True
         for group in self.groups():
             group.should_update_visibility = True
 
@@ -204,6 +235,7 @@ class GUISprite:
         else:
             self._image = value
             self.blit_data[0] = self._image
+        self.dirty = True
 
     @property
     def rect(self):
@@ -219,7 +251,42 @@ class GUISprite:
     @rect.setter
     def rect(self, value):
         self._rect = value
-        self.blit_data[1] = self._rect
+        self.dirty = True
+        self.notify_rect_changed()
+
+    def notify_rect_changed(self):
+        """
+        Let the groups this sprite is in know that its rect has been moved or resized. Called
+        automatically when the rect is replaced, call it manually after changing the existing
+        rect in place.
+        """
+        self._update_blit_dest()
+        for group in self.__g:
+            group.on_sprite_rect_changed(self)
+
+    def set_blit_area(self, area: Optional[Rect]):
+        """
+        Set the part of the image that is drawn, or None to draw all of it. The area is drawn
+        where it would be if the whole image was drawn, so this can clip a sprite without
+        building a new, cut down, image.
+
+        :param area: A rectangle in image coordinates, or None.
+        """
+        self._blit_area = area
+        self.blit_data[2] = area
+        self._update_blit_dest()
+        self.dirty = True
+
+    def _update_blit_dest(self):
+        """
+        Point the blit data at the screen position of the blit area's top left corner.
+        """
+        area = self._blit_area
+        if area is None or self._rect is None:
+            self.blit_data[1] = self._rect
+        else:
+            self._blit_dest.topleft = (self._rect.x + area.x, self._rect.y + area.y)
+            self.blit_data[1] = self._blit_dest
 
     @property
     def blendmode(self):
@@ -236,6 +303,7 @@ class GUISprite:
     def blendmode(self, value):
         self._blendmode = value
         self.blit_data[3] = self._blendmode
+        self.dirty = True
 
 
 class LayeredGUIGroup:
@@ -254,11 +322,19 @@ class LayeredGUIGroup:
         self.spritedict = {}
         self.lostsprites = []
         self._default_layer = 0
+        self._spatial_index: Optional[SpatialGrid] = None
+        self._sprite_ranks: Dict[GUISprite, int] = {}
+        self._sprite_ranks_dirty = True
+        # the sprites that get update() called on them; the rest are idle
+        self._sprites_to_update: Set[GUISprite] = set()
 
         self.add(*sprites)
         self._clip = None
         self.visible = []
+        self._visible_sprites: List[GUISprite] = []
         self.should_update_visibility = True
+        self._last_dirty_surface: Optional[pygame.Surface] = None
+        self.profiler: Optional[UIProfiler] = None
 
     def add_internal(self, sprite: GUISprite, layer=None):
         """Do not use this method directly.
@@ -306,6 +382,10 @@ class LayeredGUIGroup:
         sprites.insert(mid, sprite)
 
         self.should_update_visibility = True
+        self._sprite_ranks_dirty = True
+        self._sprites_to_update.add(sprite)
+        if self._spatial_index is not None and sprite.rect is not None:
+            self._spatial_index.insert(sprite, sprite.rect)
 
     def remove_internal(self, sprite: GUISprite):
         """
@@ -324,6 +404,10 @@ class LayeredGUIGroup:
         del self.spritedict[sprite]
         del self._spritelayers[sprite]
         self.should_update_visibility = True
+        self._sprite_ranks_dirty = True
+        self._sprites_to_update.discard(sprite)
+        if self._spatial_index is not None:
+            self._spatial_index.remove(sprite)
 
     def change_layer(self, sprite: GUISprite, new_layer: int):
         """
@@ -359,36 +443,241 @@ class LayeredGUIGroup:
         # add layer info
         sprites_layers[sprite] = new_layer
         self.should_update_visibility = True
+        self._sprite_ranks_dirty = True
+
+    def on_sprite_rect_changed(self, sprite: GUISprite):
+        """
+        Called by sprites in this group when their rect changes, to keep the spatial index
+        up to date.
+
+        :param sprite: the sprite that has moved or resized.
+        """
+        if self._spatial_index is not None and sprite in self.spritedict:
+            if sprite.rect is None:
+                self._spatial_index.remove(sprite)
+            else:
+                self._spatial_index.insert(sprite, sprite.rect)
+
+    def set_spatial_index_bounds(self, bounds: Optional[Rect], cell_size: int = 64):
+        """
+        Turn on a spatial index of sprite rects covering an area of the screen, or change the
+        area it covers. This lets get_sprites_near_point() avoid checking every sprite.
+
+        :param bounds: the screen area to index, or None to turn the index off.
+        :param cell_size: the size of the index's grid cells in pixels.
+        """
+        if bounds is None:
+            self._spatial_index = None
+        elif self._spatial_index is None or self._spatial_index.cell_size != cell_size:
+            self._spatial_index = SpatialGrid(bounds, cell_size)
+            for sprite in self._spritelist:
+                if sprite.rect is not None:
+                    self._spatial_index.insert(sprite, sprite.rect)
+        else:
+            self._spatial_index.set_bounds(bounds)
+
+    def get_sprites_near_point(self, x: float, y: float) -> Optional[Set[GUISprite]]:
+        """
+        Use the spatial index to find the sprites whose rects might contain a point.
+
+        :param x: the horizontal screen position.
+        :param y: the vertical screen position.
+
+        :return: A set of sprites, or None if there is no spatial index covering the point.
+        """
+        if self._spatial_index is None:
+            return None
+        return self._spatial_index.query_point(x, y)
+
+    def sort_top_first(self, sprites) -> List[GUISprite]:
+        """
+        Sort some sprites from this group into the order they are drawn, reversed - so the
+        sprite on top comes first. Sprites not in this group are dropped.
+
+        :param sprites: an iterable of sprites.
+        """
+        ranks = self._get_sprite_ranks()
+        return sorted(
+            (sprite for sprite in sprites if sprite in ranks),
+            key=ranks.__getitem__,
+            reverse=True,
+        )
+
+    def _get_sprite_ranks(self) -> Dict[GUISprite, int]:
+        """
+        Get the position of each sprite in the drawing order, rebuilding them if sprites have
+        been added, removed or moved between layers since last time.
+        """
+        if self._sprite_ranks_dirty:
+            self._sprite_ranks = {
+                sprite: rank for rank, sprite in enumerate(self._spritelist)
+            }
+            self._sprite_ranks_dirty = False
+        return self._sprite_ranks
 
     def draw(self, surface: pygame.Surface):
         """draw all sprites in the right order onto the given surface"""
         surface.blits(self.visible)
+        self.lostsprites.clear()
+        self._last_dirty_surface = None
+
+    def draw_dirty(
+        self, surface: pygame.Surface, background: Optional[pygame.Surface] = None
+    ) -> List[Rect]:
+        """
+        Draw only the parts of the surface that have changed since the last call to this
+        method, in the right order.
+
+        A sprite counts as changed when its dirty flag is set, or when the screen area it
+        covers is different from the last time it was drawn. The areas a changed sprite covered
+        before and after the change are both redrawn, along with every other visible sprite
+        that overlaps those areas.
+
+        The first call, and any call with a different surface to the previous one, redraws
+        everything.
+
+        :param surface: the surface to draw on to.
+        :param background: an optional surface, the same size as the drawing surface, used to
+                           restore changed areas before the sprites are redrawn onto them.
+
+        :return: A list of the rectangles on the surface that were redrawn, suitable for
+                 passing to pygame.display.update().
+        """
+        sprite_dict = self.spritedict
+        init_rect = self._init_rect
+        visible_set = set(self._visible_sprites)
+        dirty_rects = self.lostsprites
+        self.lostsprites = []
+
+        full_redraw = surface is not self._last_dirty_surface
+        self._last_dirty_surface = surface
+
+        for sprite in self._spritelist:
+            old_rect = sprite_dict[sprite]
+            if sprite in visible_set:
+                new_rect = self._get_drawn_rect(sprite)
+                if sprite.dirty or new_rect != old_rect:
+                    if old_rect is not init_rect:
+                        dirty_rects.append(old_rect)
+                    dirty_rects.append(new_rect)
+                    sprite_dict[sprite] = new_rect
+            elif old_rect is not init_rect:
+                dirty_rects.append(old_rect)
+                sprite_dict[sprite] = init_rect
+            sprite.dirty = False
+
+        surface_rect = surface.get_rect()
+        if full_redraw:
+            if background is not None:
+                surface.blit(background, (0, 0))
+            surface.blits(self.visible)
+            return [surface_rect]
+
+        update_rects = self._merge_dirty_rects(dirty_rects, surface_rect)
+        if update_rects:
+            old_clip = surface.get_clip()
+            for update_rect in update_rects:
+                surface.set_clip(update_rect)
+                if background is not None:
+                    surface.blit(background, update_rect, update_rect)
+                surface.blits(
+                    [
+                        sprite.blit_data
+                        for sprite in self._visible_sprites
+                        if update_rect.colliderect(sprite_dict.get(sprite, init_rect))
+                    ]
+                )
+            surface.set_clip(old_clip)
+        return update_rects
+
+    @staticmethod
+    def _get_drawn_rect(sprite: GUISprite) -> Rect:
+        """
+        Work out the screen area a sprite's image covers when it is blitted.
+
+        :param sprite: the sprite to measure.
+        """
+        dest = sprite.blit_data[1]
+        area = sprite.blit_data[2]
+        size = area.size if area is not None else sprite.image.get_size()
+        return Rect(dest.topleft, size)
+
+    @staticmethod
+    def _merge_dirty_rects(dirty_rects: List[Rect], surface_rect: Rect) -> List[Rect]:
+        """
+        Clip a list of dirty rectangles to the surface and combine any that overlap, so no
+        area gets redrawn twice.
+
+        :param dirty_rects: the raw list of changed areas.
+        :param surface_rect: the rectangle of the surface we are drawing to.
+        """
+        merged: List[Rect] = []
+        for rect in dirty_rects:
+            if rect is None:
+                continue
+            clipped = rect.clip(surface_rect)
+            if clipped.width == 0 or clipped.height == 0:
+                continue
+            index = clipped.collidelist(merged)
+            while index != -1:
+                clipped.union_ip(merged.pop(index))
+                index = clipped.collidelist(merged)
+            merged.append(clipped)
+        return merged
 
     def update(self, *args, **kwargs) -> None:
         """
-        Update all the sprites in the groups.
+        Update the sprites in the group that have work to do, in the order they are drawn.
+        Sprites that are idle afterwards are skipped until schedule_update() is called on them.
 
         :param args: the arguments to the sprite's update function.
 
         :param kwargs:
         """
-        for sprite in self.sprites():
-            sprite.update(*args, **kwargs)
+        if self._sprites_to_update:
+            sprites = self.get_sprites_to_update()
+            profiler = self.profiler
+            if profiler is not None and profiler.active:
+                for sprite in sprites:
+                    sprite.update(*args, **kwargs)
+                    profiler.count_element_update(sprite)
+            else:
+                for sprite in sprites:
+                    sprite.update(*args, **kwargs)
+            for sprite in sprites:
+                if sprite.is_idle():
+                    self._sprites_to_update.discard(sprite)
         if self.should_update_visibility:
             self.should_update_visibility = False
             self.update_visibility()
 
+    def schedule_update(self, sprite: GUISprite):
+        """
+        Start calling update() on a sprite in this group again, after it has been idle.
+
+        :param sprite: the sprite with work to do.
+        """
+        if sprite in self.spritedict:
+            self._sprites_to_update.add(sprite)
+
+    def get_sprites_to_update(self) -> List[GUISprite]:
+        """
+        Get the sprites that are not idle, and so will be updated, in the order they are drawn.
+
+        :return: A list of sprites.
+        """
+        return sorted(self._sprites_to_update, key=self._get_sprite_ranks().__getitem__)
+
     def update_visibility(self):
         """
         Update the list of what is currently visible.
 
         Called when we add or remove elements from the group or when an element is hidden or shown.
         """
-        self.visible = [
-            spr.blit_data
-            for spr in self._spritelist
-            if spr.image is not None and spr.visible
+        self._visible_sprites = [
+            spr for spr in self._spritelist if spr.image is not None and spr.visible
         ]
+        self.visible = [spr.blit_data for spr in self._visible_sprites]
 
     def sprites(self) -> List[GUISprite]:
         """return an ordered list of sprites (first back, last top)."""
@@ -1,8 +1,12 @@
+import itertools
+import threading
+import time
 import warnings
 
 from abc import ABCMeta, abstractmethod
-from typing import Tuple, Any, Union, Deque
+from typing import Tuple, Any, Union, Deque, Callable, Dict, Hashable, List, Optional
 from collections import deque
+from queue import PriorityQueue, Queue, Empty
 
 import pygame
 
@@ -18,11 +22,15 @@ class IResourceLoader(metaclass=ABCMeta):
     @abstractmethod
     def add_resource(
         self, resource: Union[FontResource, ImageResource, SurfaceResource]
-    ):
+    ) -> Union[FontResource, ImageResource, SurfaceResource]:
         """
         Adds a resource to be loaded.
 
         :param resource:  Either an ImageResource, SurfaceResource or a FontResource.
+
+        :return: The resource that will be loaded, which callers should keep in place of the
+                 one passed in. Loaders that share duplicate resources may return a different
+                 one with the same ID.
         """
 
     @abstractmethod
@@ -94,7 +102,7 @@ class ThreadedLoader:
 
     def add_resource(
         self, resource: Union[FontResource, ImageResource, SurfaceResource]
-    ):
+    ) -> Union[FontResource, ImageResource, SurfaceResource]:
         """
         Adds a resource to be loaded.
 
@@ -103,6 +111,8 @@ class ThreadedLoader:
         guarantee that with threads.
 
         :param resource:  Either an ImageResource, SurfaceResource or a FontResource.
+
+        :return: The resource passed in.
         """
         if self._started:
             raise ValueError("Too late to add this resource to the loader")
@@ -110,6 +120,7 @@ class ThreadedLoader:
             self._threaded_loading_queue.put(resource)
         else:
             self._sequential_loading_queue.append(resource)
+        return resource
 
     def start(self):
         """
@@ -317,3 +328,236 @@ class BlockingThreadedResourceLoader(ThreadedLoader, IResourceLoader):
         return (
             self._threaded_loading_finished and self._sequential_loading_finished
         ), 1.0
+
+
+class StreamingResourceLoader(IResourceLoader):
+    """
+    A long-lived loader that accepts new resources at any time, before or after it has been
+    started, instead of loading everything in one go at start up.
+
+    Fonts and images are loaded by a pool of background threads in priority order, and
+    resources that are already waiting to load are not loaded twice. Finished resources are
+    handed back to the main thread in update(), which only spends a small time budget each
+    call doing so, so late loading doesn't stall the frame. A UIManager using this loader
+    calls update() every frame, and rebuilds the elements using resources when they arrive;
+    until then elements use the default font, and empty images, as placeholders.
+
+    Surfaces are made on the main thread, once the image they are cut from has arrived.
+
+    :param num_loading_threads: The number of background threads to load with.
+    """
+
+    def __init__(self, num_loading_threads: int = 2):
+        self.num_loading_threads = num_loading_threads
+        self._time_budget = 0.002
+
+        self._load_queue: PriorityQueue = PriorityQueue()
+        self._done_queue: Queue = Queue()
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._load_threads: List[threading.Thread] = []
+        self._started = False
+
+        # resources waiting to load, or loading, by key. Only touched under the lock.
+        self._pending: Dict[Hashable, Any] = {}
+        self._in_progress: Dict[Hashable, Any] = {}
+        self._waiting_surfaces: Deque[Tuple[Hashable, SurfaceResource]] = deque()
+        self._callbacks: Dict[Hashable, List[Callable[[Any], None]]] = {}
+
+        self._total_count = 0
+        self._delivered_count = 0
+        self.delivered_resources: List[
+            Union[FontResource, ImageResource, SurfaceResource]
+        ] = []
+
+    def started(self) -> bool:
+        """
+        Tells us if it's too late to add anything to the load queues - which it never is for
+        this loader, so resources are always added to it rather than loaded immediately.
+
+        :return: Always False.
+        """
+        return False
+
+    def set_update_time_budget(self, budget: float):
+        """
+        Set the most time to spend handing loaded resources to the main thread, per update.
+
+        At least one resource is handed over each update, however long it takes.
+
+        :param budget: A time budget in seconds. The default is 0.002 seconds.
+        """
+        self._time_budget = budget
+
+    def add_resource(
+        self,
+        resource: Union[FontResource, ImageResource, SurfaceResource],
+        priority: int = 0,
+        on_loaded: Optional[
+            Callable[[Union[FontResource, ImageResource, SurfaceResource]], None]
+        ] = None,
+    ) -> Union[FontResource, ImageResource, SurfaceResource]:
+        """
+        Adds a resource to be loaded. May be called at any time.
+
+        A resource with the same ID as one that is already waiting to load is not loaded
+        again; the waiting resource is loaded instead, at the higher of the two priorities.
+
+        :param resource: Either an ImageResource, SurfaceResource or a FontResource.
+        :param priority: Resources with higher priorities are loaded first.
+        :param on_loaded: An optional function to call, on the main thread, with the loaded
+                          resource once it has been handed over by update().
+
+        :return: The resource that will be loaded - either the one passed in, or the
+                 matching one that was already waiting.
+        """
+        key = self._get_resource_key(resource)
+        with self._lock:
+            waiting_resource = self._pending.get(key, self._in_progress.get(key))
+            if waiting_resource is not None:
+                if key in self._pending and isinstance(
+                    waiting_resource, (FontResource, ImageResource)
+                ):
+                    # queue it again, the load threads skip whichever entry comes second
+                    self._load_queue.put((-priority, next(self._sequence), key))
+            else:
+                waiting_resource = resource
+                self._pending[key] = resource
+                self._total_count += 1
+                if isinstance(resource, SurfaceResource):
+                    self._waiting_surfaces.append((key, resource))
+                else:
+                    self._load_queue.put((-priority, next(self._sequence), key))
+        if on_loaded is not None:
+            self._callbacks.setdefault(key, []).append(on_loaded)
+        return waiting_resource
+
+    def start(self):
+        """
+        Start the background loading threads. Resources can still be added afterwards.
+        """
+        if self._started:
+            return
+        self._started = True
+        self._load_threads = [
+            threading.Thread(target=self._load_thread_loop, daemon=True)
+            for _ in range(self.num_loading_threads)
+        ]
+        for thread in self._load_threads:
+            thread.start()
+
+    def stop(self):
+        """
+        Stop the background loading threads, abandoning anything still waiting to load. The
+        loader may be started again afterwards.
+        """
+        if not self._started:
+            return
+        for _ in self._load_threads:
+            # sorts ahead of any waiting resource, so the threads stop straight away
+            self._load_queue.put((float("-inf"), next(self._sequence), None))
+        for thread in self._load_threads:
+            thread.join()
+        self._load_threads = []
+        self._started = False
+
+    def is_loading(
+        self, resource: Union[FontResource, ImageResource, SurfaceResource]
+    ) -> bool:
+        """
+        Check if a resource, or one with the same ID, is still waiting to be loaded and
+        handed over.
+
+        :param resource: The resource to check.
+
+        :return: True if the resource has not arrived yet.
+        """
+        key = self._get_resource_key(resource)
+        with self._lock:
+            return key in self._pending or key in self._in_progress
+
+    def update(self) -> Tuple[bool, float]:
+        """
+        Hand resources that have finished loading to the main thread, calling any on_loaded
+        functions, within the update time budget. The resources handed over are kept in
+        delivered_resources until the next update.
+
+        :return: A Boolean indicating whether everything added so far has finished loading,
+                 and a float indicating the progress of the loads added since the loader was
+                 last finished (between 0.0 and 1.0).
+        """
+        self.delivered_resources = []
+        start_time = time.perf_counter()
+        while not self.delivered_resources or (
+            time.perf_counter() - start_time < self._time_budget
+        ):
+            try:
+                key, resource, error = self._done_queue.get_nowait()
+            except Empty:
+                if not self._make_waiting_surface():
+                    break
+                continue
+            self._deliver(key, resource, error)
+
+        with self._lock:
+            finished = not self._pending and not self._in_progress
+            progress = (
+                1.0
+                if finished or self._total_count == 0
+                else self._delivered_count / self._total_count
+            )
+            if finished:
+                self._total_count = 0
+                self._delivered_count = 0
+        return finished, progress
+
+    def _make_waiting_surface(self) -> bool:
+        # surfaces are cut from their images, so wait until the image has arrived
+        for _ in range(len(self._waiting_surfaces)):
+            key, surface_resource = self._waiting_surfaces.popleft()
+            image_key = self._get_resource_key(surface_resource.image_resource)
+            with self._lock:
+                image_waiting = (
+                    image_key in self._pending or image_key in self._in_progress
+                )
+            if image_waiting:
+                self._waiting_surfaces.append((key, surface_resource))
+            else:
+                with self._lock:
+                    del self._pending[key]
+                    self._in_progress[key] = surface_resource
+                self._deliver(key, surface_resource, surface_resource.load())
+                return True
+        return False
+
+    def _deliver(self, key: Hashable, resource: Any, error: Optional[Exception]):
+        with self._lock:
+            self._in_progress.pop(key, None)
+            self._delivered_count += 1
+        if error is not None:
+            warnings.warn(str(error))
+        self.delivered_resources.append(resource)
+        for callback in self._callbacks.pop(key, []):
+            callback(resource)
+
+    def _load_thread_loop(self):
+        while True:
+            _, _, key = self._load_queue.get()
+            if key is None:
+                return
+            with self._lock:
+                resource = self._pending.pop(key, None)
+                if resource is not None:
+                    self._in_progress[key] = resource
+            if resource is not None:
+                self._done_queue.put((key, resource, resource.load()))
+
+    @staticmethod
+    def _get_resource_key(
+        resource: Union[FontResource, ImageResource, SurfaceResource],
+    ) -> Hashable:
+        if isinstance(resource, FontResource):
+            return "font", resource.font_id
+        if isinstance(resource, ImageResource):
+            return "image", resource.image_id
+        return "surface", id(resource)
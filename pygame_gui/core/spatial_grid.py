@@ -0,0 +1,127 @@
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+from pygame import Rect
+
+
+class SpatialGrid:
+    """
+    A uniform grid over a fixed area of the screen that lets us quickly find which items have
+    rectangles covering a point, without checking every item.
+
+    Items are hashable objects, each stored with a rectangle. Only the part of a rectangle
+    inside the grid's bounds is indexed, so very large items (like the contents of a long
+    scrolling container) don't fill up the grid with cells nobody can point at.
+
+    :param bounds: The area of the screen covered by the grid.
+    :param cell_size: The width and height of each grid cell, in pixels.
+    """
+
+    def __init__(self, bounds: Rect, cell_size: int = 64):
+        self.bounds = Rect(bounds)
+        self.cell_size = max(1, int(cell_size))
+
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._item_rects: Dict[Hashable, Rect] = {}
+        self._item_cells: Dict[Hashable, List[Tuple[int, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._item_rects)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._item_rects
+
+    def insert(self, item: Hashable, rect: Rect):
+        """
+        Add an item to the grid, or move it if it is already in the grid.
+
+        :param item: The item to index.
+        :param rect: The screen rectangle the item covers.
+        """
+        old_rect = self._item_rects.get(item)
+        if old_rect is not None:
+            if old_rect == rect:
+                return
+            self._remove_from_cells(item)
+
+        new_rect = Rect(rect)
+        self._item_rects[item] = new_rect
+        self._add_to_cells(item, new_rect)
+
+    def remove(self, item: Hashable):
+        """
+        Remove an item from the grid. Does nothing if the item isn't in the grid.
+
+        :param item: The item to remove.
+        """
+        if item in self._item_rects:
+            self._remove_from_cells(item)
+            del self._item_rects[item]
+
+    def set_bounds(self, bounds: Rect):
+        """
+        Change the area covered by the grid, re-indexing every item.
+
+        :param bounds: The new area of the screen covered by the grid.
+        """
+        self.bounds = Rect(bounds)
+        self._cells.clear()
+        self._item_cells.clear()
+        for item, rect in self._item_rects.items():
+            self._add_to_cells(item, rect)
+
+    def query_point(self, x: float, y: float) -> Optional[Set[Hashable]]:
+        """
+        Find the items whose cells cover a point. This may include a few items that don't
+        actually contain the point, but will never miss an item that does.
+
+        :param x: The horizontal screen position.
+        :param y: The vertical screen position.
+
+        :return: A set of items, or None if the point is outside the grid's bounds and so
+                 can't be answered by the grid.
+        """
+        if not self.bounds.collidepoint(x, y):
+            return None
+        cell_key = (
+            int(x - self.bounds.left) // self.cell_size,
+            int(y - self.bounds.top) // self.cell_size,
+        )
+        return self._cells.get(cell_key, set())
+
+    def _cell_range(self, rect: Rect) -> Optional[Tuple[int, int, int, int]]:
+        clipped = rect.clip(self.bounds)
+        if clipped.width == 0 or clipped.height == 0:
+            return None
+        size = self.cell_size
+        return (
+            (clipped.left - self.bounds.left) // size,
+            (clipped.top - self.bounds.top) // size,
+            (clipped.right - 1 - self.bounds.left) // size,
+            (clipped.bottom - 1 - self.bounds.top) // size,
+        )
+
+    def _add_to_cells(self, item: Hashable, rect: Rect):
+        cell_range = self._cell_range(rect)
+        if cell_range is None:
+            self._item_cells[item] = []
+            return
+        left, top, right, bottom = cell_range
+        cells = self._cells
+        keys = []
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                key = (cell_x, cell_y)
+                cell = cells.get(key)
+                if cell is None:
+                    cell = cells[key] = set()
+                cell.add(item)
+                keys.append(key)
+        self._item_cells[item] = keys
+
+    def _remove_from_cells(self, item: Hashable):
+        cells = self._cells
+        for key in self._item_cells.pop(item, []):
+            cell = cells[key]
+            cell.discard(item)
+            if not cell:
+                del cells[key]
@@ -1,5 +1,7 @@
+import time
 import warnings
 
+from collections import OrderedDict
 from typing import List, Tuple, Optional, TypedDict, Dict
 
 import pygame
@@ -26,13 +28,190 @@ class LongTermCacheUsageData(TypedDict):
     total_uses: int
 
 
-class CacheSurfaceDate(TypedDict):
+class SurfaceCachePage:
     """
-    Cache Surface data
+    One of the long term cache's 'atlas' surfaces, that many smaller cached surfaces are packed
+    on to.
+
+    Free space is tracked as a skyline - the outline of the packed area across the page, stored
+    as a short list of horizontal segments - and new surfaces are placed as low down the page as
+    they will fit. Finding a spot only has to look at the handful of segments in the skyline,
+    rather than every free rectangle on the page.
+
+    Space freed by removing a surface can't be reused until the page is repacked (see repack())
+    or emptied, so pages keep track of how much of their packed area is wasted.
+
+    :param size: The dimensions of the page.
     """
 
-    surface: pygame.Surface
-    free_space_rectangles: List[pygame.Rect]
+    def __init__(self, size: Tuple[int, int]):
+        self.size = size
+        self.surface = pygame.surface.Surface(size, flags=pygame.SRCALPHA, depth=32)
+        self.surface.fill(pygame.Color("#00000000"))
+        # segments of the skyline as [x, y, width], ordered left to right
+        self.skyline: List[List[int]] = [[0, 0, size[0]]]
+        self.item_rects: Dict[str, pygame.Rect] = {}
+        self.used_area = 0
+
+    def get_wasted_area(self) -> int:
+        """
+        The area under the skyline that isn't taken up by a cached surface.
+
+        :return: The wasted area in pixels.
+        """
+        packed_area = sum(segment[1] * segment[2] for segment in self.skyline)
+        return packed_area - self.used_area
+
+    def find_spot(self, size: Tuple[int, int]) -> Optional[Tuple[int, int, int]]:
+        """
+        Find the lowest spot on the page a surface of a particular size will fit.
+
+        :param size: The dimensions of the surface.
+
+        :return: A tuple of the x & y position of the spot and the index of the skyline segment
+                 it starts on, or None if there isn't room.
+        """
+        width, height = size
+        best_spot = None
+        for index, (seg_x, _, _) in enumerate(self.skyline):
+            if seg_x + width > self.size[0]:
+                break
+            spot_y = self._fit_height(index, width)
+            if spot_y + height > self.size[1]:
+                continue
+            if best_spot is None or spot_y < best_spot[1]:
+                best_spot = (seg_x, spot_y, index)
+        return best_spot
+
+    def add_item(
+        self, string_id: str, surface: pygame.Surface
+    ) -> Optional[pygame.Surface]:
+        """
+        Pack a surface on to the page.
+
+        :param string_id: The ID of the surface in the cache.
+        :param surface: The surface to pack.
+
+        :return: A subsurface of the page holding the packed surface, or None if there
+                 isn't room.
+        """
+        size = surface.get_size()
+        spot = self.find_spot(size)
+        if spot is None:
+            return None
+        spot_x, spot_y, index = spot
+        item_rect = pygame.Rect((spot_x, spot_y), size)
+        self._raise_skyline(index, item_rect)
+        self.surface.blit(
+            surface, item_rect.topleft, special_flags=pygame.BLEND_PREMULTIPLIED
+        )
+        self.item_rects[string_id] = item_rect
+        self.used_area += item_rect.width * item_rect.height
+        return self.surface.subsurface(item_rect)
+
+    def remove_item(self, string_id: str):
+        """
+        Remove a surface from the page, clearing the space it took up.
+
+        :param string_id: The ID of the surface in the cache.
+        """
+        item_rect = self.item_rects.pop(string_id, None)
+        if item_rect is None:
+            return
+        self.surface.fill(pygame.Color("#00000000"), item_rect)
+        self.used_area -= item_rect.width * item_rect.height
+        if not self.item_rects:
+            self.skyline = [[0, 0, self.size[0]]]
+            self.used_area = 0
+
+    def repack(self) -> Optional[Dict[str, pygame.Surface]]:
+        """
+        Pack all the surfaces on this page again, tallest first, to reclaim any wasted space.
+
+        Surfaces are moved around on the page's own surface, so repacking never needs a second
+        page's worth of memory; only the surfaces that move are copied while they do.
+
+        :return: A dictionary of the IDs of the surfaces to their new subsurfaces, or None
+                 if they could not all be repacked, in which case the page is unchanged.
+        """
+        old_skyline = self.skyline
+        old_item_rects = self.item_rects
+        old_used_area = self.used_area
+        self.skyline = [[0, 0, self.size[0]]]
+        self.item_rects = {}
+        self.used_area = 0
+        for string_id, item_rect in sorted(
+            old_item_rects.items(),
+            key=lambda item: (item[1].height, item[1].width),
+            reverse=True,
+        ):
+            spot = self.find_spot(item_rect.size)
+            if spot is None:
+                self.skyline = old_skyline
+                self.item_rects = old_item_rects
+                self.used_area = old_used_area
+                return None
+            spot_x, spot_y, index = spot
+            new_rect = pygame.Rect((spot_x, spot_y), item_rect.size)
+            self._raise_skyline(index, new_rect)
+            self.item_rects[string_id] = new_rect
+            self.used_area += new_rect.width * new_rect.height
+
+        # the new spots don't overlap each other, or the surfaces that stay where they are
+        moved_items = [
+            (self.surface.subsurface(old_rect).copy(), self.item_rects[string_id])
+            for string_id, old_rect in old_item_rects.items()
+            if old_rect != self.item_rects[string_id]
+        ]
+        for string_id, old_rect in old_item_rects.items():
+            if old_rect != self.item_rects[string_id]:
+                self.surface.fill(pygame.Color("#00000000"), old_rect)
+        for item_surface, new_rect in moved_items:
+            self.surface.blit(
+                item_surface, new_rect.topleft, special_flags=pygame.BLEND_PREMULTIPLIED
+            )
+        return {
+            string_id: self.surface.subsurface(item_rect)
+            for string_id, item_rect in self.item_rects.items()
+        }
+
+    def _fit_height(self, index: int, width: int) -> int:
+        # the height of the skyline under a surface placed at the start of a segment
+        spot_y = 0
+        width_left = width
+        while width_left > 0:
+            _, seg_y, seg_width = self.skyline[index]
+            spot_y = max(spot_y, seg_y)
+            width_left -= seg_width
+            index += 1
+        return spot_y
+
+    def _raise_skyline(self, index: int, item_rect: pygame.Rect):
+        skyline = self.skyline
+        skyline.insert(index, [item_rect.left, item_rect.bottom, item_rect.width])
+        # trim the segments now underneath the new one
+        next_index = index + 1
+        while next_index < len(skyline):
+            segment = skyline[next_index]
+            overlap = item_rect.right - segment[0]
+            if overlap <= 0:
+                break
+            if overlap >= segment[2]:
+                del skyline[next_index]
+            else:
+                segment[0] += overlap
+                segment[2] -= overlap
+                break
+        # merge neighbouring segments at the same height
+        merge_index = max(0, index - 1)
+        while merge_index < len(skyline) - 1 and merge_index <= index + 1:
+            segment = skyline[merge_index]
+            next_segment = skyline[merge_index + 1]
+            if segment[1] == next_segment[1]:
+                segment[2] += next_segment[2]
+                del skyline[merge_index + 1]
+            else:
+                merge_index += 1
 
 
 class SurfaceCache:
@@ -40,29 +219,60 @@ class SurfaceCache:
     A cache for surfaces that we estimate the UI may want to reuse to save constantly remaking
     almost identical drawable shapes.
 
+    Surfaces are first added to a short term cache, then moved into the long term cache - packed
+    on to a few large 'page' surfaces - a few at a time each update.
+
+    When the long term cache is full, the least recently used surfaces are evicted to make room
+    for new ones. The memory used by the cache can also be capped with a byte budget, which
+    limits how many pages are created.
+
+    :param page_size: The dimensions of each long term cache page. Surfaces larger than this
+                      can't be cached.
+    :param max_pages: The most long term cache pages to create.
+    :param promotion_time_budget_ms: Roughly how long each update may spend moving surfaces from
+                                     the short term cache to the long term cache, in milliseconds.
+                                     At least one surface is always moved.
+    :param defragment_threshold: The fraction of a page that may be wasted by removed surfaces
+                                 before the page is repacked.
+    :param max_memory_bytes: The most memory the cache's surfaces may take up, in bytes. Defaults
+                             to None, for no limit beyond max_pages. Budgets are spent a page
+                             at a time, so must be 0, to turn the long term cache off, or
+                             at least the size of one page.
     """
 
-    def __init__(self):
-        self.cache_surface_size = (1024, 1024)
-        self.cache_surfaces: List[CacheSurfaceDate] = []
-        starting_surface = pygame.surface.Surface(
-            self.cache_surface_size, flags=pygame.SRCALPHA, depth=32
-        )
-        starting_surface.fill(pygame.Color("#00000000"))
-        self.cache_surfaces.append(
-            {
-                "surface": starting_surface,
-                "free_space_rectangles": [pygame.Rect((0, 0), self.cache_surface_size)],
-            }
+    def __init__(
+        self,
+        page_size: Tuple[int, int] = (1024, 1024),
+        max_pages: int = 3,
+        promotion_time_budget_ms: float = 2.0,
+        defragment_threshold: float = 0.25,
+        max_memory_bytes: Optional[int] = None,
+    ):
+        self.cache_surface_size = page_size
+        self.max_pages = max_pages
+        self.promotion_time_budget_ms = promotion_time_budget_ms
+        self.defragment_threshold = defragment_threshold
+        self._check_memory_budget(max_memory_bytes)
+        self.max_memory_bytes = max_memory_bytes
+
+        self.cache_surfaces: List[SurfaceCachePage] = []
+        if self._get_page_limit() > 0:
+            self.cache_surfaces.append(SurfaceCachePage(self.cache_surface_size))
+
+        # kept in least to most recently used order
+        self.cache_long_term_lookup: OrderedDict[str, LongTermCacheUsageData] = (
+            OrderedDict()
         )
-
-        self.cache_long_term_lookup: Dict[str, LongTermCacheUsageData] = {}
         self.cache_short_term_lookup: Dict[str, ShortTermCacheUsageData] = {}
 
         self.consider_purging_list: List[str] = []
 
         self.low_on_space = False
 
+        # running totals of look-ups, read by the UI profiler
+        self.hits = 0
+        self.misses = 0
+
     def add_surface_to_cache(self, surface: pygame.surface.Surface, string_id: str):
         """
         Adds a surface to the cache. There are two levels to the cache, the short term level
@@ -75,14 +285,22 @@ class SurfaceCache:
 
     def update(self):
         """
-        Takes care of steadily moving surfaces from the short term cache into the long term.
-        Long term caching takes a while, so we limit it to adding one surface a frame.
+        Takes care of steadily moving surfaces from the short term cache into the long term,
+        for as long as the promotion time budget allows.
 
-        We also purge some lesser used surfaces from the long term cache when we run out of space.
+        We also purge some lesser used surfaces from the long term cache when we run out of space,
+        and, when there is nothing waiting to move, repack a page that has too much wasted space.
         """
         if any(self.cache_short_term_lookup):
-            string_id, st_cached_item = self.cache_short_term_lookup.popitem()
-            self.add_surface_to_long_term_cache(st_cached_item, string_id)
+            start_time = time.perf_counter()
+            time_budget = self.promotion_time_budget_ms / 1000.0
+            while self.cache_short_term_lookup:
+                string_id, st_cached_item = self.cache_short_term_lookup.popitem()
+                self.add_surface_to_long_term_cache(st_cached_item, string_id)
+                if time.perf_counter() - start_time > time_budget:
+                    break
+        else:
+            self.defragment(max_pages=1)
 
         if self.low_on_space:
             self.low_on_space = False
@@ -92,7 +310,7 @@ class SurfaceCache:
                     lt_cached_item["current_uses"] == 0
                     and lt_cached_item["total_uses"] == 1
                 ):
-                    self._free_cached_surface(cache_id)
+                    self._free_cached_surface(cache_id, clean_purge_list=False)
 
             self.consider_purging_list.clear()
 
@@ -105,209 +323,199 @@ class SurfaceCache:
         :param cached_item: The surface to move into the long term cache.
         :param string_id: The ID of the surface in the cache.
         """
-
+        surface_size = cached_item["surface"].get_size()
         if (
-            isinstance(cached_item["surface"], pygame.Surface)
-            and cached_item["surface"].get_size() > self.cache_surface_size
+            surface_size[0] > self.cache_surface_size[0]
+            or surface_size[1] > self.cache_surface_size[1]
         ):
             warnings.warn(
                 f"Unable to cache surfaces larger than {self.cache_surface_size}"
             )
             return None
-        else:
-            found_rectangle_cache = None
-
-            while found_rectangle_cache is None and not self.low_on_space:
-                for cache_surface in self.cache_surfaces:
-                    if found_rectangle_cache is None:
-                        result = self._find_spot_in_lt_cache(
-                            cache_surface, cached_item, string_id
-                        )
-                        found_rectangle_cache = result[0]
-                        found_rectangle_to_split = result[1]
-                        self._divide_lt_cache(
-                            cache_surface,
-                            found_rectangle_cache,
-                            found_rectangle_to_split,
-                        )
-
-                if found_rectangle_cache is None:
-                    self._expand_lt_cache()
-
-            return True
-
-    def _divide_lt_cache(
-        self,
-        cache_surface: CacheSurfaceDate,
-        found_rectangle_cache: pygame.Rect | None,
-        found_rectangle_to_split: pygame.Rect | None,
-    ):
+
+        if string_id in self.cache_long_term_lookup:
+            self._evict(string_id)
+
+        found_surface = self._add_to_pages(cached_item["surface"], string_id)
+        if found_surface is None and self.defragment():
+            found_surface = self._add_to_pages(cached_item["surface"], string_id)
+        while found_surface is None and not self.low_on_space:
+            self._expand_lt_cache()
+            found_surface = self._add_to_pages(cached_item["surface"], string_id)
+        if found_surface is None:
+            found_surface = self._evict_to_fit(cached_item["surface"], string_id)
+
+        if found_surface is not None:
+            self.cache_long_term_lookup[string_id] = {
+                "surface": found_surface,
+                "current_uses": cached_item["uses"],
+                "total_uses": cached_item["uses"],
+            }
+        return True
+
+    def defragment(self, max_pages: Optional[int] = None) -> bool:
         """
-        Having reserved a spot in one of our long term cache surfaces, divide up the rest of
-        the cache surface to correctly ascertain the new set of free spaces.
+        Repack the long term cache pages with the most space wasted by removed surfaces, so
+        that space can be used again.
 
-        :param cache_surface: The long term cache surface we are dividing.
-        :param found_rectangle_cache: The newly reserved space.
-        :param found_rectangle_to_split: The old rectangle the newly reserved space is in.
+        :param max_pages: The most pages to repack. Defaults to every page over the defragment
+                          threshold.
+
+        :return: True if any pages were repacked.
         """
-        if found_rectangle_to_split is not None and found_rectangle_cache is not None:
-            free_space_rectangles = cache_surface["free_space_rectangles"]
-            self.split_rect(
-                found_rectangle_to_split,
-                found_rectangle_cache,
-                cache_surface["free_space_rectangles"],
-            )
-            rects_to_split = [
-                rect
-                for rect in free_space_rectangles
-                if rect.colliderect(found_rectangle_cache)
-            ]
-            for split_rect in rects_to_split:
-                self.split_rect(
-                    split_rect,
-                    found_rectangle_cache,
-                    cache_surface["free_space_rectangles"],
-                )
-
-            self._clean_up_lt_cache(cache_surface, free_space_rectangles)
+        page_area = self.cache_surface_size[0] * self.cache_surface_size[1]
+        fragmented_pages = sorted(
+            (
+                page
+                for page in self.cache_surfaces
+                if page.get_wasted_area() > page_area * self.defragment_threshold
+            ),
+            key=lambda page: page.get_wasted_area(),
+            reverse=True,
+        )
+        if max_pages is not None:
+            fragmented_pages = fragmented_pages[:max_pages]
+        repacked_any = False
+        for page in fragmented_pages:
+            repacked_any = self._repack_page(page) or repacked_any
+        return repacked_any
+
+    def _repack_page(self, page: SurfaceCachePage) -> bool:
+        new_subsurfaces = page.repack()
+        if new_subsurfaces is None:
+            return False
+        for string_id, subsurface in new_subsurfaces.items():
+            self.cache_long_term_lookup[string_id]["surface"] = subsurface
+        return True
+
+    def set_memory_budget(self, max_memory_bytes: Optional[int]):
+        """
+        Set the most memory the cache's surfaces may take up. If the cache is already using more,
+        the least recently used pages are emptied and released straight away.
 
-    @staticmethod
-    def _clean_up_lt_cache(
-        cache_surface: CacheSurfaceDate, free_space_rectangles: List[pygame.Rect]
-    ):
+        :param max_memory_bytes: The budget in bytes, or None for no limit beyond max_pages.
+                                 Must be 0, to turn the long term cache off, or at least the
+                                 size of one page.
         """
-        Clean up rectangles entirely inside other rectangles.
+        self._check_memory_budget(max_memory_bytes)
+        self.max_memory_bytes = max_memory_bytes
+        page_limit = self._get_page_limit()
+        while len(self.cache_surfaces) > page_limit:
+            self._release_page(self._find_least_recently_used_page())
+        if self.cache_surfaces or page_limit == 0:
+            self.low_on_space = False
 
-        :param cache_surface:
-        :param free_space_rectangles:
+    def get_memory_usage(self) -> int:
+        """
+        Get the memory currently taken up by the cache's surfaces.
 
+        :return: The memory used in bytes.
         """
-        rects_to_remove: List[pygame.Rect] = []
-        rectangles_to_check = free_space_rectangles[:]
-        for free_rectangle in free_space_rectangles:
-            rects_to_remove.extend(
-                free_rectangle
-                for check_rect in rectangles_to_check
-                if (
-                    free_rectangle != check_rect and check_rect.contains(free_rectangle)
-                )
+        page_bytes = sum(
+            page.surface.get_pitch() * page.surface.get_height()
+            for page in self.cache_surfaces
+        )
+        short_term_bytes = sum(
+            item["surface"].get_pitch() * item["surface"].get_height()
+            for item in self.cache_short_term_lookup.values()
+        )
+        return page_bytes + short_term_bytes
+
+    def _get_page_bytes(self) -> int:
+        # pages are 32 bit surfaces
+        return self.cache_surface_size[0] * self.cache_surface_size[1] * 4
+
+    def _check_memory_budget(self, max_memory_bytes: Optional[int]):
+        if max_memory_bytes is None or max_memory_bytes == 0:
+            return
+        page_bytes = self._get_page_bytes()
+        if max_memory_bytes < page_bytes:
+            raise ValueError(
+                f"Memory budget of {max_memory_bytes} bytes is smaller than one "
+                f"{self.cache_surface_size[0]}x{self.cache_surface_size[1]} cache page "
+                f"({page_bytes} bytes). Use 0 to turn the long term cache off."
             )
-        cache_surface["free_space_rectangles"] = [
-            rect for rect in free_space_rectangles if rect not in rects_to_remove
-        ]
 
-    def _find_spot_in_lt_cache(
-        self,
-        cache_surface: CacheSurfaceDate,
-        new_item: ShortTermCacheUsageData,
-        string_id: str,
-    ) -> Tuple[pygame.Rect | None, pygame.Rect | None]:
-        """
-        Find a place in a long term cache surface for our new item from the short term cache.
-
-        :param cache_surface: the surface to search.
-        :param new_item: the item to cache.
-        :param string_id: the look-up id.
-        :return: A tuple of the new rect we are reserving, and the rectangle it's inside.
-        """
-        found_rectangle_cache = None
-        found_rectangle_to_split = None
-        current_surface = cache_surface["surface"]
-        surface_size = new_item["surface"].get_size()
-        for free_rectangle in cache_surface["free_space_rectangles"]:
-            if (
-                free_rectangle.width >= surface_size[0]
-                and free_rectangle.height >= surface_size[1]
-            ):
-                # we fits, so we sits
-                found_rectangle_to_split = free_rectangle
-                found_rectangle_cache = pygame.Rect(
-                    free_rectangle.topleft, surface_size
-                )
-                current_surface.blit(
-                    new_item["surface"],
-                    free_rectangle.topleft,
-                    special_flags=pygame.BLEND_PREMULTIPLIED,
-                )
-                self.cache_long_term_lookup[string_id] = {
-                    "surface": current_surface.subsurface(found_rectangle_cache),
-                    "current_uses": new_item["uses"],
-                    "total_uses": new_item["uses"],
-                }
+    def _get_page_limit(self) -> int:
+        if self.max_memory_bytes is None:
+            return self.max_pages
+        return min(self.max_pages, self.max_memory_bytes // self._get_page_bytes())
+
+    def _find_least_recently_used_page(self) -> SurfaceCachePage:
+        # the least recently used page is the one whose most recent use is oldest
+        last_use_order = {id(page): -1 for page in self.cache_surfaces}
+        for use_order, string_id in enumerate(self.cache_long_term_lookup):
+            for page in self.cache_surfaces:
+                if string_id in page.item_rects:
+                    last_use_order[id(page)] = use_order
+                    break
+        return min(self.cache_surfaces, key=lambda page: last_use_order[id(page)])
+
+    def _release_page(self, page: SurfaceCachePage):
+        for string_id in list(page.item_rects):
+            self._evict(string_id)
+        self.cache_surfaces.remove(page)
+
+    def _evict_to_fit(
+        self, surface: pygame.Surface, string_id: str
+    ) -> Optional[pygame.Surface]:
+        """
+        Evict the least recently used surfaces from the long term cache until a new surface
+        fits.
+
+        :param surface: The surface that needs a spot.
+        :param string_id: The ID of the surface in the cache.
+
+        :return: A subsurface holding the new surface, or None if it still couldn't fit.
+        """
+        needed_area = surface.get_width() * surface.get_height()
+        while self.cache_long_term_lookup:
+            # evict roughly twice the area we need at a time, to leave a little headroom
+            evicted_area = 0
+            while self.cache_long_term_lookup and evicted_area < needed_area * 2:
+                lru_id = next(iter(self.cache_long_term_lookup))
+                lru_surface = self.cache_long_term_lookup[lru_id]["surface"]
+                evicted_area += lru_surface.get_width() * lru_surface.get_height()
+                self._evict(lru_id)
+            for page in self.cache_surfaces:
+                if page.get_wasted_area() > 0:
+                    self._repack_page(page)
+            found_surface = self._add_to_pages(surface, string_id)
+            if found_surface is not None:
+                self.low_on_space = False
+                return found_surface
+        return None
+
+    def _evict(self, string_id: str):
+        del self.cache_long_term_lookup[string_id]
+        self._remove_from_pages(string_id)
+        if string_id in self.consider_purging_list:
+            self.consider_purging_list.remove(string_id)
+
+    def _add_to_pages(
+        self, surface: pygame.Surface, string_id: str
+    ) -> Optional[pygame.Surface]:
+        for page in self.cache_surfaces:
+            found_surface = page.add_item(string_id, surface)
+            if found_surface is not None:
+                return found_surface
+        return None
+
+    def _remove_from_pages(self, string_id: str):
+        for page in self.cache_surfaces:
+            if string_id in page.item_rects:
+                page.remove_item(string_id)
                 break
-        return found_rectangle_cache, found_rectangle_to_split
 
     def _expand_lt_cache(self):
         """
         Try to expand the long term cache by adding more surfaces, until we hit the limit.
         """
-        if len(self.cache_surfaces) < 3:
-            # create a new cache surface
-            new_surface = pygame.surface.Surface(
-                self.cache_surface_size, flags=pygame.SRCALPHA, depth=32
-            )
-            new_surface.fill(pygame.Color("#00000000"))
-            self.cache_surfaces.append(
-                {
-                    "surface": new_surface,
-                    "free_space_rectangles": [
-                        pygame.Rect((0, 0), self.cache_surface_size)
-                    ],
-                }
-            )
+        if len(self.cache_surfaces) < self._get_page_limit():
+            self.cache_surfaces.append(SurfaceCachePage(self.cache_surface_size))
         else:
             self.low_on_space = True
 
-    @staticmethod
-    def split_rect(
-        found_rectangle_to_split: pygame.Rect,
-        dividing_rect: pygame.Rect,
-        free_space_rectangles: List[pygame.Rect],
-    ):
-        """
-        Takes an existing free space rectangle that we are placing a new surface inside and
-        then divides up the remaining space into new, smaller free space rectangles.
-
-        :param found_rectangle_to_split: The rectangle we are splitting.
-        :param dividing_rect: The rectangle dividing up the split rectangle.
-        :param free_space_rectangles: A list of all free space rectangles for a particular surface.
-        """
-        free_space_rectangles.remove(found_rectangle_to_split)
-
-        # create new rectangles
-        if (found_rectangle_to_split.right - dividing_rect.right) > 0:
-            rect_1 = pygame.Rect(
-                dividing_rect.right,
-                found_rectangle_to_split.top,
-                found_rectangle_to_split.right - dividing_rect.right,
-                found_rectangle_to_split.height,
-            )
-            free_space_rectangles.append(rect_1)
-        if (found_rectangle_to_split.bottom - dividing_rect.bottom) > 0:
-            rect_2 = pygame.Rect(
-                found_rectangle_to_split.left,
-                dividing_rect.bottom,
-                found_rectangle_to_split.width,
-                found_rectangle_to_split.bottom - dividing_rect.bottom,
-            )
-            free_space_rectangles.append(rect_2)
-        if (dividing_rect.top - found_rectangle_to_split.top) > 0:
-            rect_3 = pygame.Rect(
-                found_rectangle_to_split.left,
-                found_rectangle_to_split.top,
-                found_rectangle_to_split.width,
-                dividing_rect.top - found_rectangle_to_split.top,
-            )
-            free_space_rectangles.append(rect_3)
-        if (dividing_rect.left - found_rectangle_to_split.left) > 0:
-            rect_4 = pygame.Rect(
-                found_rectangle_to_split.left,
-                found_rectangle_to_split.top,
-                dividing_rect.left - found_rectangle_to_split.left,
-                found_rectangle_to_split.height,
-            )
-            free_space_rectangles.append(rect_4)
-
     def find_surface_in_cache(self, lookup_id: str) -> pygame.surface.Surface | None:
         """
         Looks for a surface in the cache by an ID and returns it if found.
@@ -321,13 +529,17 @@ class SurfaceCache:
         if lookup_id in self.cache_short_term_lookup:
             cached_item = self.cache_short_term_lookup[lookup_id]
             cached_item["uses"] += 1
+            self.hits += 1
             return cached_item["surface"]
         # check long term
         if lookup_id in self.cache_long_term_lookup:
+            self.cache_long_term_lookup.move_to_end(lookup_id)
             self.cache_long_term_lookup[lookup_id]["current_uses"] += 1
             self.cache_long_term_lookup[lookup_id]["total_uses"] += 1
+            self.hits += 1
             return self.cache_long_term_lookup[lookup_id]["surface"]
         else:
+            self.misses += 1
             return None
 
     def remove_user_from_cache_item(self, string_id: str):
@@ -357,11 +569,13 @@ class SurfaceCache:
         self.remove_user_from_cache_item(string_id)
         self._free_cached_surface(string_id)
 
-    def _free_cached_surface(self, string_id: str):
+    def _free_cached_surface(self, string_id: str, clean_purge_list: bool = True):
         """
         Directly remove an unused surface from the long term cache.
 
         :param string_id: the ID of the cached surface to remove from the cache.
+        :param clean_purge_list: whether to also take the ID off the list of surfaces to
+                                 consider purging.
 
         """
         if (
@@ -370,19 +584,10 @@ class SurfaceCache:
         ):
             return
         # check item to be removed is unused
-        cache_to_clear = self.cache_long_term_lookup.pop(string_id)
-        cache_surface_to_clear = cache_to_clear["surface"]
-
-        for cache_surface in self.cache_surfaces:
-            if cache_surface["surface"] == cache_surface_to_clear.get_parent():
-                freed_space = pygame.Rect(
-                    cache_surface_to_clear.get_offset(),
-                    cache_surface_to_clear.get_size(),
-                )
-                cache_surface["free_space_rectangles"].append(freed_space)
-                break
+        del self.cache_long_term_lookup[string_id]
+        self._remove_from_pages(string_id)
 
-        if string_id in self.consider_purging_list:
+        if clean_purge_list and string_id in self.consider_purging_list:
             self.consider_purging_list.remove(string_id)
 
     @staticmethod
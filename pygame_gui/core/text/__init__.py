@@ -4,6 +4,8 @@ from pygame_gui.core.text.horiz_rule_layout_rect import HorizRuleLayoutRect
 from pygame_gui.core.text.simple_test_layout_rect import SimpleTestLayoutRect
 from pygame_gui.core.text.image_layout_rect import ImageLayoutRect
 from pygame_gui.core.text.hyperlink_text_chunk import HyperlinkTextChunk
+from pygame_gui.core.text.text_render_cache import TextRenderCache
+from pygame_gui.core.text.text_render_cache import get_text_render_cache
 from pygame_gui.core.text.text_line_chunk import TextLineChunkFTFont
 from pygame_gui.core.text.text_box_layout import TextBoxLayout
 from pygame_gui.core.text.text_box_layout_row import TextBoxLayoutRow
@@ -26,6 +28,8 @@ __all__ = [
     "SimpleTestLayoutRect",
     "HyperlinkTextChunk",
     "TextLineChunkFTFont",
+    "TextRenderCache",
+    "get_text_render_cache",
     "ImageLayoutRect",
     "HTMLParser",
     "TextBoxLayout",
@@ -1,6 +1,6 @@
-from typing import Deque, List, Optional, Dict, Any, Tuple
+from typing import Deque, Iterable, List, Optional, Dict, Any, Tuple
 from collections import deque
-from bisect import bisect_left
+from bisect import bisect_left, bisect_right
 
 import warnings
 import pygame
@@ -79,6 +79,11 @@ class TextBoxLayout:
         self.dynamic_height = self.view_rect.height == -1
 
         self.finalised_surface: Optional[pygame.Surface] = None
+        # when tile_height is set, the layout is finalised a tile at a time - only as needed to
+        # show the current view - instead of to one surface as tall as the whole layout.
+        self.tile_height: Optional[int] = None
+        self.tile_overscan = 1
+        self.finalised_tiles: Optional[Dict[int, pygame.Surface]] = None
         self.floating_rects: List[TextLayoutRect] = []
         self.layout_rows: List[TextBoxLayoutRow] = []
         self.row_lengths: List[int] = []
@@ -138,14 +143,18 @@ class TextBoxLayout:
         )
 
     def _update_plain_text(self):
-        plain_text = ""
-        for row in self.layout_rows:
+        self.plain_text = self._get_rows_plain_text(self.layout_rows)
+
+    @staticmethod
+    def _get_rows_plain_text(rows: Iterable[TextBoxLayoutRow]) -> str:
+        text_pieces = []
+        for row in rows:
             for item in row.items:
                 if isinstance(item, (TextLineChunkFTFont, HyperlinkTextChunk)):
-                    plain_text += item.text
+                    text_pieces.append(item.text)
                 if isinstance(item, LineBreakLayoutRect):
-                    plain_text += "\n"
-        self.plain_text = plain_text
+                    text_pieces.append("\n")
+        return "".join(text_pieces)
 
     def _reprocess_layout_rows(self, from_index, row_to_process_from):
         if len(self.layout_rows) <= 1:
@@ -161,6 +170,106 @@ class TextBoxLayout:
         self._merge_adjacent_compatible_chunks(temp_layout_queue)
         self._process_layout_queue(temp_layout_queue, row_to_process_from)
 
+    def _reflow_edited_rows(
+        self, from_index: int, row_to_process_from: TextBoxLayoutRow, edited_index: int
+    ) -> Tuple[int, int]:
+        """
+        Lay out the rows affected by an edit again, stopping at the end of the edited paragraph.
+
+        A row starting after a line break is laid out the same way whatever happens before it,
+        so once the reflowed rows reach the line break that ended the edited paragraph the rows
+        after it keep their items and break positions and are only moved up or down to follow
+        the reflowed rows. Layouts with floating rects are laid out to the end, as floaters can
+        change the rows beside them.
+
+        :param from_index: The index of the first row to lay out again.
+        :param row_to_process_from: The row at that index.
+        :param edited_index: The index of the row that was edited.
+
+        :return: The index of the first row after the reflowed rows, and how far those
+                 following rows were moved down.
+        """
+        following_index = len(self.layout_rows)
+        if not self.floating_rects:
+            for row in self.layout_rows[edited_index:-1]:
+                if row.last_chunk_is_line_break():
+                    following_index = row.row_index + 1
+                    break
+        if following_index >= len(self.layout_rows):
+            self._reprocess_layout_rows(from_index, row_to_process_from)
+            return len(self.layout_rows), 0
+
+        following_rows = self.layout_rows[following_index:]
+        old_following_y = following_rows[0].y
+        # letter counts match the plain text, so the text before and after the reflowed rows
+        # can be kept from before the edit
+        reflowed_text_start = self.row_lengths[from_index - 1] if from_index > 0 else 0
+        following_text_length = (
+            self.letter_count - self.row_lengths[following_index - 1]
+        )
+        following_text = self.plain_text[len(self.plain_text) - following_text_length :]
+        temp_layout_queue: Deque[TextLayoutRect] = deque([])
+        for row in reversed(self.layout_rows[from_index:following_index]):
+            row.rewind_row(temp_layout_queue)
+        self.layout_rows = self.layout_rows[:from_index]
+        self._merge_adjacent_compatible_chunks(temp_layout_queue)
+        self._process_layout_queue(
+            temp_layout_queue, row_to_process_from, following_rows
+        )
+        following_index = following_rows[0].row_index
+        self.plain_text = (
+            self.plain_text[:reflowed_text_start]
+            + self._get_rows_plain_text(self.layout_rows[from_index:following_index])
+            + following_text
+        )
+        return following_index, following_rows[0].y - old_following_y
+
+    def _finalise_reflowed_rows(
+        self, from_index: int, following_index: int, y_shift: int
+    ):
+        """
+        Redraw the rows laid out again by an edit on to the finalised surface. Rows after them
+        are not redrawn; their pixels are just moved if the rows were.
+
+        :param from_index: The index of the first reflowed row.
+        :param following_index: The index of the first row after the reflowed rows.
+        :param y_shift: How far the rows after the reflowed rows were moved down.
+        """
+        if self.finalised_surface is None:
+            if y_shift != 0:
+                self._invalidate_tiles_from_row(from_index)
+            else:
+                self._invalidate_tiles_for_rows(
+                    self.layout_rows[from_index:following_index]
+                )
+            return
+        surface = self.finalised_surface
+        if self.layout_rect.height > surface.get_height():
+            self.finalise_to_new()
+            return
+        if y_shift != 0 and following_index < len(self.layout_rows):
+            old_top = self.layout_rows[following_index].y - y_shift
+            surf_width, surf_height = surface.get_size()
+            # scroll honours the clip, so it has to cover where the rows move to as well as
+            # where they were
+            scroll_top = min(old_top, old_top + y_shift)
+            previous_clip = surface.get_clip()
+            surface.set_clip(
+                pygame.Rect(0, scroll_top, surf_width, surf_height - scroll_top)
+            )
+            surface.scroll(0, y_shift)
+            surface.set_clip(previous_clip)
+            if y_shift > 0:
+                uncovered_area = pygame.Rect(0, old_top, surf_width, y_shift)
+            else:
+                uncovered_area = pygame.Rect(
+                    0, surf_height + y_shift, surf_width, -y_shift
+                )
+            surface.fill(pygame.Color("#00000000"), uncovered_area)
+        for row in self.layout_rows[from_index:following_index]:
+            self.align_row(row)
+            row.finalise(self.finalised_surface)
+
     def reprocess_layout_queue(self, layout_rect):
         """
         Re-lays out already parsed text data. Useful to call if the layout requirements have
@@ -184,7 +293,12 @@ class TextBoxLayout:
         )
         self._process_layout_queue(self.layout_rect_queue, current_row)
 
-    def _process_layout_queue(self, input_queue, current_row):
+    def _process_layout_queue(
+        self,
+        input_queue,
+        current_row,
+        following_rows: Optional[List[TextBoxLayoutRow]] = None,
+    ):
         while input_queue:
             text_layout_rect = input_queue.popleft()
             text_layout_rect.topleft = tuple(current_row.topright)
@@ -216,14 +330,31 @@ class TextBoxLayout:
                 current_row = self._handle_regular_rect(
                     current_row, text_layout_rect, input_queue
                 )
-        # make sure we add the last row to the layout
-        self._add_row_to_layout(current_row, last_row=True)
+        if following_rows:
+            # the queue ended with a line break, so the rows that followed it carry on from
+            # the empty row it started
+            y_shift = current_row.y - following_rows[0].y
+            for row in following_rows:
+                row.row_index = len(self.layout_rows)
+                if y_shift != 0:
+                    self._shift_row_vertically(row, y_shift)
+                self.layout_rows.append(row)
+            self.layout_rect.height = max(
+                self.layout_rect.height,
+                self.layout_rows[-1].bottom - self.layout_rect.y,
+            )
+            self._refresh_row_letter_counts()
+        else:
+            # make sure we add the last row to the layout
+            self._add_row_to_layout(current_row, last_row=True)
         if self.dynamic_width:
             self.view_rect.width = self.layout_rect.width
         if self.dynamic_height:
             self.view_rect.height = self.layout_rect.height
 
-        self._update_plain_text()
+        if not following_rows:
+            # otherwise the caller knows which part of the plain text has changed
+            self._update_plain_text()
 
     def _add_row_to_layout(self, current_row: TextBoxLayoutRow, last_row=False):
         # handle an empty row being added to layout
@@ -528,10 +659,19 @@ class TextBoxLayout:
         if self.finalised_surface is not None:
             basic_blit(surface, self.finalised_surface, (0, 0))
 
-    def finalise_to_new(self):
+    def finalise_to_new(self) -> Optional[Surface]:
         """
         Finalises our layout to a brand-new surface that this method creates.
+
+        When the layout is finalised in tiles, this throws away any already finalised tiles
+        instead; new tiles are finalised when they are next blitted.
+
+        :return: The new surface, or None when finalising in tiles.
         """
+        if self.tile_height is not None:
+            self.finalised_surface = None
+            self.finalised_tiles = {}
+            return None
         self.finalised_surface = pygame.surface.Surface(
             (self.layout_rect.width + self.edit_buffer, self.layout_rect.height),
             depth=32,
@@ -542,6 +682,199 @@ class TextBoxLayout:
 
         return self.finalised_surface
 
+    def set_tile_height(self, tile_height: Optional[int]):
+        """
+        Switch finalising this layout in horizontal tiles on or off.
+
+        In tile mode, only the tiles of the layout that are blitted with
+        blit_finalised_view_to_surf() are finalised, and only those near the last view blitted
+        are kept, so the memory used stays the same however long the text gets. Text
+        effects and text editing need the whole layout finalised to one surface, so tiles are
+        best kept to text that is only displayed and scrolled - long logs and documents.
+
+        :param tile_height: The height of each tile in pixels, or None to finalise the whole
+                            layout to one surface.
+        """
+        was_finalised = self.is_finalised()
+        self.tile_height = None if tile_height is None else max(1, int(tile_height))
+        self.finalised_surface = None
+        self.finalised_tiles = None
+        if was_finalised:
+            self.finalise_to_new()
+
+    def is_finalised(self) -> bool:
+        """
+        Check if this layout has been finalised, either to a single surface or in tiles.
+
+        :return: True if the layout has been finalised.
+        """
+        return self.finalised_surface is not None or self.finalised_tiles is not None
+
+    def blit_finalised_view_to_surf(
+        self,
+        surface: Surface,
+        dest: Tuple[int, int],
+        area: pygame.Rect,
+        drop_distant_tiles: bool = True,
+    ):
+        """
+        Blit an area of the finalised layout to a surface. When finalising in tiles, any tiles
+        covering the area that aren't finalised yet are finalised first, and tiles far from
+        the area are thrown away.
+
+        :param surface: The surface to blit on to.
+        :param dest: The position on the surface to blit to.
+        :param area: The area of the layout to blit.
+        :param drop_distant_tiles: Set to False when blitting a small part of the view, so
+                                   tiles elsewhere in the view are kept.
+        """
+        if self.finalised_surface is not None:
+            basic_blit(surface, self.finalised_surface, dest, area)
+            return
+        if self.finalised_tiles is None or self.tile_height is None:
+            return
+        first_tile = max(0, area.top // self.tile_height)
+        last_tile = max(first_tile, (area.bottom - 1) // self.tile_height)
+        for tile_index in range(first_tile, last_tile + 1):
+            tile = self.finalised_tiles.get(tile_index)
+            if tile is None:
+                tile = self.finalised_tiles[tile_index] = self._finalise_tile(
+                    tile_index
+                )
+            tile_top = tile_index * self.tile_height
+            tile_area = pygame.Rect(
+                area.left, tile_top, area.width, self.tile_height
+            ).clip(area)
+            basic_blit(
+                surface,
+                tile,
+                (dest[0], dest[1] + tile_area.top - area.top),
+                tile_area.move(0, -tile_top),
+            )
+        if not drop_distant_tiles:
+            return
+        for tile_index in list(self.finalised_tiles):
+            if (
+                tile_index < first_tile - self.tile_overscan
+                or tile_index > last_tile + self.tile_overscan
+            ):
+                del self.finalised_tiles[tile_index]
+
+    def _finalise_tile(self, tile_index: int) -> Surface:
+        tile_height = self.tile_height if self.tile_height is not None else 0
+        tile_top = tile_index * tile_height
+        tile = pygame.surface.Surface(
+            (self.layout_rect.width + self.edit_buffer, tile_height),
+            depth=32,
+            flags=pygame.SRCALPHA,
+        )
+        tile.fill("#00000000")
+
+        # rows are in order, so we can find the ones on this tile without checking them all.
+        # one row either side is included in case shadows or tall glyphs overhang their rows
+        first_row = max(
+            0,
+            bisect_right(self.layout_rows, tile_top, key=lambda row: row.bottom) - 1,
+        )
+        last_row = min(
+            len(self.layout_rows),
+            bisect_left(
+                self.layout_rows, tile_top + tile_height, key=lambda row: row.top
+            )
+            + 1,
+        )
+        tile_rows = self.layout_rows[first_row:last_row]
+        cumulative_letter_count = sum(
+            row.letter_count for row in self.layout_rows[:first_row]
+        )
+        for row in tile_rows:
+            # rows are laid out on the whole layout, so move them on to the tile to finalise
+            self._shift_row_vertically(row, -tile_top)
+            if self.current_end_pos != self.letter_count:
+                cumulative_letter_count = row.finalise(
+                    tile, self.current_end_pos, cumulative_letter_count
+                )
+            else:
+                row.finalise(tile)
+            self._shift_row_vertically(row, tile_top)
+            # the tile is short-lived, so don't let the row or its chunks redraw themselves
+            # on to it later - changes are picked up by finalising tiles again instead.
+            row.target_surface = None
+            for item in row.items:
+                if isinstance(item, TextLineChunkFTFont):
+                    item.target_surface = None
+
+        for floating_rect in self.floating_rects:
+            if floating_rect.bottom > tile_top and floating_rect.top < (
+                tile_top + tile_height
+            ):
+                floating_rect.y -= tile_top
+                floating_rect.finalise(tile, self.view_rect, 0, 0, 0, 0)
+                floating_rect.y += tile_top
+        return tile
+
+    def invalidate_finalised_area(self, area: pygame.Rect):
+        """
+        Throw away any finalised tiles covering an area of the layout, so they are finalised
+        again the next time they are blitted. Does nothing when not finalising in tiles, as
+        rows and chunks redraw themselves on to the single finalised surface.
+
+        :param area: The area of the layout that has changed.
+        """
+        if self.finalised_tiles is None or self.tile_height is None:
+            return
+        # tiles are finalised with a row of overhang either side, so clear neighbours too
+        top = area.top // self.tile_height - 1
+        bottom = area.bottom // self.tile_height + 1
+        for tile_index in list(self.finalised_tiles):
+            if top <= tile_index <= bottom:
+                del self.finalised_tiles[tile_index]
+
+    def get_link_chunks_near_y(self, y_pos: int) -> List[HyperlinkTextChunk]:
+        """
+        Find the hyperlink chunks in the row at a vertical position in the layout, and in the
+        rows either side of it, without checking every link in the layout.
+
+        :param y_pos: The vertical position in the layout.
+
+        :return: A list of hyperlink chunks.
+        """
+        row_index = bisect_right(self.layout_rows, y_pos, key=lambda row: row.bottom)
+        return [
+            item
+            for row in self.layout_rows[max(0, row_index - 1) : row_index + 2]
+            for item in row.items
+            if isinstance(item, HyperlinkTextChunk)
+        ]
+
+    def _invalidate_tiles_for_rows(self, rows: Iterable[TextBoxLayoutRow]):
+        rows = list(rows)
+        if rows:
+            top = min(row.top for row in rows)
+            bottom = max(row.bottom for row in rows)
+            self.invalidate_finalised_area(pygame.Rect(0, top, 0, bottom - top))
+
+    def _invalidate_tiles_from_row(self, row_index: int):
+        # an edit that moved the rows after it leaves every tile from there down out of date
+        if self.finalised_tiles is None or self.tile_height is None:
+            return
+        if row_index < len(self.layout_rows):
+            top = self.layout_rows[row_index].top
+        else:
+            top = self.layout_rect.height
+        # tiles are finalised with a row of overhang either side, so clear the one above too
+        first_tile = top // self.tile_height - 1
+        for tile_index in list(self.finalised_tiles):
+            if tile_index >= first_tile:
+                del self.finalised_tiles[tile_index]
+
+    @staticmethod
+    def _shift_row_vertically(row: TextBoxLayoutRow, y_shift: int):
+        row.y += y_shift
+        row.cursor_rect.y += y_shift
+        for item in row.items:
+            item.y += y_shift
+
     def update_text_with_new_text_end_pos(self, new_end_pos: int):
         """
         Sets a new end position for the text in this block and redraws it,
@@ -1091,6 +1424,8 @@ class TextBoxLayout:
                 floating_rect.finalise(
                     self.finalised_surface, self.view_rect, 0, 0, 0, 0
                 )
+        else:
+            self._invalidate_tiles_for_rows(rows_to_finalise)
 
     def _set_selection_colours(self, chunk, is_selected):
         chunk.selection_colour = self.selection_colour
@@ -1137,7 +1472,7 @@ class TextBoxLayout:
                         found_chunk = chunk
                         break
         if found_chunk is not None and isinstance(found_chunk, TextLineChunkFTFont):
-            x_pos_in_chunk = found_chunk.font.size(found_chunk.text[:letter_index])[0]
+            x_pos_in_chunk = found_chunk.get_prefix_width(letter_index)
         return found_chunk, x_pos_in_chunk, letter_index, row_index
 
     def _find_and_split_chunk(self, index: int, return_rhs: bool = False):
@@ -1250,18 +1585,12 @@ class TextBoxLayout:
             row_to_process_from = self.layout_rows[current_row.row_index - 1]
             row_to_process_from_index = row_to_process_from.row_index
 
-        temp_layout_queue: Deque[TextLayoutRect] = deque([])
-        for row in reversed(self.layout_rows[row_to_process_from_index:]):
-            row.rewind_row(temp_layout_queue)
-
-        self.layout_rows = self.layout_rows[:row_to_process_from_index]
-        self._merge_adjacent_compatible_chunks(temp_layout_queue)
-        self._process_layout_queue(temp_layout_queue, row_to_process_from)
-
-        if self.finalised_surface is not None:
-            for row in self.layout_rows[row_to_process_from_index:]:
-                self.align_row(row)
-                row.finalise(self.finalised_surface)
+        following_index, y_shift = self._reflow_edited_rows(
+            row_to_process_from_index, row_to_process_from, current_row.row_index
+        )
+        self._finalise_reflowed_rows(
+            row_to_process_from_index, following_index, y_shift
+        )
 
     def insert_line_break(self, layout_index: int, parser: Optional[HTMLParser]):
         """
@@ -1300,6 +1629,8 @@ class TextBoxLayout:
         if self.finalised_surface is not None:
             for row in self.layout_rows[arg1.row_index :]:
                 row.finalise(self.finalised_surface)
+        else:
+            self._invalidate_tiles_from_row(arg1.row_index)
 
     def _insert_line_break_into_row_by_index(self, row_index, found_chunk, parser):
         current_row = self.layout_rows[row_index]
@@ -1436,6 +1767,8 @@ class TextBoxLayout:
                 row.clear_and_recalculate_width()
                 self.align_row(row)
                 row.finalise(self.finalised_surface)
+        else:
+            self._invalidate_tiles_from_row(row_to_process_from_index)
 
         self.selected_rows = []
         self.selected_chunks = []
@@ -1506,12 +1839,12 @@ class TextBoxLayout:
             row_to_process_from = self.layout_rows[current_row.row_index - 1]
             row_to_process_from_index = row_to_process_from.row_index
 
-        self._reprocess_layout_rows(row_to_process_from_index, row_to_process_from)
-
-        if self.finalised_surface is not None:
-            for row in self.layout_rows[row_to_process_from_index:]:
-                self.align_row(row)
-                row.finalise(self.finalised_surface)
+        following_index, y_shift = self._reflow_edited_rows(
+            row_to_process_from_index, row_to_process_from, current_row.row_index
+        )
+        self._finalise_reflowed_rows(
+            row_to_process_from_index, following_index, y_shift
+        )
 
     def backspace_at_cursor(self):
         """
@@ -1556,12 +1889,12 @@ class TextBoxLayout:
             row_to_process_from = self.layout_rows[current_row.row_index - 1]
             row_to_process_from_index = row_to_process_from.row_index
 
-        self._reprocess_layout_rows(row_to_process_from_index, row_to_process_from)
-
-        if self.finalised_surface is not None:
-            for row in self.layout_rows[row_to_process_from_index:]:
-                self.align_row(row)
-                row.finalise(self.finalised_surface)
+        following_index, y_shift = self._reflow_edited_rows(
+            row_to_process_from_index, row_to_process_from, current_row.row_index
+        )
+        self._finalise_reflowed_rows(
+            row_to_process_from_index, following_index, y_shift
+        )
 
     def _find_row_from_text_box_index(self, text_box_index: int):
         if len(self.layout_rows) != 0:
@@ -1607,6 +1940,66 @@ class TextBoxLayout:
             else:
                 for row in self.layout_rows[last_row.row_index :]:
                     row.finalise(self.finalised_surface)
+        elif self.finalised_tiles is not None:
+            self._invalidate_tiles_for_rows(self.layout_rows[last_row.row_index :])
+
+    def remove_rows_from_start(self, row_count: int):
+        """
+        Remove some rows from the top of the layout, moving the remaining rows up to fill the
+        gap. The remaining rows are not laid out again, so this is much quicker than rebuilding
+        the whole layout - useful for logs that drop their oldest lines.
+
+        :param row_count: The number of rows to remove. The last row is always kept.
+        """
+        row_count = min(row_count, len(self.layout_rows) - 1)
+        if row_count <= 0:
+            return
+        removed_rows = self.layout_rows[:row_count]
+        self.layout_rows = self.layout_rows[row_count:]
+        y_shift = self.layout_rows[0].y - self.layout_rect.y
+
+        removed_item_ids = {id(item) for row in removed_rows for item in row.items}
+        self.link_chunks = [
+            chunk for chunk in self.link_chunks if id(chunk) not in removed_item_ids
+        ]
+        if any(row is self.cursor_text_row for row in removed_rows):
+            self.cursor_text_row = None
+        self.selected_chunks = [
+            chunk for chunk in self.selected_chunks if id(chunk) not in removed_item_ids
+        ]
+        self.selected_rows = [
+            row
+            for row in self.selected_rows
+            if not any(row is removed_row for removed_row in removed_rows)
+        ]
+
+        for row_index, row in enumerate(self.layout_rows):
+            row.row_index = row_index
+            self._shift_row_vertically(row, -y_shift)
+        for floating_rect in self.floating_rects:
+            floating_rect.y -= y_shift
+        self.floating_rects = [
+            floating_rect
+            for floating_rect in self.floating_rects
+            if floating_rect.bottom > self.layout_rect.y
+        ]
+
+        content_bottom = max(
+            [self.layout_rows[-1].bottom]
+            + [floating_rect.bottom for floating_rect in self.floating_rects]
+        )
+        if self.dynamic_height:
+            self.layout_rect.height = content_bottom - self.layout_rect.y
+            self.view_rect.height = self.layout_rect.height
+        else:
+            self.layout_rect.height = max(
+                self.view_rect.height, content_bottom - self.layout_rect.y
+            )
+
+        self._refresh_row_letter_counts()
+        self._update_plain_text()
+        if self.is_finalised():
+            self.finalise_to_new()
 
     def redraw_other_chunks(self, not_these_chunks):
         """
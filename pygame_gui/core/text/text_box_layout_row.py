@@ -556,11 +556,11 @@ class TextBoxLayoutRow(pygame.Rect):
                     found_chunk = True
                 elif chunk.collidepoint((scrolled_click_pos[0], chunk.centery)):
                     letter_index = chunk.x_pos_to_letter_index(scrolled_click_pos[0])
-                    cursor_draw_width += chunk.font.size(chunk.text[:letter_index])[0]
+                    cursor_draw_width += chunk.get_prefix_width(letter_index)
                     letter_acc += letter_index
                     found_chunk = True
                 else:
-                    cursor_draw_width += chunk.font.size(chunk.text)[0]
+                    cursor_draw_width += chunk.get_prefix_width(len(chunk.text))
                     letter_acc += chunk.letter_count
         if (
             (not found_chunk and scrolled_click_pos[0] >= self.right)
@@ -602,13 +602,11 @@ class TextBoxLayoutRow(pygame.Rect):
             if isinstance(chunk, TextLineChunkFTFont):
                 if cursor_pos <= letter_acc + chunk.letter_count:
                     chunk_letter_pos = cursor_pos - letter_acc
-                    cursor_draw_width += chunk.font.size(chunk.text[:chunk_letter_pos])[
-                        0
-                    ]
+                    cursor_draw_width += chunk.get_prefix_width(chunk_letter_pos)
                     break
 
                 letter_acc += chunk.letter_count
-                cursor_draw_width += chunk.font.size(chunk.text)[0]
+                cursor_draw_width += chunk.get_prefix_width(len(chunk.text))
         self.cursor_draw_width = cursor_draw_width
 
         self._setup_offset_position_from_edit_cursor()
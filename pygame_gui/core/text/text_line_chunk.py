@@ -12,7 +12,8 @@ chunk onto it's final destination.
 
 """
 
-from typing import Optional, Union, Tuple, List
+from os.path import commonprefix
+from typing import Dict, Optional, Union, Tuple, List
 
 import pygame
 from pygame import Color, Surface, Rect, BLEND_PREMULTIPLIED, BLEND_RGBA_MULT, SRCALPHA
@@ -21,6 +22,7 @@ from pygame.transform import rotozoom, rotate
 from pygame_gui.core.interfaces.gui_font_interface import IGUIFontInterface
 from pygame_gui.core.text.text_layout_rect import TextLayoutRect
 from pygame_gui.core.colour_gradient import ColourGradient
+from pygame_gui.core.text.text_render_cache import get_text_render_cache
 
 
 class TextLineChunkFTFont(TextLayoutRect):
@@ -71,6 +73,12 @@ class TextLineChunkFTFont(TextLayoutRect):
         ]
         self.letter_count = len(self.text)
 
+        # rendered widths of the text up to a letter index, measured as they are needed and
+        # kept while the start of the text stays the same - see get_prefix_width()
+        self._prefix_widths: Dict[int, int] = {}
+        self._prefix_widths_text = self.text
+        self._prefix_widths_font = self.font
+
         self.target_surface: Optional[Surface] = None
         self.target_surface_area: Optional[Rect] = None
         self.row_chunk_origin = 0
@@ -318,18 +326,34 @@ class TextLineChunkFTFont(TextLayoutRect):
         chunk_x_origin,
         row_chunk_origin,
     ) -> pygame.Surface:
-        text_surface: pygame.Surface = self.font.render_premul_to(
-            final_str_text,
-            Color("#FFFFFFFF"),
-            surf_size=(chunk_draw_width, chunk_draw_height),
-            surf_position=(chunk_x_origin, row_chunk_origin + text_shadow_width),
-        )
-
-        if (
+        has_selection = (
             self.selection_rect is not None
             and (self.selection_rect.width != 0 or self.selection_rect.height != 0)
             and (self.selection_text_colour != self.colour)
-        ):
+        )
+        surf_size = (chunk_draw_width, chunk_draw_height)
+        surf_position = (chunk_x_origin, row_chunk_origin + text_shadow_width)
+        if not has_selection and isinstance(self.colour, Color):
+            # the common case - plain coloured text - is cached already coloured in and is
+            # only ever blitted from, so can be shared without copying
+            return get_text_render_cache().render_premul_to(
+                self.font,
+                final_str_text,
+                Color("#FFFFFFFF"),
+                surf_size,
+                surf_position,
+                multiply_colour=self.colour,
+            )
+
+        text_surface: pygame.Surface = (
+            get_text_render_cache()
+            .render_premul_to(
+                self.font, final_str_text, Color("#FFFFFFFF"), surf_size, surf_position
+            )
+            .copy()
+        )
+
+        if has_selection:
             # we have a selection rect, we may have up to two rects of normal background either side of this
             before_rect = pygame.Rect(
                 0, 0, self.selection_rect.left, self.selection_rect.height
@@ -427,7 +451,8 @@ class TextLineChunkFTFont(TextLayoutRect):
             shadow_colour = self.shadow_colour
             # we have a shadow
 
-            shadow_surface = self.font.render_premul_to(
+            shadow_surface = get_text_render_cache().render_premul_to(
+                self.font,
                 text_str,
                 shadow_colour,
                 surf_size=text_surface.get_size(),
@@ -500,7 +525,8 @@ class TextLineChunkFTFont(TextLayoutRect):
         :param allow_split_dashes: whether we allow text to be split with dashes either side.
                                    allowing this makes direct text editing more annoying.
         """
-        # starting heuristic: find the percentage through the chunk width of this split request
+        # how far through the chunk's width the split was requested, which subclasses
+        # overriding _find_optimum_split_point() may still use as a starting guess
         percentage_split = 0.0
         if self.width != 0:
             percentage_split = float(requested_x) / float(self.width)
@@ -540,7 +566,7 @@ class TextLineChunkFTFont(TextLayoutRect):
             self.text = left_side
             self.letter_count = len(self.text)
             self.size = (
-                self._text_render_width(self.text, self.font),  # noqa pylint: disable=attribute-defined-outside-init; pylint getting confused
+                self.get_prefix_width(self.letter_count),  # noqa pylint: disable=attribute-defined-outside-init; pylint getting confused
                 self.height,
             )
             self.split_points = [
@@ -557,53 +583,63 @@ class TextLineChunkFTFont(TextLayoutRect):
         else:
             return None
 
-    def _find_optimum_split_point(self, percentage_split, requested_x):
+    def _find_optimum_split_point(
+        self,
+        # unused here, but overriding subclasses may start their search from it
+        percentage_split,  # pylint: disable=unused-argument
+        requested_x,
+    ):
         # Now we need to search for the perfect split point
         # perfect split point is a) less than or equal requested x, b) as close to it as possible
-        # because split points will be in order we can test and decided to move left or right until
-        # we find the optimum point.
+        # because split points are in order, and the text only gets wider the more of it we
+        # include, we can binary search them for the last one that still fits.
         optimum_split_point = 0
-        current_split_point_index = int(
-            percentage_split * len(self.split_points)
-        )  # start with approximate position
-        tested_points: List[int] = []
-        valid_points: List[int] = []
-        found_optimum = False
-        max_split_point_index = len(self.split_points) - 1
-        while not found_optimum and len(self.split_points) > 0:
-            optimum_split_point = self.split_points[current_split_point_index]
-
-            if optimum_split_point in tested_points:
-                # already tested this one, so we must have changed direction after crossing the
-                # requested_x line. the last valid point must be the optimum split point.
-                if not valid_points:
-                    raise RuntimeError(
-                        "Unable to find valid split point for text layout"
-                    )
-                found_optimum = True
-                optimum_split_point = valid_points[-1]
+        low = 0
+        high = len(self.split_points) - 1
+        while low <= high:
+            middle = (low + high) // 2
+            split_point = self.split_points[middle]
+            if self.get_prefix_width(split_point) <= requested_x:
+                optimum_split_point = split_point
+                low = middle + 1
             else:
-                width, _ = self.font.get_rect(self.text[:optimum_split_point]).size
-                if (
-                    width < requested_x
-                    and current_split_point_index <= max_split_point_index
-                ):
-                    # we are below the required width so we move right
-                    valid_points.append(optimum_split_point)
-                    if current_split_point_index < max_split_point_index:
-                        current_split_point_index += 1
-                elif width > requested_x and current_split_point_index > 0:
-                    current_split_point_index -= 1
-                elif width == requested_x:
-                    # the split point is right on the requested width
-                    found_optimum = True
-                else:
-                    # no valid point
-                    found_optimum = True
-                    optimum_split_point = 0
-                tested_points.append(optimum_split_point)
+                high = middle - 1
         return optimum_split_point
 
+    def get_prefix_width(self, index: int) -> int:
+        """
+        Get the rendered width of this chunk's text up to a letter index. Widths are
+        remembered, so searching for a split point or re-measuring the left side of a split
+        chunk doesn't render the same text over and over.
+
+        :param index: The letter index to measure up to.
+
+        :return: The width in pixels.
+        """
+        if (
+            self.text is not self._prefix_widths_text
+            or self.font is not self._prefix_widths_font
+        ):
+            # keep any widths for the part of the text that is unchanged
+            unchanged_length = (
+                len(commonprefix([self.text, self._prefix_widths_text]))
+                if self.font is self._prefix_widths_font
+                else -1
+            )
+            self._prefix_widths = {
+                prefix_index: width
+                for prefix_index, width in self._prefix_widths.items()
+                if prefix_index <= unchanged_length
+            }
+            self._prefix_widths_text = self.text
+            self._prefix_widths_font = self.font
+
+        width = self._prefix_widths.get(index)
+        if width is None:
+            width = self._text_render_width(self.text[:index], self.font)
+            self._prefix_widths[index] = width
+        return width
+
     def split_index(self, index):
         """
         Try to perform a split operation on this chunk at the requested character index.
@@ -749,34 +785,28 @@ class TextLineChunkFTFont(TextLayoutRect):
         Convert a horizontal, or 'x' pixel position into a letter/character index in this
         text chunk. Commonly used for converting mouse clicks into letter positions for
         positioning the text editing cursor/carat.
-        """
 
+        Binary searches the remembered widths of the text up to each letter, so repeatedly
+        mapping positions in the same chunk - e.g. while drag selecting - only measures the
+        text the first time around.
+        """
         chunk_space_x = x_pos - self.x
-        percentage = chunk_space_x / self.width
-        estimated_index = int(round(len(self.text) * percentage))
-        best_index = estimated_index
-        text_rect = self.font.get_rect(self.text[:best_index])
-        width_to_index = text_rect.x + text_rect.width
-        lowest_diff = abs(width_to_index - chunk_space_x)
-
-        check_dir = -1
-        changed_dir = 0
-        step = 1
-        new_index = best_index
-        # algorithm picks a good guess for the best letter
-        # index and then checks either side for better indexes
-        while changed_dir < 2 and new_index != 0:
-            new_index = max(estimated_index + (step * check_dir), 0)
-            curr_text_rect = self.font.get_rect(self.text[:new_index])
-            new_diff = abs((curr_text_rect.x + curr_text_rect.width) - chunk_space_x)
-            if new_diff < lowest_diff:
-                lowest_diff = new_diff
-                best_index = new_index
-                step += 1
+        # find the last letter index whose text width is still left of the position
+        low = 0
+        high = len(self.text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.get_prefix_width(middle) <= chunk_space_x:
+                low = middle
             else:
-                check_dir *= -1
-                changed_dir += 1
-                step = 1
+                high = middle - 1
+
+        # then pick whichever side of the letter under the position is closest
+        best_index = low
+        if best_index < len(self.text) and abs(
+            self.get_prefix_width(best_index + 1) - chunk_space_x
+        ) < abs(self.get_prefix_width(best_index) - chunk_space_x):
+            best_index += 1
         return best_index
 
     def redraw(self):
@@ -0,0 +1,118 @@
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+from pygame import BLEND_RGBA_MULT, Color, Surface
+
+from pygame_gui.core.interfaces.gui_font_interface import IGUIFontInterface
+
+
+class TextRenderCache:
+    """
+    A cache of rendered runs of text, shared by all the text chunks in the program, so the same
+    string drawn in the same font and colour - 'OK' on every dialog's button, item names in a
+    long list - is only rasterized once.
+
+    Surfaces are kept in least recently used order and the oldest are dropped when the cache
+    goes over its memory cap.
+
+    Surfaces handed out by the cache are shared, so they must not be modified. Copy them first.
+
+    :param max_memory_bytes: The most memory the cached surfaces may take up, in bytes.
+    """
+
+    def __init__(self, max_memory_bytes: int = 8 * 1024 * 1024):
+        self.max_memory_bytes = max_memory_bytes
+        self.memory_usage = 0
+        self.hits = 0
+        self.misses = 0
+        self._surfaces: OrderedDict[Hashable, Surface] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    def render_premul_to(
+        self,
+        font: IGUIFontInterface,
+        text: str,
+        text_colour: Color,
+        surf_size: Tuple[int, int],
+        surf_position: Tuple[int, int],
+        multiply_colour: Optional[Color] = None,
+    ) -> Surface:
+        """
+        Get a surface with some text rendered on to it, ready for pre-multiplied alpha blending;
+        the same as calling the font's render_premul_to(), but using a cached surface if one has
+        been rendered before with the same font, underline state, text, colours and layout.
+
+        :param font: The font to render with.
+        :param text: The text to render.
+        :param text_colour: The colour of the text.
+        :param surf_size: The size of the surface to render on to.
+        :param surf_position: The position of the text's origin on the surface.
+        :param multiply_colour: An optional colour to multiply the rendered text by, for
+                                tinting text rendered in white.
+
+        :return: A surface that is shared with other users of the cache, and so must not be
+                 modified.
+        """
+        key = (
+            font,
+            font.underline,
+            font.underline_adjustment,
+            text,
+            tuple(text_colour),
+            tuple(surf_size),
+            tuple(surf_position),
+            None if multiply_colour is None else tuple(multiply_colour),
+        )
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render_premul_to(text, text_colour, surf_size, surf_position)
+        if multiply_colour is not None:
+            surface.fill(multiply_colour, special_flags=BLEND_RGBA_MULT)
+        surface_bytes = surface.get_pitch() * surface.get_height()
+        # don't let one huge run of text flush out everything else
+        if surface_bytes <= self.max_memory_bytes // 8:
+            self._surfaces[key] = surface
+            self.memory_usage += surface_bytes
+            self._trim_to_memory_cap()
+        return surface
+
+    def set_max_memory_bytes(self, max_memory_bytes: int):
+        """
+        Set the most memory the cached surfaces may take up, dropping the least recently used
+        surfaces if the cache is already over it.
+
+        :param max_memory_bytes: The memory cap in bytes.
+        """
+        self.max_memory_bytes = max_memory_bytes
+        self._trim_to_memory_cap()
+
+    def clear(self):
+        """
+        Empty the cache.
+        """
+        self._surfaces.clear()
+        self.memory_usage = 0
+
+    def _trim_to_memory_cap(self):
+        while self._surfaces and self.memory_usage > self.max_memory_bytes:
+            _, surface = self._surfaces.popitem(last=False)
+            self.memory_usage -= surface.get_pitch() * surface.get_height()
+
+
+_text_render_cache = TextRenderCache()
+
+
+def get_text_render_cache() -> TextRenderCache:
+    """
+    Get the text render cache shared by all text chunks.
+
+    :return: The TextRenderCache.
+    """
+    return _text_render_cache
@@ -1,11 +1,13 @@
+import itertools
 import json
 import io
 import os
+import threading
 import warnings
 
 from contextlib import contextmanager
 from importlib.resources import files, as_file
-from typing import Union, List, Dict, Any, Optional, cast, Tuple
+from typing import Union, List, Dict, Any, Optional, Set, Iterator, cast, Tuple
 
 import pygame
 
@@ -28,12 +30,18 @@ from pygame_gui.core.ui_font_dictionary import UIFontDictionary
 from pygame_gui.core.ui_shadow import ShadowGenerator
 from pygame_gui.core.surface_cache import SurfaceCache
 from pygame_gui.core.colour_gradient import ColourGradient
-from pygame_gui.core.resource_loaders import IResourceLoader
+from pygame_gui.core.resource_loaders import (
+    IResourceLoader,
+    BlockingThreadedResourceLoader,
+)
 from pygame_gui.core.colour_parser import (
     parse_colour_or_gradient_string,
     get_commas_outside_enclosing_glyphs,
 )
 
+COMPILED_THEME_VERSION_KEY = "pygame_gui_compiled_theme_version"
+COMPILED_THEME_VERSION = 1
+
 
 class UIThemeValidationError(Exception):
     """Custom exception for UI theme validation errors."""
@@ -894,6 +902,137 @@ class UIThemeValidator:
         return errors
 
 
+class UIThemeFileWatcher:
+    """
+    Watches a theme file from a background thread. When the file changes the watcher reads,
+    parses and validates the new theme data, again in the background, and holds it ready for
+    the theme to apply on the main thread.
+
+    Only the most recent ready theme is kept; if the file changes again before the theme
+    collects it, the older data is replaced.
+
+    :param file_path: The theme file to watch.
+    :param last_modified: The modification time of the currently loaded version of the file.
+    :param check_interval: How often to check the file for changes, in seconds.
+    """
+
+    def __init__(
+        self,
+        file_path: Optional[Union[str, PackageResource]],
+        last_modified: float,
+        check_interval: float = 1.0,
+    ):
+        self.check_interval = check_interval
+
+        self._lock = threading.Lock()
+        self._file_path = file_path
+        self._last_modified = last_modified
+        self._ready_theme: Optional[Tuple[Dict[str, Any], List[str], float]] = None
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """
+        Start watching the file.
+        """
+        if self._thread is None:
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._watch_loop, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Stop watching the file. Any ready theme that hasn't been collected is kept.
+        """
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+
+    def is_watching(self) -> bool:
+        """
+        Check if the watcher thread is running.
+
+        :return: True if the file is being watched.
+        """
+        return self._thread is not None
+
+    def set_file_path(
+        self, file_path: Optional[Union[str, PackageResource]], last_modified: float
+    ):
+        """
+        Switch to watching a different theme file, dropping any ready data from the old one.
+
+        :param file_path: The theme file to watch.
+        :param last_modified: The modification time of the currently loaded version of the file.
+        """
+        with self._lock:
+            self._file_path = file_path
+            self._last_modified = last_modified
+            self._ready_theme = None
+
+    def get_ready_theme(self) -> Optional[Tuple[Dict[str, Any], List[str], float]]:
+        """
+        Collect the most recently read version of the theme file, if the file has changed.
+
+        :return: None, or a tuple of the parsed theme data, a list of any validation errors and
+                 the modification time of the file it was read from.
+        """
+        with self._lock:
+            ready_theme = self._ready_theme
+            self._ready_theme = None
+        return ready_theme
+
+    def check_for_changes(self) -> bool:
+        """
+        Check the file for changes and, if it has changed, read, parse and validate it. Called
+        regularly by the watcher thread.
+
+        :return: True if new theme data is ready.
+        """
+        with self._lock:
+            file_path = self._file_path
+            last_modified = self._last_modified
+        if file_path is None:
+            return False
+        try:
+            stamp = UIAppearanceTheme.get_theme_file_modified_time(file_path)
+        except (pygame.error, OSError):
+            return False
+        if stamp == last_modified:
+            return False
+
+        try:
+            if isinstance(file_path, PackageResource):
+                theme_file = (files(file_path.package) / file_path.resource).open(
+                    "r", encoding="utf-8", errors="strict"
+                )
+            else:
+                theme_file = open(file_path, "r", encoding="utf-8")
+            with theme_file:
+                theme_dict = json.load(theme_file)
+        except (OSError, ValueError):
+            # probably caught half way through saving; leave the modification time alone so
+            # we try again next check.
+            return False
+
+        if COMPILED_THEME_VERSION_KEY in theme_dict:
+            validation_errors = []
+        else:
+            validation_errors = UIThemeValidator.validate_theme_file(theme_dict)
+        with self._lock:
+            if file_path != self._file_path:
+                return False
+            self._last_modified = stamp
+            self._ready_theme = (theme_dict, validation_errors, stamp)
+        return True
+
+    def _watch_loop(self):
+        while not self._stop_event.wait(self.check_interval):
+            self.check_for_changes()
+
+
 class UIAppearanceTheme(IUIAppearanceThemeInterface):
     """
     The Appearance Theme class handles all the data that styles and generally dictates the
@@ -908,9 +1047,19 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
 
     To change the theming for the UI you normally specify a theme file when creating the UIManager.
     For more information on theme files see the specific documentation elsewhere.
+
+    :param resource_loader: The resource loader used to load fonts and images.
+    :param locale: The starting locale.
+    :param shadow_cache_path: An optional directory to keep generated shadow corners and edges
+                              in, so they don't need generating again on later runs.
     """
 
-    def __init__(self, resource_loader: IResourceLoader, locale: str):
+    def __init__(
+        self,
+        resource_loader: IResourceLoader,
+        locale: str,
+        shadow_cache_path: Optional[Union[str, os.PathLike]] = None,
+    ):
         self._resource_loader = resource_loader
         self._locale = locale
         # the base colours are the default colours all UI elements use if they
@@ -922,10 +1071,14 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
             str, Dict[str, Union[pygame.Color, ColourGradient]]
         ] = {}
         self.font_dict = UIFontDictionary(self._resource_loader, locale)
-        self.shadow_generator = ShadowGenerator()
+        self.shadow_generator = ShadowGenerator(shadow_cache_path)
         self._shape_cache = SurfaceCache()
 
-        self.unique_theming_ids: Dict[str, List[str]] = {}
+        self.unique_theming_ids: Dict[Tuple, List[str]] = {}
+        # Flattened theme data for each list of combined IDs built by build_all_combined_ids(),
+        # keyed by the id() of the list so elements get single dictionary lookups.
+        self._combined_id_lists: Dict[int, List[str]] = {}
+        self._resolved_styles: Dict[int, Dict[str, Any]] = {}
 
         self.ui_element_fonts_info: Dict[str, Dict[str, FontThemeInfo]] = {}
         self.ui_element_image_locs: Dict[
@@ -941,6 +1094,14 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
 
         self._theme_file_last_modified: float = 0.0
         self._theme_file_path: Optional[str | PackageResource] = None
+        self._theme_file_watcher: Optional[UIThemeFileWatcher] = None
+
+        # the combined IDs whose theme data changed in each category since the changes
+        # were last cleared, and the categories that changed for every element.
+        self._theme_changes: Dict[str, Set[str]] = {
+            category: set() for category in ("colours", "font", "misc", "images")
+        }
+        self._theme_changes_everywhere: Set[str] = set()
 
         self._load_default_theme_file()
 
@@ -987,7 +1148,8 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
     ):
         # parse new_theming data
         theme_dict = self._json_to_dict(new_theming_data)
-        self._parse_theme_data_from_json_dict(theme_dict)
+        with self._recording_theme_changes():
+            self._parse_theme_data_from_json_dict(theme_dict)
         if rebuild_all:
             self.need_to_rebuild_data_manually_changed = True
 
@@ -996,8 +1158,9 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
     ):
         element_theming_dict = self._json_to_dict(new_theming_data)
 
-        self._parse_single_element_data(element_name, element_theming_dict)
-        self._load_fonts_images_and_shadow_edges()
+        with self._recording_theme_changes():
+            self._parse_single_element_data(element_name, element_theming_dict)
+            self._load_fonts_images_and_shadow_edges()
 
     def check_need_to_reload(self) -> bool:
         """
@@ -1007,19 +1170,21 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
 
         :return bool: True if we need to reload elements because the theme data has changed.
         """
+        if self._theme_file_watcher is not None:
+            ready_theme = self._theme_file_watcher.get_ready_theme()
+            if ready_theme is None:
+                return False
+            theme_dict, validation_errors, stamp = ready_theme
+            self._theme_file_last_modified = stamp
+            self._load_theme_dict(theme_dict, validation_errors)
+            return True
+
         if self._theme_file_path is None:
             return False
 
         need_to_reload = False
         try:
-            if isinstance(self._theme_file_path, PackageResource):
-                with as_file(
-                    files(self._theme_file_path.package)
-                    / self._theme_file_path.resource
-                ) as package_file_path:
-                    stamp = os.stat(package_file_path).st_mtime
-            else:
-                stamp = os.stat(self._theme_file_path).st_mtime
+            stamp = self.get_theme_file_modified_time(self._theme_file_path)
         except (pygame.error, OSError):
             need_to_reload = False
         else:
@@ -1030,6 +1195,46 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
 
         return need_to_reload
 
+    @staticmethod
+    def get_theme_file_modified_time(file_path: Union[str, PackageResource]) -> float:
+        """
+        Get the modification time of a theme file.
+
+        :param file_path: The path to the theme file, or the package resource it is in.
+
+        :return: The modification time, as from os.stat().
+        """
+        if isinstance(file_path, PackageResource):
+            with as_file(
+                files(file_path.package) / file_path.resource
+            ) as package_file_path:
+                return os.stat(package_file_path).st_mtime
+        return os.stat(file_path).st_mtime
+
+    def start_background_reload_checks(self, check_interval: float = 1.0):
+        """
+        Start checking the theme file for changes on a background thread. New versions of the
+        file are read, parsed and validated in the background and only applied to the theme
+        the next time check_need_to_reload() is called, so the main thread no longer checks
+        the file itself.
+
+        :param check_interval: How often to check the file for changes, in seconds.
+        """
+        if self._theme_file_watcher is None:
+            self._theme_file_watcher = UIThemeFileWatcher(
+                self._theme_file_path, self._theme_file_last_modified, check_interval
+            )
+        self._theme_file_watcher.check_interval = check_interval
+        self._theme_file_watcher.start()
+
+    def stop_background_reload_checks(self):
+        """
+        Stop checking the theme file for changes on a background thread.
+        """
+        if self._theme_file_watcher is not None:
+            self._theme_file_watcher.stop()
+            self._theme_file_watcher = None
+
     def update_caching(self, time_delta: float):
         """
         Updates the various surface caches.
@@ -1140,8 +1345,12 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
 
                 if element_key not in self.ele_font_res:
                     self.ele_font_res[element_key] = {}
-                self.ele_font_res[element_key][locale_key] = (
-                    self.font_dict.find_font_resource(
+                if self.font_dict.check_font_preloaded(font_id):
+                    # keep a font still on its way from a streaming loader, rather than the
+                    # default font standing in for it, so it is used once it arrives
+                    font_resource = self.font_dict.loaded_fonts[font_id]
+                else:
+                    font_resource = self.font_dict.find_font_resource(
                         font_info["size"],
                         font_info["name"],
                         font_info["bold"],
@@ -1150,7 +1359,7 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
                         font_info["script"],
                         font_info["direction"],
                     )
-                )
+                self.ele_font_res[element_key][locale_key] = font_resource
 
     def _load_images(self) -> None:
         """
@@ -1215,17 +1424,19 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
                                                     image_resource=image_resource,
                                                     sub_surface_rect=None,
                                                 )
-                                            self.surface_resources[surface_id] = (
-                                                surf_resource
-                                            )
                                             if self._resource_loader.started():
                                                 error = surf_resource.load()
                                                 if error is not None:
                                                     warnings.warn(str(error))
                                             else:
-                                                self._resource_loader.add_resource(
-                                                    surf_resource
+                                                surf_resource = (
+                                                    self._resource_loader.add_resource(
+                                                        surf_resource
+                                                    )
                                                 )
+                                            self.surface_resources[surface_id] = (
+                                                surf_resource
+                                            )
                                     else:
                                         surface_id = (
                                             f"{image_resource.image_id}_{element_key}_"
@@ -1313,15 +1524,17 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
                                             image_resource=image_resource,
                                             sub_surface_rect=None,
                                         )
-                                    self.surface_resources[surface_id] = surf_resource
                                     if self._resource_loader.started():
                                         error = surf_resource.load()
                                         if error is not None:
                                             warnings.warn(str(error))
                                     else:
-                                        self._resource_loader.add_resource(
-                                            surf_resource
+                                        surf_resource = (
+                                            self._resource_loader.add_resource(
+                                                surf_resource
+                                            )
                                         )
+                                    self.surface_resources[surface_id] = surf_resource
                             else:
                                 surface_id = f"{image_resource.image_id}_{element_key}_{image_id}"
                                 if surface_id in self.surface_resources:
@@ -1365,7 +1578,8 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
                 if error is not None:
                     warnings.warn(str(error))
             else:
-                self._resource_loader.add_resource(image_resource)
+                # the loader may already be loading this image for someone else
+                image_resource = self._resource_loader.add_resource(image_resource)
 
             self.image_resources[resource_id] = image_resource
         return image_resource
@@ -1389,7 +1603,8 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
                 if error is not None:
                     warnings.warn(str(error))
             else:
-                self._resource_loader.add_resource(image_resource)
+                # the loader may already be loading this image for someone else
+                image_resource = self._resource_loader.add_resource(image_resource)
             self.image_resources[resource_id] = image_resource
         return image_resource
 
@@ -1491,120 +1706,6 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
                             2, shape_corner_radii
                         )
 
-    def _get_next_id_node(
-        self,
-        current_node: Optional[Dict],
-        element_base_ids: List[Union[str, None]],
-        element_ids: List[str],
-        class_ids: List[Union[str, None]],
-        object_ids: List[Union[str, None]],
-        index: int,
-        tree_size: int,
-        combined_ids: List[str],
-    ):
-        """
-        Use a recursive algorithm to build up a list of IDs that describe a particular UI object
-        to ever decreasing degrees of accuracy.
-
-        We first iterate forward through the ID strings building up parent->child relationships
-        and then unwind them backwards to create the final string IDs. We pick object IDs over
-        class IDs, then class IDs over element IDs when available placing those IDs containing
-        object IDs highest up in our list.
-
-        :param current_node: The current 'node' we are at in the recursive algorithm.
-        :param element_ids: A hierarchical list of all element IDs that apply to our element,
-                            this includes parents.
-        :param element_ids: A hierarchical list of all class IDs that apply to our element,
-                            this includes parents.
-        :param object_ids: A hierarchical list of all object IDs that apply to our element,
-                           this includes parents.
-        :param index: The current index in the two ID lists.
-        :param tree_size: The size of both lists.
-        :param combined_ids: The final list of combined IDs.
-        """
-        if index < tree_size:
-            # add any Object IDs first...
-            if (
-                object_ids is not None
-                and index < len(object_ids)
-                and object_ids[index] is not None
-            ):
-                next_node = {"id": object_ids[index], "parent": current_node}
-                self._get_next_id_node(
-                    next_node,
-                    element_base_ids,
-                    element_ids,
-                    class_ids,
-                    object_ids,
-                    index + 1,
-                    tree_size,
-                    combined_ids,
-                )
-            # then any class IDs...
-            if (
-                class_ids is not None
-                and index < len(class_ids)
-                and class_ids[index] is not None
-            ):
-                next_node = {"id": class_ids[index], "parent": current_node}
-                self._get_next_id_node(
-                    next_node,
-                    element_base_ids,
-                    element_ids,
-                    class_ids,
-                    object_ids,
-                    index + 1,
-                    tree_size,
-                    combined_ids,
-                )
-            # Finally add the required element IDs.
-            next_node_2 = {"id": element_ids[index], "parent": current_node}
-            self._get_next_id_node(
-                next_node_2,
-                element_base_ids,
-                element_ids,
-                class_ids,
-                object_ids,
-                index + 1,
-                tree_size,
-                combined_ids,
-            )
-
-            # then any element base IDs...
-            if (
-                element_base_ids is not None
-                and index < len(element_base_ids)
-                and element_base_ids[index] is not None
-            ):
-                next_node = {"id": element_base_ids[index], "parent": current_node}
-                self._get_next_id_node(
-                    next_node,
-                    element_base_ids,
-                    element_ids,
-                    class_ids,
-                    object_ids,
-                    index + 1,
-                    tree_size,
-                    combined_ids,
-                )
-        else:
-            self._unwind_and_gather_ids(current_node, combined_ids)
-
-    @staticmethod
-    def _unwind_and_gather_ids(current_node, combined_ids):
-        # unwind
-        gathered_ids = []
-        unwind_node = current_node
-        while unwind_node is not None:
-            gathered_ids.append(unwind_node["id"])
-            unwind_node = unwind_node["parent"]
-        gathered_ids.reverse()
-        combined_id = gathered_ids[0]
-        for gathered_index in range(1, len(gathered_ids)):
-            combined_id += "."
-            combined_id += gathered_ids[gathered_index]
-        combined_ids.append(combined_id)
-
     def build_all_combined_ids(
         self,
         element_base_ids: Union[None, List[Union[str, None]]],
@@ -1622,8 +1723,11 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
 
         :return: A list of IDs that reference this element in order of decreasing specificity.
         """
-        combined_id = str(element_base_ids).join(
-            str(element_ids).join(str(class_ids)).join(str(object_ids))
+        combined_id = (
+            None if element_base_ids is None else tuple(element_base_ids),
+            None if element_ids is None else tuple(element_ids),
+            None if class_ids is None else tuple(class_ids),
+            None if object_ids is None else tuple(object_ids),
         )
         if combined_id in self.unique_theming_ids:
             return self.unique_theming_ids[combined_id]
@@ -1648,16 +1752,26 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
                     + "\n"
                     "\nObject IDs: " + str(object_ids) + "\n"
                 )
+            # At each level of the hierarchy we can pick the object ID, class ID, element ID
+            # or element base ID, in that order of preference. Every combination of those
+            # choices, most specific first, is a combined ID.
+            id_choices_per_level = [
+                [
+                    level_id
+                    for level_id in (
+                        object_ids[index],
+                        class_ids[index],
+                        element_ids[index],
+                        element_base_ids[index],
+                    )
+                    if level_id is not None
+                ]
+                for index in range(len(element_ids))
+            ]
             if len(element_ids) != 0:
-                self._get_next_id_node(
-                    None,
-                    element_base_ids,
-                    element_ids,
-                    class_ids,
-                    object_ids,
-                    0,
-                    len(element_ids),
-                    combined_ids,
+                combined_ids.extend(
+                    ".".join(id_combination)
+                    for id_combination in itertools.product(*id_choices_per_level)
                 )
 
             found_all_ids = False
@@ -1675,8 +1789,91 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
                     found_all_ids = True
 
         self.unique_theming_ids[combined_id] = combined_ids
+        self._combined_id_lists[id(combined_ids)] = combined_ids
         return combined_ids
 
+    def _get_resolved_style(self, combined_ids: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Get the flattened theme data for a list of combined IDs, resolving it the first time it
+        is asked for. For each colour, misc and image ID the record holds the theme block of
+        the most specific combined ID that defines it; for fonts it holds the most specific
+        combined ID with font data.
+
+        Only lists created by build_all_combined_ids() are resolved, anything else returns None
+        and is looked up the slow way.
+
+        :param combined_ids: A list of IDs representing an element's location in a hierarchy
+                             of elements.
+        """
+        list_id = id(combined_ids)
+        if self._combined_id_lists.get(list_id) is not combined_ids:
+            return None
+        resolved_style = self._resolved_styles.get(list_id)
+        if resolved_style is None:
+            resolved_style = {
+                "colours": {},
+                "misc": {},
+                "images": {},
+                "font_info_id": next(
+                    (
+                        combined_id
+                        for combined_id in combined_ids
+                        if combined_id in self.ui_element_fonts_info
+                    ),
+                    None,
+                ),
+                "font_res_id": next(
+                    (
+                        combined_id
+                        for combined_id in combined_ids
+                        if combined_id in self.ele_font_res
+                    ),
+                    None,
+                ),
+            }
+            for category, theme_blocks in (
+                ("colours", self.ui_element_colours),
+                ("misc", self.ui_element_misc_data),
+                ("images", self.ui_element_image_surfaces),
+            ):
+                category_style = resolved_style[category]
+                # least specific first, so more specific blocks overwrite them
+                for combined_id in reversed(combined_ids):
+                    theme_block = theme_blocks.get(combined_id)
+                    if theme_block is not None:
+                        for data_id in theme_block:
+                            category_style[data_id] = theme_block
+            self._resolved_styles[list_id] = resolved_style
+        return resolved_style
+
+    def _find_theme_block(
+        self,
+        category: str,
+        data_id: str,
+        combined_ids: List[str],
+        theme_blocks: Dict[str, Dict[str, Any]],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find the theme block of the most specific combined ID that contains a piece of data.
+
+        :param category: 'colours', 'misc' or 'images'.
+        :param data_id: The ID of the data we are looking for.
+        :param combined_ids: A list of IDs representing an element's location in a hierarchy
+                             of elements.
+        :param theme_blocks: The theme data for the category, keyed by combined ID.
+        """
+        resolved_style = self._get_resolved_style(combined_ids)
+        if resolved_style is not None:
+            theme_block = resolved_style[category].get(data_id)
+            if theme_block is not None and data_id in theme_block:
+                return theme_block
+            if theme_block is None:
+                return None
+        for combined_id in combined_ids:
+            if combined_id in theme_blocks and data_id in theme_blocks[combined_id]:
+                return theme_blocks[combined_id]
+        return None
+
     def get_image(
         self, image_id: str, combined_element_ids: List[str]
     ) -> pygame.surface.Surface:
@@ -1692,30 +1889,27 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
         :return: A pygame.surface.Surface
         """
 
-        for combined_element_id in combined_element_ids:
-            if (
-                combined_element_id in self.ui_element_image_surfaces
-                and image_id in self.ui_element_image_surfaces[combined_element_id]
-            ):
-                image_data = self.ui_element_image_surfaces[combined_element_id][
-                    image_id
-                ]
-
-                # Handle multi-image format - return the first image for backward compatibility
-                if isinstance(image_data, dict) and image_data.get("type") == "multi":
-                    surfaces = image_data.get("surfaces", [])
-                    if surfaces:
-                        return surfaces[0].surface
-                    else:
-                        raise LookupError(
-                            f"Multi-image {image_id} "
-                            f"found but no surfaces loaded for combined_element_ids: {combined_element_ids}"
-                        )
-                # Handle single image format
+        image_block = self._find_theme_block(
+            "images", image_id, combined_element_ids, self.ui_element_image_surfaces
+        )
+        if image_block is not None:
+            image_data = image_block[image_id]
+
+            # Handle multi-image format - return the first image for backward compatibility
+            if isinstance(image_data, dict) and image_data.get("type") == "multi":
+                surfaces = image_data.get("surfaces", [])
+                if surfaces:
+                    return surfaces[0].surface
                 else:
-                    # Type guard to ensure we have a SurfaceResource
-                    surface_resource = cast(SurfaceResource, image_data)
-                    return surface_resource.surface
+                    raise LookupError(
+                        f"Multi-image {image_id} "
+                        f"found but no surfaces loaded for combined_element_ids: {combined_element_ids}"
+                    )
+            # Handle single image format
+            else:
+                # Type guard to ensure we have a SurfaceResource
+                surface_resource = cast(SurfaceResource, image_data)
+                return surface_resource.surface
 
         raise LookupError(
             f"Unable to find any image with id: {image_id} with combined_element_ids: {combined_element_ids}"
@@ -1737,24 +1931,21 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
         :return: A list of pygame.surface.Surface objects sorted by layer
         """
 
-        for combined_element_id in combined_element_ids:
-            if (
-                combined_element_id in self.ui_element_image_surfaces
-                and image_id in self.ui_element_image_surfaces[combined_element_id]
-            ):
-                image_data = self.ui_element_image_surfaces[combined_element_id][
-                    image_id
-                ]
-
-                # Handle multi-image format
-                if isinstance(image_data, dict) and image_data.get("type") == "multi":
-                    surfaces = image_data.get("surfaces", [])
-                    return [surf.surface for surf in surfaces]
-                # Handle single image format
-                else:
-                    # Type guard to ensure we have a SurfaceResource
-                    surface_resource = cast(SurfaceResource, image_data)
-                    return [surface_resource.surface]
+        image_block = self._find_theme_block(
+            "images", image_id, combined_element_ids, self.ui_element_image_surfaces
+        )
+        if image_block is not None:
+            image_data = image_block[image_id]
+
+            # Handle multi-image format
+            if isinstance(image_data, dict) and image_data.get("type") == "multi":
+                surfaces = image_data.get("surfaces", [])
+                return [surf.surface for surf in surfaces]
+            # Handle single image format
+            else:
+                # Type guard to ensure we have a SurfaceResource
+                surface_resource = cast(SurfaceResource, image_data)
+                return [surface_resource.surface]
 
         raise LookupError(
             f"Unable to find any images with id: {image_id} with combined_element_ids: {combined_element_ids}"
@@ -1774,41 +1965,36 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
         :return: A list of dictionaries containing image details
         """
 
-        for combined_element_id in combined_element_ids:
-            if (
-                combined_element_id in self.ui_element_image_surfaces
-                and image_id in self.ui_element_image_surfaces[combined_element_id]
-            ):
-                image_data = self.ui_element_image_surfaces[combined_element_id][
-                    image_id
+        image_block = self._find_theme_block(
+            "images", image_id, combined_element_ids, self.ui_element_image_surfaces
+        )
+        if image_block is not None:
+            image_data = image_block[image_id]
+
+            # Handle multi-image format
+            if isinstance(image_data, dict) and image_data.get("type") == "multi":
+                surfaces = image_data.get("surfaces", [])
+                return [
+                    {
+                        "id": getattr(surf, "image_id", "unnamed"),
+                        "layer": getattr(surf, "layer", 0),
+                        "position": getattr(surf, "position", (0.5, 0.5)),
+                        "surface": surf.surface,
+                    }
+                    for surf in surfaces
+                ]
+            # Handle single image format
+            else:
+                # Type guard to ensure we have a SurfaceResource
+                surface_resource = cast(SurfaceResource, image_data)
+                return [
+                    {
+                        "id": "single",
+                        "layer": 0,
+                        "position": getattr(surface_resource, "position", (0.5, 0.5)),
+                        "surface": surface_resource.surface,
+                    }
                 ]
-
-                # Handle multi-image format
-                if isinstance(image_data, dict) and image_data.get("type") == "multi":
-                    surfaces = image_data.get("surfaces", [])
-                    return [
-                        {
-                            "id": getattr(surf, "image_id", "unnamed"),
-                            "layer": getattr(surf, "layer", 0),
-                            "position": getattr(surf, "position", (0.5, 0.5)),
-                            "surface": surf.surface,
-                        }
-                        for surf in surfaces
-                    ]
-                # Handle single image format
-                else:
-                    # Type guard to ensure we have a SurfaceResource
-                    surface_resource = cast(SurfaceResource, image_data)
-                    return [
-                        {
-                            "id": "single",
-                            "layer": 0,
-                            "position": getattr(
-                                surface_resource, "position", (0.5, 0.5)
-                            ),
-                            "surface": surface_resource.surface,
-                        }
-                    ]
 
         raise LookupError(
             f"Unable to find any image details with id: {image_id} with combined_element_ids: {combined_element_ids}"
@@ -1823,18 +2009,24 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
 
         :return dictionary: Data about the font requested
         """
-        return next(
-            (
+        resolved_style = self._get_resolved_style(combined_element_ids)
+        if resolved_style is not None:
+            font_info_id = resolved_style["font_info_id"]
+        else:
+            font_info_id = next(
                 (
-                    self.ui_element_fonts_info[combined_element_id][self._locale]
-                    if self._locale in self.ui_element_fonts_info[combined_element_id]
-                    else self.ui_element_fonts_info[combined_element_id]["en"]
-                )
-                for combined_element_id in combined_element_ids
-                if combined_element_id in self.ui_element_fonts_info
-            ),
-            self.font_dict.default_font.info,
-        )
+                    combined_element_id
+                    for combined_element_id in combined_element_ids
+                    if combined_element_id in self.ui_element_fonts_info
+                ),
+                None,
+            )
+        if font_info_id is None or font_info_id not in self.ui_element_fonts_info:
+            return self.font_dict.default_font.info
+        locale_font_info = self.ui_element_fonts_info[font_info_id]
+        if self._locale in locale_font_info:
+            return locale_font_info[self._locale]
+        return locale_font_info["en"]
 
     def get_font(self, combined_element_ids: List[str]) -> IGUIFontInterface:
         """
@@ -1845,18 +2037,25 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
 
         :return IGUIFontInterface: An interface to a pygame font object wrapper.
         """
-        font = next(
-            (
+        resolved_style = self._get_resolved_style(combined_element_ids)
+        if resolved_style is not None:
+            font_res_id = resolved_style["font_res_id"]
+        else:
+            font_res_id = next(
                 (
-                    self.ele_font_res[combined_element_id][self._locale].loaded_font
-                    if self._locale in self.ele_font_res[combined_element_id]
-                    else self.ele_font_res[combined_element_id]["en"].loaded_font
-                )
-                for combined_element_id in combined_element_ids
-                if combined_element_id in self.ele_font_res
-            ),
-            None,
-        )
+                    combined_element_id
+                    for combined_element_id in combined_element_ids
+                    if combined_element_id in self.ele_font_res
+                ),
+                None,
+            )
+        font = None
+        if font_res_id is not None and font_res_id in self.ele_font_res:
+            locale_font_res = self.ele_font_res[font_res_id]
+            if self._locale in locale_font_res:
+                font = locale_font_res[self._locale].loaded_font
+            else:
+                font = locale_font_res["en"].loaded_font
         # set the default font as the final fall back
         if font is None:
             font = self.font_dict.get_default_font()
@@ -1877,12 +2076,11 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
         :return Any: Returns a string or a Dict
         """
 
-        for combined_element_id in combined_element_ids:
-            if (
-                combined_element_id in self.ui_element_misc_data
-                and misc_data_id in self.ui_element_misc_data[combined_element_id]
-            ):
-                return self.ui_element_misc_data[combined_element_id][misc_data_id]
+        misc_block = self._find_theme_block(
+            "misc", misc_data_id, combined_element_ids, self.ui_element_misc_data
+        )
+        if misc_block is not None:
+            return misc_block[misc_data_id]
 
         raise LookupError(
             f"Unable to find any data with id: {misc_data_id} with combined_element_ids: {combined_element_ids}"
@@ -1924,12 +2122,11 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
         :return pygame.Color or ColourGradient: A colour or a gradient object.
         """
         if combined_ids is not None:
-            for combined_id in combined_ids:
-                if (
-                    combined_id in self.ui_element_colours
-                    and colour_id in self.ui_element_colours[combined_id]
-                ):
-                    return self.ui_element_colours[combined_id][colour_id]
+            colour_block = self._find_theme_block(
+                "colours", colour_id, combined_ids, self.ui_element_colours
+            )
+            if colour_block is not None:
+                return colour_block[colour_id]
 
         # then fall back on default colour with same id
         if colour_id in self.base_colours:
@@ -1981,18 +2178,311 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
         Loads a theme, and currently, all associated data like fonts and images required
         by the theme.
 
+        Compiled themes, saved by save_compiled_theme() or compile_theme(), are recognised
+        and loaded without validating or parsing them again.
+
         :param file_path: The location of the theme, or the theme data we want to load.
         """
         if isinstance(file_path, dict):
             theme_dict = file_path
         else:
             loaded_theme_dict = self._load_theme_by_path(file_path)
+            if self._theme_file_watcher is not None:
+                self._theme_file_watcher.set_file_path(
+                    self._theme_file_path, self._theme_file_last_modified
+                )
             if loaded_theme_dict is None:
                 return
 
             theme_dict = loaded_theme_dict
 
-        self._parse_theme_data_from_json_dict(theme_dict)
+        self._load_theme_dict(theme_dict)
+
+    def _load_theme_dict(
+        self,
+        theme_dict: Dict[str, Any],
+        validation_errors: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Load the data from a theme file, or a compiled theme file.
+
+        :param theme_dict: The theme file's data dictionary.
+        :param validation_errors: The errors from validating the data, if it has already been
+                                  validated.
+        """
+        with self._recording_theme_changes():
+            if COMPILED_THEME_VERSION_KEY in theme_dict:
+                self._load_compiled_theme_data(theme_dict)
+            else:
+                self._parse_theme_data_from_json_dict(theme_dict, validation_errors)
+
+    @contextmanager
+    def _recording_theme_changes(self) -> Iterator[None]:
+        """
+        Record which combined IDs have different theme data after the code inside the context
+        has changed the theme, by comparing the data before and after.
+        """
+        old_colours = {
+            element_id: dict(colours)
+            for element_id, colours in self.ui_element_colours.items()
+        }
+        old_fonts = {
+            element_id: {
+                locale: dict(font_info) for locale, font_info in locale_fonts.items()
+            }
+            for element_id, locale_fonts in self.ui_element_fonts_info.items()
+        }
+        old_misc = {
+            element_id: dict(misc)
+            for element_id, misc in self.ui_element_misc_data.items()
+        }
+        old_images = {
+            element_id: self._get_image_specs(image_locs)
+            for element_id, image_locs in self.ui_element_image_locs.items()
+        }
+        old_base_colours = dict(self.base_colours)
+
+        yield
+
+        for category, old_data, new_data in (
+            ("colours", old_colours, self.ui_element_colours),
+            ("font", old_fonts, self.ui_element_fonts_info),
+            ("misc", old_misc, self.ui_element_misc_data),
+        ):
+            changed_ids = self._theme_changes[category]
+            for element_id in old_data.keys() | new_data.keys():
+                # an empty block is the same as no block
+                if (old_data.get(element_id) or {}) != (new_data.get(element_id) or {}):
+                    changed_ids.add(element_id)
+
+        changed_ids = self._theme_changes["images"]
+        for element_id in old_images.keys() | self.ui_element_image_locs.keys():
+            new_image_specs = self._get_image_specs(
+                self.ui_element_image_locs.get(element_id, {})
+            )
+            if old_images.get(element_id, {}) != new_image_specs:
+                changed_ids.add(element_id)
+
+        if old_base_colours != self.base_colours:
+            self._theme_changes_everywhere.add("colours")
+
+    @staticmethod
+    def _get_image_specs(image_locs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy an element's image data without the 'changed' flags, which the image parser sets
+        on every image each time it parses an element, so it can be compared with later data.
+
+        :param image_locs: The image data for one element, by image ID.
+
+        :return: A comparable copy of the image data.
+        """
+
+        def get_spec(image_data: Dict[str, Any]) -> Dict[str, Any]:
+            spec = {}
+            for key, value in image_data.items():
+                if key == "changed":
+                    continue
+                if isinstance(value, pygame.Rect):
+                    value = tuple(value)
+                elif isinstance(value, list):
+                    value = [
+                        get_spec(item) if isinstance(item, dict) else item
+                        for item in value
+                    ]
+                spec[key] = value
+            return spec
+
+        return {
+            image_key: (
+                get_spec(image_data) if isinstance(image_data, dict) else image_data
+            )
+            for image_key, image_data in image_locs.items()
+        }
+
+    def get_changed_theme_categories(self, combined_ids: List[str]) -> Set[str]:
+        """
+        Get the categories of theme data that have changed for an element since the theme
+        changes were last cleared.
+
+        :param combined_ids: A list of IDs representing an element's location in a hierarchy
+                             of elements.
+
+        :return: A set containing any of 'colours', 'font', 'misc' and 'images'.
+        """
+        changed_categories = set(self._theme_changes_everywhere)
+        for category, changed_ids in self._theme_changes.items():
+            if category not in changed_categories and not changed_ids.isdisjoint(
+                combined_ids
+            ):
+                changed_categories.add(category)
+        return changed_categories
+
+    def clear_theme_changes(self):
+        """
+        Forget the record of which theme data has changed.
+        """
+        for changed_ids in self._theme_changes.values():
+            changed_ids.clear()
+        self._theme_changes_everywhere.clear()
+
+    def record_delivered_resources(
+        self, resources: List[Union[FontResource, ImageResource, SurfaceResource]]
+    ):
+        """
+        Record the theme data of elements using fonts or images that have just arrived from a
+        streaming resource loader as changed, so only those elements are rebuilt to swap out
+        their placeholders.
+
+        Fonts that no theme block uses may still be used by text markup, so they count as a
+        font change everywhere.
+
+        :param resources: The resources the loader has just delivered.
+        """
+        delivered_ids = {id(resource) for resource in resources}
+        used_font_ids = set()
+        for element_id, locale_font_res in self.ele_font_res.items():
+            for font_resource in locale_font_res.values():
+                used_font_ids.add(id(font_resource))
+                if id(font_resource) in delivered_ids:
+                    self._theme_changes["font"].add(element_id)
+        if any(
+            isinstance(resource, FontResource) and id(resource) not in used_font_ids
+            for resource in resources
+        ):
+            self._theme_changes_everywhere.add("font")
+
+        for element_id, image_surfaces in self.ui_element_image_surfaces.items():
+            for image_surface in image_surfaces.values():
+                if isinstance(image_surface, dict):
+                    surfaces = image_surface["surfaces"]
+                else:
+                    surfaces = [image_surface]
+                if any(
+                    id(surface) in delivered_ids
+                    or id(surface.image_resource) in delivered_ids
+                    for surface in surfaces
+                ):
+                    self._theme_changes["images"].add(element_id)
+                    break
+
+    def save_compiled_theme(self, file_path: Union[str, os.PathLike]):
+        """
+        Save all the theme data currently loaded - already validated, with prototypes resolved
+        and colours parsed - as a compiled theme file. Loading a compiled theme file skips all
+        that work, which can make a big difference to start up times with large themes.
+
+        The compiled theme includes the default theme data, so it is best made from a fresh
+        theme with only the themes you want compiled loaded into it; compile_theme() does this.
+
+        :param file_path: The path of the compiled theme file to write.
+        """
+        compiled_theme = {
+            COMPILED_THEME_VERSION_KEY: COMPILED_THEME_VERSION,
+            "base_colours": {
+                colour_id: self._compile_colour(colour)
+                for colour_id, colour in self.base_colours.items()
+            },
+            "colours": {
+                element_id: {
+                    colour_id: self._compile_colour(colour)
+                    for colour_id, colour in element_colours.items()
+                }
+                for element_id, element_colours in self.ui_element_colours.items()
+            },
+            "fonts": self.ui_element_fonts_info,
+            "images": self._compile_value(self.ui_element_image_locs),
+            "misc": self._compile_value(self.ui_element_misc_data),
+        }
+        with open(file_path, "w", encoding="utf-8") as compiled_file:
+            json.dump(compiled_theme, compiled_file, separators=(",", ":"))
+
+    @staticmethod
+    def _compile_colour(colour: Union[pygame.Color, ColourGradient]) -> Dict[str, Any]:
+        if isinstance(colour, ColourGradient):
+            gradient_colours = [colour.colour_1, colour.colour_2]
+            if colour.colour_3 is not None:
+                gradient_colours.append(colour.colour_3)
+            return {
+                "angle": colour.angle_direction,
+                "gradient": [
+                    list(gradient_colour) for gradient_colour in gradient_colours
+                ],
+            }
+        return {"colour": list(colour)}
+
+    @staticmethod
+    def _decompile_colour(
+        colour_data: Dict[str, Any],
+    ) -> Union[pygame.Color, ColourGradient]:
+        if "gradient" in colour_data:
+            return ColourGradient(
+                colour_data["angle"],
+                *(pygame.Color(colour) for colour in colour_data["gradient"]),
+            )
+        return pygame.Color(colour_data["colour"])
+
+    @classmethod
+    def _compile_value(cls, value: Any) -> Any:
+        """
+        Convert the rectangles and tuples in image and misc data into tagged JSON values.
+        """
+        if isinstance(value, pygame.Rect):
+            return {"__rect__": [value.x, value.y, value.width, value.height]}
+        if isinstance(value, tuple):
+            return {"__tuple__": [cls._compile_value(item) for item in value]}
+        if isinstance(value, list):
+            return [cls._compile_value(item) for item in value]
+        if isinstance(value, dict):
+            return {key: cls._compile_value(item) for key, item in value.items()}
+        return value
+
+    @classmethod
+    def _decompile_value(cls, value: Any) -> Any:
+        if isinstance(value, dict):
+            if "__rect__" in value:
+                return pygame.Rect(value["__rect__"])
+            if "__tuple__" in value:
+                return tuple(cls._decompile_value(item) for item in value["__tuple__"])
+            decompiled = {
+                key: cls._decompile_value(item) for key, item in value.items()
+            }
+            # everything in a compiled theme needs loading
+            if "changed" in decompiled:
+                decompiled["changed"] = True
+            return decompiled
+        if isinstance(value, list):
+            return [cls._decompile_value(item) for item in value]
+        return value
+
+    def _load_compiled_theme_data(self, compiled_theme: Dict[str, Any]) -> None:
+        """
+        Load theme data saved by save_compiled_theme().
+
+        :param compiled_theme: The compiled theme file's data dictionary.
+        """
+        version = compiled_theme[COMPILED_THEME_VERSION_KEY]
+        if version != COMPILED_THEME_VERSION:
+            warnings.warn(
+                f"Unable to load compiled theme of version {version}, "
+                f"expected version {COMPILED_THEME_VERSION}. Recompile the theme.",
+                UserWarning,
+            )
+            return
+
+        for colour_id, colour_data in compiled_theme["base_colours"].items():
+            self.base_colours[colour_id] = self._decompile_colour(colour_data)
+        for element_id, element_colours in compiled_theme["colours"].items():
+            self.ui_element_colours[element_id] = {
+                colour_id: self._decompile_colour(colour_data)
+                for colour_id, colour_data in element_colours.items()
+            }
+        self.ui_element_fonts_info.update(compiled_theme["fonts"])
+        for element_id, image_locs in compiled_theme["images"].items():
+            self.ui_element_image_locs[element_id] = self._decompile_value(image_locs)
+        for element_id, misc_data in compiled_theme["misc"].items():
+            self.ui_element_misc_data[element_id] = self._decompile_value(misc_data)
+
+        self._load_fonts_images_and_shadow_edges()
 
     def _load_theme_by_path(
         self, file_path: Union[str, os.PathLike, io.StringIO, PackageResource]
@@ -2047,9 +2537,14 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
 
         return None
 
-    def _parse_theme_data_from_json_dict(self, theme_dict: Dict[str, Any]) -> None:
+    def _parse_theme_data_from_json_dict(
+        self,
+        theme_dict: Dict[str, Any],
+        validation_errors: Optional[List[str]] = None,
+    ) -> None:
         # Validate theme data before processing
-        validation_errors = self.validate_theme_data(theme_dict)
+        if validation_errors is None:
+            validation_errors = self.validate_theme_data(theme_dict)
         if validation_errors:
             warnings.warn(
                 f"Theme validation found {len(validation_errors)} errors:\n"
@@ -2072,6 +2567,8 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
         self._load_fonts()
         self._load_images()
         self._preload_shadow_edges()
+        # the theme data has changed so any flattened styles are out of date
+        self._resolved_styles.clear()
 
     def _parse_single_element_data(
         self, element_name: str, element_theming: Dict[str, Any]
@@ -2905,3 +3402,24 @@ class UIAppearanceTheme(IUIAppearanceThemeInterface):
             return self.validate_theme_data(theme_dict)
         except (OSError, IOError, ValueError, TypeError) as e:
             return [f"Error loading theme file: {str(e)}"]
+
+
+def compile_theme(
+    theme_paths: Union[str, os.PathLike, io.StringIO, PackageResource, dict, List[Any]],
+    compiled_theme_path: Union[str, os.PathLike],
+):
+    """
+    Compile one or more theme files into a single compiled theme file. The themes are
+    validated, their prototypes resolved and their colours parsed once, here, so that loading
+    the compiled theme - by passing it to a UIManager or load_theme() just like a normal theme
+    file - can skip all of it.
+
+    :param theme_paths: A theme, or a list of themes to load on top of each other in order.
+    :param compiled_theme_path: The path of the compiled theme file to write.
+    """
+    theme = UIAppearanceTheme(BlockingThreadedResourceLoader(), "en")
+    if not isinstance(theme_paths, list):
+        theme_paths = [theme_paths]
+    for theme_path in theme_paths:
+        theme.load_theme(theme_path)
+    theme.save_compiled_theme(compiled_theme_path)
@@ -24,6 +24,26 @@ if TYPE_CHECKING:
     from pygame_gui.core.drawable_shapes.drawable_shape import DrawableShape
 
 
+_IS_IDLE_COVERS_UPDATE: Dict[type, bool] = {}
+
+
+def _is_idle_covers_update(element_class: type) -> bool:
+    """
+    Check that an element class gets its is_idle() method from the same class it gets update()
+    from, or a subclass of it, so that is_idle() knows about everything update() does.
+
+    :param element_class: The class of the element.
+    """
+    covered = _IS_IDLE_COVERS_UPDATE.get(element_class)
+    if covered is None:
+        mro = element_class.__mro__
+        update_owner = next(cls for cls in mro if "update" in cls.__dict__)
+        is_idle_owner = next(cls for cls in mro if "is_idle" in cls.__dict__)
+        covered = mro.index(is_idle_owner) <= mro.index(update_owner)
+        _IS_IDLE_COVERS_UPDATE[element_class] = covered
+    return covered
+
+
 class UIElement(GUISprite, IUIElementInterface):
     """
     A base class for UI elements. You shouldn't create UI Element objects, instead all UI Element
@@ -107,7 +127,7 @@ class UIElement(GUISprite, IUIElementInterface):
 
         self.layer_thickness = layer_thickness
         self.starting_height = starting_height
-        self.drawable_shape: Optional[DrawableShape] = None
+        self._drawable_shape: Optional[DrawableShape] = None
 
         self.is_enabled = True
 
@@ -181,7 +201,6 @@ class UIElement(GUISprite, IUIElementInterface):
         self.hover_time = 0.0
 
         self.pre_debug_image: Optional[pygame.Surface] = None
-        self._pre_clipped_image: Optional[pygame.Surface] = None
 
         self._image_clip: Optional[pygame.Rect] = None
 
@@ -221,6 +240,20 @@ class UIElement(GUISprite, IUIElementInterface):
     def hovered(self, value: bool):
         self._hovered = value
 
+    @property
+    def drawable_shape(self) -> Optional["DrawableShape"]:
+        return self._drawable_shape
+
+    @drawable_shape.setter
+    def drawable_shape(self, value: Optional["DrawableShape"]):
+        self._drawable_shape = value
+        if value is not None:
+            # elements rebuild by making a new shape, so count that rather than every new image
+            self.ui_manager.get_profiler().count_element_rebuild(self)
+            # a new shape is still building itself, and will ask for updates when it changes
+            value.update_needed_callback = self.schedule_update
+        self.schedule_update()
+
     def get_most_specific_combined_id(self) -> str:
         return self.most_specific_combined_id
 
@@ -832,6 +865,7 @@ class UIElement(GUISprite, IUIElementInterface):
 
         self.rect.left = new_left
         self.rect.top = new_top
+        self.notify_rect_changed()
 
         new_width, new_height = self._get_clamped_to_minimum_dimensions(
             (new_width, new_height)
@@ -1018,6 +1052,7 @@ class UIElement(GUISprite, IUIElementInterface):
         """
         self.rect.x = int(position[0])
         self.rect.y = int(position[1])
+        self.notify_rect_changed()
         self._update_relative_rect_position_from_anchors(recalculate_margins=True)
 
         if self.drawable_shape is not None:
@@ -1099,6 +1134,7 @@ class UIElement(GUISprite, IUIElementInterface):
         self.relative_rect.width = int(dimensions[0])
         self.relative_rect.height = int(dimensions[1])
         self.rect.size = self.relative_rect.size
+        self.notify_rect_changed()
 
         if self.relative_rect.width >= 0 and self.relative_rect.height >= 0:
             self._update_absolute_rect_position_from_anchors(recalculate_margins=True)
@@ -1124,6 +1160,21 @@ class UIElement(GUISprite, IUIElementInterface):
             if self.drawable_shape.has_fresh_surface():
                 self.on_fresh_drawable_shape_ready()
 
+    def is_idle(self) -> bool:
+        """
+        Check if this element has nothing to do in update() right now, so the UI can skip
+        updating it until schedule_update() is called on it. Plain elements are idle when their
+        drawable shape has finished building and has no transitions running.
+
+        Element classes that override update() should also override this to check on the extra
+        work they do there; until they do, they are never idle.
+
+        :return: True if calling update() would do nothing.
+        """
+        if not _is_idle_covers_update(type(self)):
+            return False
+        return self.drawable_shape is None or self.drawable_shape.is_idle()
+
     def change_layer(self, new_layer: int):
         """
         Changes the layer this element is on.
@@ -1384,43 +1435,17 @@ class UIElement(GUISprite, IUIElementInterface):
         Sets a clipping rectangle on this element's image determining what portion of it will
         actually be displayed when this element is blitted to the screen.
 
+        The image itself is left alone; only the area of it that gets blitted changes, so
+        clipping an element doesn't need any new surfaces.
+
         :param rect: A clipping rectangle, or None to clear the clip.
 
         """
         if rect is not None:
             rect.width = max(rect.width, 0)
             rect.height = max(rect.height, 0)
-
-            if self._pre_clipped_image is None and self.image is not None:
-                self._pre_clipped_image = self.image.copy()
-
-            self._image_clip = rect
-            if self.image is not None and self._pre_clipped_image is not None:
-                if self.image.get_size() != self._pre_clipped_image.get_size():
-                    self.image = pygame.Surface(
-                        self._pre_clipped_image.get_size(),
-                        flags=pygame.SRCALPHA,
-                        depth=32,
-                    )
-                self.image.fill(pygame.Color("#00000000"))
-                basic_blit(
-                    self.image,
-                    self._pre_clipped_image,
-                    self._image_clip,
-                    self._image_clip,
-                )
-
-        elif self._image_clip is not None:
-            self._image_clip = None
-            self._set_image(self._pre_clipped_image)
-        else:
-            self._image_clip = None
-
-    def _get_pre_clipped_image_size(self) -> Coordinate:
-        if self._pre_clipped_image is not None:
-            return self._pre_clipped_image.get_size()
-        else:
-            return 0, 0
+        self._image_clip = rect
+        self.set_blit_area(rect)
 
     def get_image_clipping_rect(self) -> Union[pygame.Rect, None]:
         """
@@ -1449,31 +1474,22 @@ class UIElement(GUISprite, IUIElementInterface):
 
     def _set_image(self, new_image: Union[pygame.surface.Surface, None]):
         """
-        Wraps setting the image variable of this element so that we also set the current image
-        clip on the image at the same time.
+        Wraps setting the image variable of this element so that any image clip carries on
+        applying to the new image.
 
         :param new_image: The new image to set.
 
         """
-        image_clipping_rect = self.get_image_clipping_rect()
-        if image_clipping_rect is not None and new_image is not None:
-            self._pre_clipped_image = new_image
-            if image_clipping_rect.width == 0 and image_clipping_rect.height == 0:
-                self.image = self.ui_manager.get_universal_empty_surface()
-            else:
-                self.image = pygame.surface.Surface(
-                    self._pre_clipped_image.get_size(), flags=pygame.SRCALPHA, depth=32
-                )
-                self.image.fill(pygame.Color("#00000000"))
-                basic_blit(
-                    self.image,
-                    self._pre_clipped_image,
-                    image_clipping_rect,
-                    image_clipping_rect,
-                )
+        if new_image is None:
+            self.image = None
+        elif (
+            self.drawable_shape is not None
+            and new_image is self.drawable_shape.transition_blend_buffers.result_surface
+        ):
+            # a state transition blends into the same surface every frame, so use it as it is
+            self.image = new_image
         else:
-            self.image = new_image.copy() if new_image is not None else None
-            self._pre_clipped_image = None
+            self.image = new_image.copy()
 
     def get_top_layer(self) -> int:
         """
@@ -378,6 +378,9 @@ class UIFontDictionary(IUIFontDictionaryInterface):
             )  # record font usage for optimisation purposes
 
         if self.check_font_preloaded(font_id):  # font already loaded
+            if self.loaded_fonts[font_id].loaded_font is None:
+                # still on its way from a streaming loader, stand in the default font
+                return self.loaded_fonts[self.default_font.idx]
             return self.loaded_fonts[font_id]
         elif font_name in self.known_font_paths:
             # we know paths to this font, just haven't loaded current size/style
@@ -680,7 +683,8 @@ class UIFontDictionary(IUIFontDictionaryInterface):
                 warnings.warn(str(error))
 
         else:
-            self._resource_loader.add_resource(resource)
+            # the loader may already be loading this font for someone else
+            resource = self._resource_loader.add_resource(resource)
 
         self.loaded_fonts[font_id] = resource
 
@@ -0,0 +1,267 @@
+import contextlib
+import json
+import time
+
+from collections import deque
+from typing import Any, ContextManager, Deque, Dict, List, Optional
+
+from pygame_gui.core.surface_cache import SurfaceCache
+
+
+class _ProfiledSection:
+    """
+    A reusable context manager that times one section of a UI frame and adds the time to the
+    profiler's current frame record.
+    """
+
+    __slots__ = ("profiler", "name", "start_time")
+
+    def __init__(self, profiler: "UIProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start_time = 0.0
+
+    def __enter__(self):
+        self.start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.profiler.add_section_time(
+            self.name, (time.perf_counter() - self.start_time) * 1000.0
+        )
+        return False
+
+
+class UIProfiler:
+    """
+    Collects a record of what the UI did each frame while it is active; how long the main
+    sections of the UI Manager's frame took, how many of each type of element were updated and
+    rebuilt, and how often drawable shapes were found in the surface cache.
+
+    The most recent frame records are kept in a ring buffer, so a profiler can be left running in
+    a released game and queried, or dumped to JSON, when something looks slow.
+
+    Each frame record is a dictionary like this:
+
+        {"frame": 12,
+         "timings_ms": {"process_events": 0.1, "theme_checks": 0.02, "hovering": 0.05,
+                        "update": 0.8, "draw": 1.2},
+         "process_events_calls": 3,
+         "element_updates": {"UIButton": 4, "UILabel": 2},
+         "element_rebuilds": {"UIButton": 1},
+         "surface_cache": {"hits": 1, "misses": 0}}
+
+    A frame ends when the UI Manager finishes drawing the UI, or when end_frame() is called.
+
+    :param max_frames: The number of most recent frame records to keep.
+    """
+
+    def __init__(self, max_frames: int = 300):
+        self.active = False
+        self.frames: Deque[Dict[str, Any]] = deque(maxlen=max(1, max_frames))
+
+        self._sections: Dict[str, _ProfiledSection] = {}
+        self._null_section = contextlib.nullcontext()
+        self._current_frame: Optional[Dict[str, Any]] = None
+        self._frame_count = 0
+
+        self._surface_cache: Optional[SurfaceCache] = None
+        self._last_cache_hits = 0
+        self._last_cache_misses = 0
+
+    @property
+    def max_frames(self) -> int:
+        """
+        The number of most recent frame records kept by the profiler.
+        """
+        return self.frames.maxlen or 0
+
+    @max_frames.setter
+    def max_frames(self, value: int):
+        self.frames = deque(self.frames, maxlen=max(1, value))
+
+    def start(self):
+        """
+        Start recording frames.
+        """
+        self.active = True
+
+    def stop(self):
+        """
+        Stop recording frames, finishing any partly recorded frame. Already recorded frames
+        are kept until clear() is called.
+        """
+        self.end_frame()
+        self.active = False
+
+    def clear(self):
+        """
+        Throw away all the recorded frames.
+        """
+        self.frames.clear()
+        self._current_frame = None
+
+    def time_section(self, name: str) -> ContextManager:
+        """
+        Get a context manager that adds the time taken by the code inside it to a named
+        section of the current frame's timings. Does nothing while the profiler is inactive.
+
+        :param name: The name of the section to time.
+
+        :return: A context manager.
+        """
+        if not self.active:
+            return self._null_section
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _ProfiledSection(self, name)
+        return section
+
+    def add_section_time(self, name: str, time_ms: float):
+        """
+        Add some time to a named section of the current frame's timings.
+
+        :param name: The name of the section.
+        :param time_ms: The time to add, in milliseconds.
+        """
+        if not self.active:
+            return
+        timings = self._get_current_frame()["timings_ms"]
+        timings[name] = timings.get(name, 0.0) + time_ms
+        if name == "process_events":
+            self._get_current_frame()["process_events_calls"] += 1
+
+    def has_section_time(self, name: str) -> bool:
+        """
+        Check whether the current frame has any time recorded for a section yet.
+
+        :param name: The name of the section.
+
+        :return: True if the section has been timed in the current frame.
+        """
+        return (
+            self._current_frame is not None
+            and name in self._current_frame["timings_ms"]
+        )
+
+    def count_element_update(self, element: Any):
+        """
+        Count an element being updated in the current frame.
+
+        :param element: The element that was updated.
+        """
+        if self.active:
+            updates = self._get_current_frame()["element_updates"]
+            type_name = type(element).__name__
+            updates[type_name] = updates.get(type_name, 0) + 1
+
+    def count_element_rebuild(self, element: Any):
+        """
+        Count an element being rebuilt - given a new drawable shape - in the current frame.
+        Elements swapping images, for state transitions or finished text, don't count.
+
+        :param element: The element that was rebuilt.
+        """
+        if self.active:
+            rebuilds = self._get_current_frame()["element_rebuilds"]
+            type_name = type(element).__name__
+            rebuilds[type_name] = rebuilds.get(type_name, 0) + 1
+
+    def end_frame(self, surface_cache: Optional[SurfaceCache] = None):
+        """
+        Finish the current frame record and add it to the recorded frames.
+
+        :param surface_cache: The surface cache to collect hit and miss counts from.
+        """
+        if not self.active:
+            return
+        if surface_cache is not None:
+            if surface_cache is not self._surface_cache:
+                self._surface_cache = surface_cache
+                self._last_cache_hits = surface_cache.hits
+                self._last_cache_misses = surface_cache.misses
+            cache_stats = self._get_current_frame()["surface_cache"]
+            cache_stats["hits"] = surface_cache.hits - self._last_cache_hits
+            cache_stats["misses"] = surface_cache.misses - self._last_cache_misses
+            self._last_cache_hits = surface_cache.hits
+            self._last_cache_misses = surface_cache.misses
+        if self._current_frame is not None:
+            self.frames.append(self._current_frame)
+            self._current_frame = None
+
+    def get_frames(self, count: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get the recorded frames, oldest first.
+
+        :param count: The number of most recent frames to get. Defaults to all of them.
+
+        :return: A list of frame record dictionaries.
+        """
+        frames = list(self.frames)
+        if count is not None:
+            frames = frames[-count:] if count > 0 else []
+        return frames
+
+    def get_average_timings(self, count: Optional[int] = None) -> Dict[str, float]:
+        """
+        Get the average time taken by each section of a frame over the recorded frames.
+
+        :param count: The number of most recent frames to average. Defaults to all of them.
+
+        :return: A dictionary of section names to average times in milliseconds.
+        """
+        frames = self.get_frames(count)
+        totals: Dict[str, float] = {}
+        for frame in frames:
+            for name, time_ms in frame["timings_ms"].items():
+                totals[name] = totals.get(name, 0.0) + time_ms
+        return {name: total / len(frames) for name, total in totals.items()}
+
+    def get_surface_cache_hit_rate(self, count: Optional[int] = None) -> float:
+        """
+        Get the fraction of surface cache look-ups that found a surface over the recorded
+        frames.
+
+        :param count: The number of most recent frames to check. Defaults to all of them.
+
+        :return: A number between 0.0 and 1.0, or 0.0 if there were no look-ups.
+        """
+        hits = 0
+        misses = 0
+        for frame in self.get_frames(count):
+            hits += frame["surface_cache"]["hits"]
+            misses += frame["surface_cache"]["misses"]
+        return hits / (hits + misses) if hits + misses > 0 else 0.0
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """
+        Dump the recorded frames to a JSON string.
+
+        :param indent: The indent to pass to json.dumps.
+
+        :return: A JSON string containing a list of frame records.
+        """
+        return json.dumps(self.get_frames(), indent=indent)
+
+    def save_to_json_file(self, file_path: str, indent: Optional[int] = None):
+        """
+        Dump the recorded frames to a JSON file.
+
+        :param file_path: The path of the file to write.
+        :param indent: The indent to pass to json.dump.
+        """
+        with open(file_path, "w", encoding="utf-8") as json_file:
+            json.dump(self.get_frames(), json_file, indent=indent)
+
+    def _get_current_frame(self) -> Dict[str, Any]:
+        if self._current_frame is None:
+            self._current_frame = {
+                "frame": self._frame_count,
+                "timings_ms": {},
+                "process_events_calls": 0,
+                "element_updates": {},
+                "element_rebuilds": {},
+                "surface_cache": {"hits": 0, "misses": 0},
+            }
+            self._frame_count += 1
+        return self._current_frame
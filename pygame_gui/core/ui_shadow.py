@@ -1,3 +1,5 @@
+import os
+import struct
 import warnings
 from typing import Tuple, Union, Dict, Optional, List
 
@@ -15,14 +17,43 @@ class ShadowGenerator:
     By default, it creates four base shadows in a small range of sizes. If you find the shadow
     appearance unsatisfactory then it is possible to create more that are closer to the size of the
     elements you are having trouble with.
+
+    Generating the corners and edges of rectangular shadows is slow, so they can also be kept in
+    a persistent cache directory. Every set of corners and edges in the directory is loaded when
+    it is set, and any newly generated ones are saved there, so later runs of the program can
+    skip generating them.
+
+    :param persistent_cache_path: An optional directory to keep generated shadow corners and
+                                  edges in between runs.
     """
 
-    def __init__(self):
+    _cache_file_prefix = "shadow_corners_"
+    _cache_file_suffix = ".bin"
+    _cache_file_magic = b"PGGUISC1"
+    _piece_names = (
+        "top",
+        "bottom",
+        "left",
+        "right",
+        "top_left",
+        "top_right",
+        "bottom_left",
+        "bottom_right",
+    )
+
+    def __init__(self, persistent_cache_path: Optional[Union[str, os.PathLike]] = None):
         self.created_ellipse_shadows = {}
         self.preloaded_shadow_corners = {}
 
         self.short_term_rect_cache = {}
 
+        self.persistent_cache_path: Optional[Union[str, os.PathLike]] = None
+        self._persistent_shadow_corners: Dict[
+            Tuple[int, Tuple[int, ...], int], Dict[str, pygame.surface.Surface]
+        ] = {}
+        if persistent_cache_path is not None:
+            self.set_persistent_cache_path(persistent_cache_path)
+
     def clear_short_term_caches(self):
         """
         Empties short term caches, so we aren't hanging on to so many surfaces.
@@ -45,6 +76,14 @@ class ShadowGenerator:
             shadow_width_param = 1
             warnings.warn("Tried to make shadow with width <= 0")
 
+        cache_key = (shadow_width_param, tuple(corner_radii), aa_amount)
+        if cache_key in self._persistent_shadow_corners:
+            corners_and_edges = self._persistent_shadow_corners[cache_key]
+            self.preloaded_shadow_corners[
+                (str(shadow_width_param) + "x" + str(corner_radii))
+            ] = corners_and_edges
+            return corners_and_edges
+
         edge_surface = self._create_single_edge(aa_amount, shadow_width_param)
         top_edge = smoothscale(edge_surface, (shadow_width_param, shadow_width_param))
         left_edge = rotate(top_edge, 90)
@@ -84,8 +123,116 @@ class ShadowGenerator:
             (str(shadow_width_param) + "x" + str(corner_radii))
         ] = corners_and_edges
 
+        if self.persistent_cache_path is not None:
+            self._persistent_shadow_corners[cache_key] = corners_and_edges
+            self._save_cache_file(cache_key, corners_and_edges)
+
         return corners_and_edges
 
+    def set_persistent_cache_path(
+        self, persistent_cache_path: Optional[Union[str, os.PathLike]]
+    ):
+        """
+        Set the directory that generated shadow corners and edges are kept in between runs of the
+        program, loading all the corners and edges already saved there. The directory is created
+        if it doesn't exist yet.
+
+        :param persistent_cache_path: The directory to use, or None to stop using one.
+        """
+        self.persistent_cache_path = persistent_cache_path
+        self._persistent_shadow_corners.clear()
+        if persistent_cache_path is None:
+            return
+        try:
+            os.makedirs(persistent_cache_path, exist_ok=True)
+            file_names = os.listdir(persistent_cache_path)
+        except OSError as error:
+            warnings.warn(f"Unable to use shadow cache directory: {error}")
+            return
+
+        for file_name in file_names:
+            if file_name.startswith(self._cache_file_prefix) and file_name.endswith(
+                self._cache_file_suffix
+            ):
+                self._load_cache_file(os.path.join(persistent_cache_path, file_name))
+
+    def _get_cache_file_path(self, cache_key: Tuple[int, Tuple[int, ...], int]) -> str:
+        shadow_width, corner_radii, aa_amount = cache_key
+        key_str = "_".join(
+            str(param) for param in (shadow_width, *corner_radii, aa_amount)
+        )
+        return os.path.join(
+            self.persistent_cache_path,
+            self._cache_file_prefix + key_str + self._cache_file_suffix,
+        )
+
+    def _save_cache_file(
+        self,
+        cache_key: Tuple[int, Tuple[int, ...], int],
+        corners_and_edges: Dict[str, pygame.surface.Surface],
+    ):
+        """
+        Write a set of corners and edges to the cache directory as a small header of the
+        shadow parameters, followed by the size and raw RGBA pixels of each piece.
+
+        :param cache_key: The shadow width, corner radii and antialiasing amount.
+        :param corners_and_edges: The pieces to save.
+        """
+        shadow_width, corner_radii, aa_amount = cache_key
+        params = (shadow_width, *corner_radii, aa_amount)
+        # the file header has room for four whole number radii; other shadows are only
+        # kept in memory
+        if len(corner_radii) != 4 or any(int(param) != param for param in params):
+            return
+        params = tuple(int(param) for param in params)
+        file_path = self._get_cache_file_path((params[0], params[1:5], params[5]))
+        temp_file_path = file_path + ".tmp"
+        try:
+            chunks = [self._cache_file_magic, struct.pack("<6i", *params)]
+            for piece_name in self._piece_names:
+                piece = corners_and_edges[piece_name]
+                chunks.append(struct.pack("<2i", *piece.get_size()))
+                chunks.append(pygame.image.tobytes(piece, "RGBA"))
+            with open(temp_file_path, "wb") as cache_file:
+                cache_file.write(b"".join(chunks))
+            # replace in one step so other processes never load a half written file
+            os.replace(temp_file_path, file_path)
+        except (OSError, struct.error) as error:
+            warnings.warn(f"Unable to save shadow to cache directory: {error}")
+
+    def _load_cache_file(self, file_path: str):
+        """
+        Load a set of corners and edges saved by _save_cache_file().
+
+        :param file_path: The file to load.
+        """
+        try:
+            with open(file_path, "rb") as cache_file:
+                data = cache_file.read()
+            magic_length = len(self._cache_file_magic)
+            if data[:magic_length] != self._cache_file_magic:
+                raise ValueError("not a shadow cache file")
+            offset = magic_length
+            params = struct.unpack_from("<6i", data, offset)
+            offset += struct.calcsize("<6i")
+            corners_and_edges = {}
+            for piece_name in self._piece_names:
+                size = struct.unpack_from("<2i", data, offset)
+                offset += struct.calcsize("<2i")
+                piece_length = size[0] * size[1] * 4
+                if offset + piece_length > len(data):
+                    raise ValueError("file is truncated")
+                corners_and_edges[piece_name] = pygame.image.frombytes(
+                    data[offset : offset + piece_length], size, "RGBA"
+                )
+                offset += piece_length
+        except (OSError, ValueError, struct.error) as error:
+            warnings.warn(f"Unable to load shadow cache file {file_path}: {error}")
+            return
+
+        cache_key = (params[0], tuple(params[1:5]), params[5])
+        self._persistent_shadow_corners[cache_key] = corners_and_edges
+
     @staticmethod
     def _create_single_edge(aa_amount, shadow_width_param):
         """
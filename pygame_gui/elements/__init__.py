@@ -16,6 +16,9 @@ from pygame_gui.elements.ui_tool_tip import UITooltip
 from pygame_gui.elements.ui_drop_down_menu import UIDropDownMenu
 from pygame_gui.elements.ui_status_bar import UIStatusBar
 from pygame_gui.elements.ui_world_space_health_bar import UIWorldSpaceHealthBar
+from pygame_gui.elements.ui_world_space_health_bar_batch import (
+    UIWorldSpaceHealthBarBatch,
+)
 from pygame_gui.elements.ui_window import UIWindow
 from pygame_gui.elements.ui_scrolling_container import UIScrollingContainer
 from pygame_gui.elements.ui_text_entry_box import UITextEntryBox
@@ -42,6 +45,7 @@ __all__ = [
     "UIDropDownMenu",
     "UIStatusBar",
     "UIWorldSpaceHealthBar",
+    "UIWorldSpaceHealthBarBatch",
     "UIProgressBar",
     "UITextEntryLine",
     "UIWindow",
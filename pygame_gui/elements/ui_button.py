@@ -442,6 +442,23 @@ class UIButton(UIElement):
             ):
                 self.double_click_timer += time_delta
 
+    def is_idle(self) -> bool:
+        """
+        Check if this button has nothing to do in update() right now; it isn't being pressed
+        and isn't timing a possible double click.
+
+        :return: True if calling update() would do nothing.
+        """
+        return (
+            super().is_idle()
+            and not self.pressed
+            and not self.pressed_event
+            and not (
+                self.allow_double_clicks
+                and self.double_click_timer < self.ui_manager.get_double_click_time()
+            )
+        )
+
     def process_event(self, event: pygame.event.Event) -> bool:
         """
         Handles various interactions with the button.
@@ -492,6 +509,7 @@ class UIButton(UIElement):
                 self._set_inactive()
                 consumed_event = True
                 self.pressed_event = True
+                self.schedule_update()
                 self.on_self_event(UI_BUTTON_PRESSED, {"mouse_button": event.button})
 
             if self.is_enabled and self.held:
@@ -504,6 +522,7 @@ class UIButton(UIElement):
     def _start_button_press(self, event):
         self.on_self_event(UI_BUTTON_START_PRESS, {"mouse_button": event.button})
         self.double_click_timer = 0.0
+        self.schedule_update()
         self.last_click_button = event.button
         self.held = True
         self.hovered = False
@@ -1007,10 +1026,7 @@ class UIButton(UIElement):
     def _calc_dynamic_size(self):
         if not self.dynamic_width and not self.dynamic_height:
             return
-        if self.image.get_size() == (0, 0):
-            self._set_dimensions(self._get_pre_clipped_image_size())
-        else:
-            self._set_dimensions(self.image.get_size())
+        self._set_dimensions(self.image.get_size())
 
         # if we have anchored the left side of our button to the right of its container then
         # changing the width is going to mess up the horiz position as well.
@@ -82,10 +82,7 @@ class UIImage(UIElement):
 
         if self.rect.size != self.image.get_size():
             if self.original_image is None:
-                if self._pre_clipped_image is not None:
-                    self.original_image = self._pre_clipped_image
-                else:
-                    self.original_image = self.image
+                self.original_image = self.image
             self._set_image(self.scale_func(self.original_image, self.rect.size))
 
     def set_image(
@@ -220,10 +220,7 @@ class UILabel(UIElement, IUITextOwnerInterface):
     def _calc_dynamic_size(self):
         if not self.dynamic_width and not self.dynamic_height:
             return
-        if self.image.get_size() == (0, 0):
-            self._set_dimensions(self._get_pre_clipped_image_size())
-        else:
-            self._set_dimensions(self.image.get_size())
+        self._set_dimensions(self.image.get_size())
 
         # if we have anchored the left side of our button to the right of its container then
         # changing the width is going to mess up the horiz position as well.
@@ -390,6 +387,15 @@ class UILabel(UIElement, IUITextOwnerInterface):
         super().update(time_delta)
         self.update_text_effect(time_delta)
 
+    def is_idle(self) -> bool:
+        """
+        Check if this label has nothing to do in update() right now; it has no text effect
+        running.
+
+        :return: True if calling update() would do nothing.
+        """
+        return super().is_idle() and self.active_text_effect is None
+
     # -------------------------------------------------
     # The Text owner interface
     # -------------------------------------------------
@@ -479,6 +485,7 @@ class UILabel(UIElement, IUITextOwnerInterface):
         if self.active_text_effect is not None:
             self.active_text_effect.text_changed = True
             self.update_text_effect(0.0)
+            self.schedule_update()
 
     def stop_finished_effect(
         self, sub_chunks: Optional[List[TextLineChunkFTFont]] = None
@@ -101,6 +101,10 @@ class UISelectionList(UIElement):
         }
         """
         self.item_list: List[Dict[str, Any]] = []
+        # A pool of row buttons, just enough to cover the visible area of the list. Buttons are
+        # rebound to whichever items are scrolled into view rather than created and killed.
+        self._row_buttons: List[UIButton] = []
+        self._row_button_indices: Dict[UIButton, int] = {}
         self.allow_multi_select = allow_multi_select
         self.allow_double_clicks = allow_double_clicks
 
@@ -228,54 +232,128 @@ class UISelectionList(UIElement):
             and self.scroll_bar is not None
             and self.scroll_bar.check_has_moved_recently()
         ):
+            self._update_visible_rows()
+
+    def _update_visible_rows(self) -> None:
+        """
+        Work out which items are in view from the scroll position and bind the pooled row
+        buttons to them. Items that stay in view keep their button and are just moved, so this
+        only costs as much as the number of visible rows, however long the list is.
+        """
+        if self.item_list_container is None:
+            return
+        row_height = self.list_item_height
+        visible_height = self.item_list_container.relative_rect.height
+        list_height_adjustment = 0.0
+        if self.scroll_bar is not None:
             list_height_adjustment = min(
                 self.scroll_bar.start_percentage * self.total_height_of_list,
                 self.lowest_list_pos,
             )
-            for index, item in enumerate(self.item_list):
-                new_height = int(
-                    (index * self.list_item_height) - list_height_adjustment
-                )
-                if (
-                    -self.list_item_height
-                    <= new_height
-                    <= self.item_list_container.relative_rect.height
-                ):
-                    if item["button_element"] is None:
-                        button_rect = pygame.Rect(
-                            0,
-                            new_height,
-                            self.item_list_container.relative_rect.width,
-                            self.list_item_height,
-                        )
-                        button = UIButton(
-                            relative_rect=button_rect,
-                            text=item["text"],
-                            manager=self.ui_manager,
-                            parent_element=self,
-                            container=self.item_list_container,
-                            object_id=ObjectID(
-                                object_id=item["object_id"],
-                                class_id="@selection_list_item",
-                            ),
-                            allow_double_clicks=self.allow_double_clicks,
-                            anchors={
-                                "left": "left",
-                                "right": "right",
-                                "top": "top",
-                                "bottom": "top",
-                            },
-                        )
-                        self.join_focus_sets(button)
-                        if item["selected"]:
-                            button.select()
-                        item["button_element"] = button
 
-                    else:
-                        item["button_element"].set_relative_position((0, new_height))
-                elif item["button_element"] is not None:
-                    item["button_element"].kill()
-                    item["button_element"] = None
+        first_index = max(0, int(list_height_adjustment // row_height) - 1)
+        last_index = min(
+            len(self.item_list),
+            int((list_height_adjustment + visible_height) // row_height) + 2,
+        )
+        visible_rows = {}
+        for index in range(first_index, last_index):
+            new_height = int((index * row_height) - list_height_adjustment)
+            if -row_height <= new_height <= visible_height:
+                visible_rows[index] = new_height
+
+        free_buttons = []
+        for button, index in list(self._row_button_indices.items()):
+            if index not in visible_rows:
+                self.item_list[index]["button_element"] = None
+                del self._row_button_indices[button]
+                free_buttons.append(button)
+        free_buttons.extend(
+            button
+            for button in self._row_buttons
+            if button not in self._row_button_indices and button not in free_buttons
+        )
+        free_buttons.reverse()
+
+        for index, new_height in visible_rows.items():
+            item = self.item_list[index]
+            button = item["button_element"]
+            if button is None:
+                if free_buttons:
+                    button = free_buttons.pop()
+                    self._bind_row_button(button, item)
+                    button.set_relative_position((0, new_height))
+                else:
+                    button = self._create_row_button(item, new_height)
+                item["button_element"] = button
+                self._row_button_indices[button] = index
+            elif button.relative_rect.top != new_height:
+                button.set_relative_position((0, new_height))
+
+        # park any spare buttons out of sight below the list, ready for reuse
+        for button in free_buttons:
+            if button.relative_rect.top <= visible_height:
+                button.set_relative_position((0, visible_height + row_height))
+
+    def _create_row_button(self, item: Dict[str, Any], row_top: int) -> UIButton:
+        """
+        Create a new row button for the pool, bound to an item.
+
+        :param item: The item the new button displays.
+        :param row_top: The position of the row inside the item list container.
+        """
+        width = 0
+        if self.item_list_container is not None:
+            width = self.item_list_container.relative_rect.width
+        button = UIButton(
+            relative_rect=pygame.Rect(0, row_top, width, self.list_item_height),
+            text=item["text"],
+            manager=self.ui_manager,
+            parent_element=self,
+            container=self.item_list_container,
+            object_id=ObjectID(
+                object_id=item["object_id"], class_id="@selection_list_item"
+            ),
+            allow_double_clicks=self.allow_double_clicks,
+            anchors={
+                "left": "left",
+                "right": "right",
+                "top": "top",
+                "bottom": "top",
+            },
+        )
+        self.join_focus_sets(button)
+        if item["selected"]:
+            button.select()
+        self._row_buttons.append(button)
+        return button
+
+    @staticmethod
+    def _bind_row_button(button: UIButton, item: Dict[str, Any]) -> None:
+        """
+        Point an existing row button at a different item, only changing what differs.
+
+        :param button: The pooled row button.
+        :param item: The item it should now display.
+        """
+        if button.get_object_ids()[-1] != item["object_id"]:
+            button.change_object_id(
+                ObjectID(object_id=item["object_id"], class_id="@selection_list_item")
+            )
+        button.set_text(item["text"])
+        if item["selected"] and not button.is_selected:
+            button.select()
+        elif not item["selected"] and button.is_selected:
+            button.unselect()
+
+    def _clear_row_buttons(self) -> None:
+        """
+        Kill the pool of row buttons, so it gets rebuilt from scratch.
+        """
+        for button in self._row_buttons:
+            button.kill()
+        self._row_buttons.clear()
+        self._row_button_indices.clear()
 
     def get_single_selection_start_percentage(self) -> float:
         """
@@ -291,7 +369,7 @@ class UISelectionList(UIElement):
 
     def set_item_list(self, new_item_list: List[str | Tuple[str, str]]) -> None:
         """
-        Set a new item list and create all the button elements.
+        Set a new item list and bind the pool of row buttons to the items at the top of it.
 
         :param new_item_list: The new list to switch to.
         """
@@ -369,7 +447,6 @@ class UISelectionList(UIElement):
         # create button list container
         if self.list_and_scroll_bar_container is not None:
             if self.item_list_container is not None:
-                self.item_list_container.clear()
                 if self.item_list_container.relative_rect.width != (
                     self.list_and_scroll_bar_container.relative_rect.width
                     - self.current_scroll_bar_width
@@ -402,37 +479,13 @@ class UISelectionList(UIElement):
                     },
                 )
                 self.join_focus_sets(self.item_list_container)
-        item_y_height = 0
-        if self.item_list_container is not None:
-            for item in self.item_list:
-                if item_y_height <= self.item_list_container.relative_rect.height:
-                    button_rect = pygame.Rect(
-                        0,
-                        item_y_height,
-                        self.item_list_container.relative_rect.width,
-                        self.list_item_height,
-                    )
-                    item["button_element"] = UIButton(
-                        relative_rect=button_rect,
-                        text=item["text"],
-                        manager=self.ui_manager,
-                        parent_element=self,
-                        container=self.item_list_container,
-                        object_id=ObjectID(
-                            object_id=item["object_id"], class_id="@selection_list_item"
-                        ),
-                        allow_double_clicks=self.allow_double_clicks,
-                        anchors={
-                            "left": "left",
-                            "right": "right",
-                            "top": "top",
-                            "bottom": "top",
-                        },
-                    )
-                    self.join_focus_sets(item["button_element"])
-                    item_y_height += self.list_item_height
-                else:
-                    break
+        self._row_button_indices.clear()
+        if any(
+            button.relative_rect.height != self.list_item_height
+            for button in self._row_buttons
+        ):
+            self._clear_row_buttons()
+        self._update_visible_rows()
 
     def _set_default_selection(self) -> None:
         """
@@ -685,6 +738,8 @@ class UISelectionList(UIElement):
         if self.scroll_bar is not None:
             self.scroll_bar.has_moved_recently = True
             self.update(0.0)
+        else:
+            self._update_visible_rows()
 
     def set_relative_position(self, position: Coordinate) -> None:
         """
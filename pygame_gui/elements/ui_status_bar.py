@@ -12,7 +12,7 @@ from pygame_gui.core.interfaces import (
 )
 from pygame_gui.core import UIElement
 from pygame_gui.core.drawable_shapes import RectDrawableShape, RoundedRectangleShape
-from pygame_gui.core.gui_type_hints import RectLike, SpriteWithHealth
+from pygame_gui.core.gui_type_hints import Coordinate, RectLike, SpriteWithHealth
 
 
 class UIStatusBar(UIElement):
@@ -114,6 +114,13 @@ class UIStatusBar(UIElement):
         self.text_horiz_alignment_padding = 1
         self.text_vert_alignment_padding = 1
 
+        # the bar drawn completely unfilled and completely filled, without text, so changes in
+        # status only need to copy across the filled part of the bar and redraw the text
+        self._unfilled_bar_surface: Optional[pygame.Surface] = None
+        self._filled_bar_surface: Optional[pygame.Surface] = None
+        self._drawn_filled_width: Optional[int] = None
+        self._drawn_status_text: Optional[str] = None
+
         self._set_image(None)
 
         self.rebuild_from_changed_theme_data()
@@ -202,7 +209,7 @@ class UIStatusBar(UIElement):
 
             if self.status_changed:
                 self.status_changed = False
-                self.redraw()
+                self.redraw_filled_bar()
 
     def status_text(self):
         """To display text in the bar, subclass UIStatusBar and override this method."""
@@ -212,6 +219,9 @@ class UIStatusBar(UIElement):
         """
         Redraw the status bar when something, other than it's position has changed.
 
+        The bar is drawn once unfilled, with any status text, and once filled without; after
+        that redraw_filled_bar() can update the bar for a new status without drawing the whole
+        shape again.
         """
         theming_parameters = {
             "normal_bg": self.bar_unfilled_colour,
@@ -219,13 +229,16 @@ class UIStatusBar(UIElement):
             "border_width": self.border_width,
             "shadow_width": self.shadow_width,
             "shape_corner_radius": self.shape_corner_radius,
-            "filled_bar": self.bar_filled_colour,
-            "filled_bar_width_percentage": self.percent_full,
             "follow_sprite_offset": self.follow_sprite_offset,
             "border_overlap": self.border_overlap,
         }
+        # a bar filled with one colour is the same as the background in that colour, which lets
+        # identical bars share shapes from the shape cache
+        filled_theming_parameters = theming_parameters.copy()
+        filled_theming_parameters["normal_bg"] = self.bar_filled_colour
 
-        if text := self.status_text():
+        text = self.status_text()
+        if text:
             text_parameters = {
                 "font": self.font,
                 "text": text,
@@ -239,17 +252,97 @@ class UIStatusBar(UIElement):
             }
             theming_parameters |= text_parameters
 
+        filled_shape = None
         if self.shape == "rectangle":
             self.drawable_shape = RectDrawableShape(
                 self.rect, theming_parameters, ["normal"], self.ui_manager
             )
+            filled_shape = RectDrawableShape(
+                self.rect, filled_theming_parameters, ["normal"], self.ui_manager
+            )
         elif self.shape == "rounded_rectangle":
             self.drawable_shape = RoundedRectangleShape(
                 self.rect, theming_parameters, ["normal"], self.ui_manager
             )
+            filled_shape = RoundedRectangleShape(
+                self.rect, filled_theming_parameters, ["normal"], self.ui_manager
+            )
+
+        if self.drawable_shape is not None and filled_shape is not None:
+            normal_state = self.drawable_shape.states["normal"]
+            if normal_state.pre_text_surface is not None:
+                self._unfilled_bar_surface = normal_state.pre_text_surface
+            else:
+                self._unfilled_bar_surface = normal_state.surface.copy()
+            self._filled_bar_surface = filled_shape.get_surface("normal")
+            self._drawn_filled_width = None
+            self._drawn_status_text = text if text else None
+            self.redraw_filled_bar()
+
+    def redraw_filled_bar(self):
+        """
+        Update the filled part of the bar, and the status text, for the current status without
+        drawing the rest of the bar again. The status is measured in whole pixels of bar, so
+        changes too small to see are skipped.
+        """
+        if (
+            self.drawable_shape is None
+            or self._unfilled_bar_surface is None
+            or self._filled_bar_surface is None
+        ):
+            return
+        text = self.status_text()
+        if bool(text) != (self._drawn_status_text is not None):
+            # adding or removing the text changes the shape's theming
+            self.redraw()
+            return
+
+        filled_width = int(
+            min(max(self.percent_full, 0.0), 1.0) * max(self.capacity_width, 0)
+        )
+        if filled_width == self._drawn_filled_width and (
+            not text or text == self._drawn_status_text
+        ):
+            return
+
+        bar_surface = self._unfilled_bar_surface.copy()
+        if filled_width > 0:
+            filled_area = pygame.Rect(
+                self.capacity_rect.x, 0, filled_width, bar_surface.get_height()
+            )
+            bar_surface.fill(pygame.Color("#00000000"), filled_area)
+            bar_surface.blit(
+                self._filled_bar_surface,
+                filled_area,
+                filled_area,
+                special_flags=pygame.BLEND_RGBA_ADD,
+            )
+        self.drawable_shape.states["normal"].surface = bar_surface
+        if text:
+            text_changed = text != self._drawn_status_text
+            if text_changed:
+                self.drawable_shape.theming["text"] = text
+                self.drawable_shape.build_text_layout()
+            self.drawable_shape.finalise_text(
+                "normal",
+                "normal_text",
+                "normal_text_shadow",
+                only_text_changed=not text_changed,
+            )
+        self._drawn_filled_width = filled_width
+        self._drawn_status_text = text if text else None
+        self._set_image(self.drawable_shape.get_fresh_surface())
+
+    def set_dimensions(self, dimensions: Coordinate, clamp_to_container: bool = False):
+        """
+        Set the dimensions of the status bar, and redraw it at the new size.
 
-        if self.drawable_shape is not None:
-            self._set_image(self.drawable_shape.get_fresh_surface())
+        :param dimensions: The new dimensions to set.
+        :param clamp_to_container: Whether we should clamp the dimensions to the
+                                   dimensions of the container or not.
+        """
+        super().set_dimensions(dimensions, clamp_to_container)
+        self.rebuild()
 
     def rebuild_from_changed_theme_data(self):
         """
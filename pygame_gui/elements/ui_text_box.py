@@ -55,6 +55,8 @@ from pygame_gui.core.text.text_effects import (
 )
 from pygame_gui.core.gui_type_hints import Coordinate, RectLike
 
+_LINE_BREAK_REGEX = re.compile(r"<br\s*/?>|\n", re.IGNORECASE)
+
 
 class UITextBox(UIElement, IUITextOwnerInterface):
     """
@@ -164,6 +166,7 @@ class UITextBox(UIElement, IUITextOwnerInterface):
         self.placeholder_text = placeholder_text
 
         self.appended_text = ""
+        self._text_tile_height: Optional[int] = None
         self.text_kwargs = {}
         if text_kwargs is not None:
             self.text_kwargs = text_kwargs
@@ -176,6 +179,7 @@ class UITextBox(UIElement, IUITextOwnerInterface):
         self.link_hover_chunks: List[
             HyperlinkTextChunk
         ] = []  # container for any link chunks we have
+        self._hovered_link_chunks: List[HyperlinkTextChunk] = []
 
         self.active_text_effect: Optional[TextEffect] = None
         self.active_text_chunk_effects: List[
@@ -479,6 +483,7 @@ class UITextBox(UIElement, IUITextOwnerInterface):
         drawable_area = pygame.Rect((0, height_adjustment), drawable_area_size)
         self._setup_final_text_box_image(drawable_area)
         self.link_hover_chunks = []
+        self._hovered_link_chunks = []
         if self.text_box_layout is not None:
             self.text_box_layout.add_chunks_to_hover_group(self.link_hover_chunks)
 
@@ -669,7 +674,6 @@ class UITextBox(UIElement, IUITextOwnerInterface):
         any_hyper_link_hovered = False
         if len(self.link_hover_chunks) > 0:
             mouse_x, mouse_y = self.ui_manager.get_mouse_position()
-            should_redraw_from_layout = False
             if self.scroll_bar is not None:
                 height_adjustment = (
                     self.scroll_bar.start_percentage
@@ -693,26 +697,34 @@ class UITextBox(UIElement, IUITextOwnerInterface):
                 - height_adjustment
             )
 
-            for chunk in self.link_hover_chunks:
-                hovered_currently = False
+            # only the links in the rows under the mouse can be hovered
+            hovered_chunks: List[HyperlinkTextChunk] = []
+            if self.rect.collidepoint(mouse_x, mouse_y):
+                hovered_chunks = [
+                    chunk
+                    for chunk in self.text_box_layout.get_link_chunks_near_y(
+                        mouse_y - base_y
+                    )
+                    if chunk.collidepoint(mouse_x - base_x, mouse_y - base_y)
+                ]
+            any_hyper_link_hovered = len(hovered_chunks) > 0
 
-                hover_rect = pygame.Rect(
-                    (base_x + chunk.x, base_y + chunk.y), chunk.size
-                )
-                if hover_rect.collidepoint(mouse_x, mouse_y) and self.rect.collidepoint(
-                    mouse_x, mouse_y
+            changed_chunks: List[HyperlinkTextChunk] = []
+            for chunk in self._hovered_link_chunks:
+                if chunk.is_hovered and not any(
+                    chunk is hovered_chunk for hovered_chunk in hovered_chunks
                 ):
-                    hovered_currently = True
-                    any_hyper_link_hovered = True
-                if chunk.is_hovered and not hovered_currently:
                     chunk.on_unhovered()
-                    should_redraw_from_layout = True
-                elif hovered_currently and not chunk.is_hovered:
+                    changed_chunks.append(chunk)
+            for chunk in hovered_chunks:
+                if not chunk.is_hovered:
                     chunk.on_hovered()
-                    should_redraw_from_layout = True
+                    if chunk.is_hovered:
+                        changed_chunks.append(chunk)
+            self._hovered_link_chunks = hovered_chunks
 
-            if should_redraw_from_layout:
-                self.redraw_from_text_block()
+            if changed_chunks:
+                self._redraw_link_chunks(changed_chunks, int(height_adjustment))
 
         scaled_mouse_pos = self.ui_manager.get_mouse_position()
         if (
@@ -844,6 +856,7 @@ class UITextBox(UIElement, IUITextOwnerInterface):
         self.relative_rect.width = int(dimensions[0])
         self.relative_rect.height = int(dimensions[1])
         self.rect.size = self.relative_rect.size
+        self.notify_rect_changed()
 
         if dimensions[0] >= 0 and dimensions[1] >= 0 and self.ui_container is not None:
             if self.relative_right_margin is not None:
@@ -955,6 +968,7 @@ class UITextBox(UIElement, IUITextOwnerInterface):
             )
 
         self._align_all_text_rows()
+        self.text_box_layout.set_tile_height(self._text_tile_height)
         self.text_box_layout.finalise_to_new()
 
     def redraw_from_text_block(self) -> None:
@@ -998,7 +1012,7 @@ class UITextBox(UIElement, IUITextOwnerInterface):
     def _setup_final_text_box_image(self, drawable_area: pygame.Rect):
         if (
             self.text_box_layout is not None
-            and self.text_box_layout.finalised_surface is not None
+            and self.text_box_layout.is_finalised()
             and self.background_surf is not None
         ):
             new_image = pygame.surface.Surface(
@@ -1006,9 +1020,8 @@ class UITextBox(UIElement, IUITextOwnerInterface):
             )
             new_image.fill(pygame.Color(0, 0, 0, 0))
             basic_blit(new_image, self.background_surf, (0, 0))
-            basic_blit(
+            self.text_box_layout.blit_finalised_view_to_surf(
                 new_image,
-                self.text_box_layout.finalised_surface,
                 (
                     (
                         (
@@ -1151,6 +1164,7 @@ class UITextBox(UIElement, IUITextOwnerInterface):
             self.selection_in_progress = False
 
         if should_redraw_from_layout:
+            self._clear_text_tiles()
             self.redraw_from_text_block()
 
         return consumed_event
@@ -1691,12 +1705,166 @@ class UITextBox(UIElement, IUITextOwnerInterface):
                     )
                 self._redraw_from_text_block_and_finalise_hyperlinks()
 
+    def remove_lines_from_start(self, line_count: int):
+        """
+        Removes lines of appended text from the top of the text box. A line is everything up to
+        and including a line break, so a single line may wrap over several rows of the text box.
+
+        When all the text in the box was added with append_html_text() the remaining text is
+        shuffled up without being parsed or laid out again, which makes this a cheap way to
+        keep a long-running log to a fixed size.
+
+        :param line_count: The number of lines to remove.
+        """
+        if line_count <= 0:
+            return
+        line_break_ends = []
+        for match in _LINE_BREAK_REGEX.finditer(self.appended_text):
+            if match.group() == "\n":
+                if self._pre_parsing_enabled:
+                    line_break_ends.append(match.end())
+            elif not self.plain_text_display_only:
+                line_break_ends.append(match.end())
+        line_count = min(line_count, len(line_break_ends))
+        if line_count == 0:
+            return
+        self.appended_text = self.appended_text[line_break_ends[line_count - 1] :]
+
+        if (
+            self.text_box_layout is None
+            or len(self.html_text) != 0
+            or self.placeholder_text is not None
+        ):
+            self._reparse_and_rebuild()
+            return
+
+        rows_to_remove = 0
+        lines_found = 0
+        for row in self.text_box_layout.layout_rows:
+            rows_to_remove += 1
+            if row.last_chunk_is_line_break():
+                lines_found += 1
+                if lines_found == line_count:
+                    break
+        if lines_found != line_count:
+            # the layout doesn't match up with the text, start again from the text
+            self._reparse_and_rebuild()
+            return
+
+        old_layout_height = self.text_box_layout.layout_rect.height
+        removed_height = (
+            self.text_box_layout.layout_rows[rows_to_remove].y
+            - self.text_box_layout.layout_rect.y
+            if rows_to_remove < len(self.text_box_layout.layout_rows)
+            else old_layout_height
+        )
+        self.text_box_layout.remove_rows_from_start(rows_to_remove)
+        if self.scroll_bar is not None:
+            # keep the same text in view, if it is still there
+            new_layout_height = self.text_box_layout.layout_rect.height
+            self.scroll_bar.start_percentage = min(
+                max(
+                    0.0,
+                    (
+                        self.scroll_bar.start_percentage * old_layout_height
+                        - removed_height
+                    )
+                    / new_layout_height,
+                ),
+                max(0.0, 1.0 - (self.text_wrap_rect[3] / new_layout_height)),
+            )
+            self.scroll_bar.scroll_position = (
+                self.scroll_bar.start_percentage * self.scroll_bar.scrollable_height
+            )
+        self._redraw_from_text_block_and_finalise_hyperlinks()
+
+    def set_tiled_finalisation_mode(self, is_active: bool, tile_height: int = 256):
+        """
+        Switch drawing the text of this text box in tiles on or off.
+
+        Normally all the text is drawn to one surface as tall as the text, which for a long
+        log or document can take up a lot of memory, and is all redrawn whenever the text
+        changes. In tiled mode only the tiles of text around the visible part of the box are
+        drawn, and they are redrawn as the box is scrolled, so the memory used stays the same
+        however long the text gets.
+
+        Tiled mode is meant for text that is displayed and scrolled, though it also works for
+        edited text, where the tiles under an edit are redrawn; text effects need the whole
+        text drawn, so don't use it with them.
+
+        :param is_active: True to draw the text in tiles.
+        :param tile_height: The height of each tile of text in pixels.
+        """
+        self._text_tile_height = tile_height if is_active else None
+        if self.text_box_layout is not None:
+            self.text_box_layout.set_tile_height(self._text_tile_height)
+            self.redraw_from_text_block()
+
+    def _redraw_link_chunks(
+        self, chunks: List[HyperlinkTextChunk], height_adjustment: int
+    ):
+        """
+        Redraw just the parts of this text box's image covered by some hyperlink chunks,
+        after their hover state has changed, instead of building a whole new image.
+
+        :param chunks: The hyperlink chunks to redraw.
+        :param height_adjustment: How far the text is scrolled down, in pixels.
+        """
+        if (
+            self.text_box_layout is None
+            or not self.text_box_layout.is_finalised()
+            or self.background_surf is None
+            or self.image is None
+            or self.image.get_size() != self.rect.size
+        ):
+            self._clear_text_tiles()
+            self.redraw_from_text_block()
+            return
+
+        drawable_area = self._calculate_drawable_area(height_adjustment)
+        text_origin = (
+            self.padding[0]
+            + self.border_width["left"]
+            + self.shadow_width
+            + self.rounded_corner_width_offsets[0],
+            self.padding[1]
+            + self.border_width["top"]
+            + self.shadow_width
+            + self.rounded_corner_height_offsets[0],
+        )
+        for chunk in chunks:
+            # a little extra around the chunk catches underlines and shadows
+            layout_area = chunk.inflate(4, 4).clip(drawable_area)
+            if layout_area.width == 0 or layout_area.height == 0:
+                continue
+            self.text_box_layout.invalidate_finalised_area(layout_area)
+            image_area = pygame.Rect(
+                (
+                    text_origin[0] + layout_area.x - drawable_area.x,
+                    text_origin[1] + layout_area.y - drawable_area.y,
+                ),
+                layout_area.size,
+            )
+            self.image.fill(pygame.Color(0, 0, 0, 0), image_area)
+            basic_blit(self.image, self.background_surf, image_area, image_area)
+            self.text_box_layout.blit_finalised_view_to_surf(
+                self.image, image_area.topleft, layout_area, drop_distant_tiles=False
+            )
+        self.dirty = True
+
+    def _clear_text_tiles(self):
+        # hyperlink chunks can't redraw themselves on to tiles, so throw the tiles away to be
+        # drawn again with the chunks' new styles
+        if self.text_box_layout is not None and self._text_tile_height is not None:
+            self.text_box_layout.finalise_to_new()
+
     def _redraw_from_text_block_and_finalise_hyperlinks(self):
         """
         Redraw the text block and finalize hyperlinks.
         """
         self.redraw_from_text_block()
         self.link_hover_chunks = []
+        self._hovered_link_chunks = []
         if self.text_box_layout is not None:
             self.text_box_layout.add_chunks_to_hover_group(self.link_hover_chunks)
 
@@ -143,8 +143,11 @@ class UITextEntryBox(UITextBox):
             self.text_box_layout.layout_rows
         ):
             self.text_box_rows = len(self.text_box_layout.layout_rows)
-            self._align_all_text_rows()
-            self.redraw_from_chunks()
+            # edits redraw the rows they change, but centred or bottom aligned text moves
+            # every row when the number of rows changes
+            if self.text_vert_alignment in ("center", "bottom"):
+                self._align_all_text_rows()
+                self.redraw_from_chunks()
 
         if (
             self.cursor_blink_delay_after_moving_acc
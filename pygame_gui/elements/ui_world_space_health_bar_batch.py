@@ -0,0 +1,386 @@
+from typing import Union, Dict, Iterable, List, Optional, Tuple
+
+import pygame
+
+from pygame_gui.core import ObjectID
+from pygame_gui.core.interfaces import (
+    IContainerLikeInterface,
+    IUIManagerInterface,
+    IUIElementInterface,
+    IColourGradientInterface,
+)
+from pygame_gui.core import UIElement
+from pygame_gui.core.drawable_shapes import RectDrawableShape, RoundedRectangleShape
+from pygame_gui.core.gui_type_hints import Coordinate, RectLike, SpriteWithHealth
+
+
+class UIWorldSpaceHealthBarBatch(UIElement):
+    """
+    Displays health bars above lots of sprites in 'world space' with a single UI element, for
+    games with far too many units to give each one its own UIWorldSpaceHealthBar.
+
+    The batch covers a view of the game world, usually the whole screen. Each update it reads
+    the position and health of every monitored sprite, and draws the bars of those inside the
+    view on to its image in one go, copying them from an atlas of the bar pre-drawn at every
+    whole pixel of fill. Bars are themed in the same way as UIWorldSpaceHealthBar, and don't
+    block the mouse from hovering elements below them.
+
+    Sprites passed to this class must have the attributes 'rect', 'health_capacity' and
+    'current_health'.
+
+    :param relative_rect: The rectangle of the view of the game world the bars are drawn in.
+    :param bar_size: The size of each health bar.
+    :param sprites_to_monitor: The sprites to display the health of to begin with.
+    :param manager: The UIManager that manages this element. If not provided or set to None,
+                    it will try to use the first UIManager that was created by your application.
+    :param container: The container that this element is within. If not provided or set to None
+                      will be the root window's container.
+    :param parent_element: The element this element 'belongs to' in the theming hierarchy.
+    :param object_id: A custom defined ID for fine-tuning of theming.
+    :param anchors: A dictionary describing what this element's relative_rect is relative to.
+    :param visible: Whether the element is visible by default. Warning - container visibility
+                    may override this.
+    """
+
+    element_id = "world_space_health_bar"
+
+    def __init__(
+        self,
+        relative_rect: RectLike,
+        bar_size: Coordinate,
+        sprites_to_monitor: Optional[Iterable[SpriteWithHealth]] = None,
+        manager: Optional[IUIManagerInterface] = None,
+        container: Optional[IContainerLikeInterface] = None,
+        parent_element: Optional[UIElement] = None,
+        object_id: Optional[Union[ObjectID, str]] = None,
+        anchors: Optional[Dict[str, Union[str, IUIElementInterface]]] = None,
+        visible: int = 1,
+    ):
+        super().__init__(
+            relative_rect,
+            manager,
+            container,
+            starting_height=1,
+            layer_thickness=1,
+            anchors=anchors,
+            visible=visible,
+            parent_element=parent_element,
+            object_id=object_id,
+            element_id=[self.element_id],
+        )
+
+        self.bar_size = (int(bar_size[0]), int(bar_size[1]))
+        self.camera_position = (0, 0)
+
+        # the monitored sprites, and where and how full their bars were last drawn
+        self.sprites: List[SpriteWithHealth] = []
+        self.bar_positions: List[Tuple[int, int]] = []
+        self.bar_filled_widths: List[int] = []
+
+        self.follow_sprite_offset = (0, 0)
+        self.hover_height = 0
+        self.shape = "rectangle"
+        self.border_colour: pygame.Color | IColourGradientInterface = pygame.Color(
+            0, 0, 0
+        )
+        self.bar_filled_colour: pygame.Color | IColourGradientInterface = pygame.Color(
+            0, 0, 0
+        )
+        self.bar_unfilled_colour: pygame.Color | IColourGradientInterface = (
+            pygame.Color(0, 0, 0)
+        )
+
+        self.capacity_width = 0
+        self.capacity_x = 0
+        self.bar_atlas: Optional[pygame.Surface] = None
+        self._atlas_areas: List[pygame.Rect] = []
+        self._drawn_blits: List[Tuple[pygame.Surface, Tuple[int, int], pygame.Rect]]
+        self._drawn_blits = []
+        self._bars_changed = True
+
+        self._set_image(None)
+
+        if sprites_to_monitor is not None:
+            self.add_sprites(sprites_to_monitor)
+
+        self.rebuild_from_changed_theme_data()
+
+    def add_sprites(self, sprites: Iterable[SpriteWithHealth]):
+        """
+        Start displaying the health of some more sprites.
+
+        :param sprites: The sprites to monitor.
+        """
+        for sprite in sprites:
+            if not hasattr(sprite, "health_capacity"):
+                raise AttributeError("Sprite does not have health_capacity attribute")
+            if not hasattr(sprite, "current_health"):
+                raise AttributeError("Sprite does not have current_health attribute")
+            self.sprites.append(sprite)
+            self.bar_positions.append((0, 0))
+            self.bar_filled_widths.append(0)
+            self._bars_changed = True
+
+    def add_sprite(self, sprite: SpriteWithHealth):
+        """
+        Start displaying the health of a sprite.
+
+        :param sprite: The sprite to monitor.
+        """
+        self.add_sprites([sprite])
+
+    def remove_sprite(self, sprite: SpriteWithHealth):
+        """
+        Stop displaying the health of a sprite.
+
+        :param sprite: The sprite to stop monitoring.
+        """
+        for index, monitored_sprite in enumerate(self.sprites):
+            if monitored_sprite is sprite:
+                del self.sprites[index]
+                del self.bar_positions[index]
+                del self.bar_filled_widths[index]
+                self._bars_changed = True
+                return
+
+    def clear_sprites(self):
+        """
+        Stop displaying the health of all the monitored sprites.
+        """
+        self.sprites.clear()
+        self.bar_positions.clear()
+        self.bar_filled_widths.clear()
+        self._bars_changed = True
+
+    def set_camera_position(self, position: Coordinate):
+        """
+        Set the position in the game world shown at the top left of this batch's view. Bars are
+        drawn at their sprite's position minus the camera position.
+
+        :param position: The world position of the camera.
+        """
+        self.camera_position = (int(position[0]), int(position[1]))
+
+    def hover_point(self, hover_x: float, hover_y: float) -> bool:
+        """
+        Health bars are decoration, so the batch never counts as hovered and never stops the
+        mouse from reaching the elements below it.
+
+        :param hover_x: The x (horizontal) position of the point.
+        :param hover_y: The y (vertical) position of the point.
+
+        :return: Always False.
+        """
+        return False
+
+    def rebuild(self):
+        """
+        Rebuild the bar atlas the health bars are drawn from, and redraw the bars.
+        """
+        bar_rect = pygame.Rect((0, 0), self.bar_size)
+        self.capacity_x = self.border_width["left"] + self.shadow_width
+        self.capacity_width = max(
+            0,
+            bar_rect.width
+            - (self.shadow_width * 2)
+            - (self.border_width["left"] + self.border_width["right"]),
+        )
+
+        theming_parameters = {
+            "normal_bg": self.bar_unfilled_colour,
+            "normal_border": self.border_colour,
+            "border_width": self.border_width,
+            "shadow_width": self.shadow_width,
+            "shape_corner_radius": self.shape_corner_radius,
+            "border_overlap": self.border_overlap,
+        }
+        filled_theming_parameters = theming_parameters.copy()
+        filled_theming_parameters["normal_bg"] = self.bar_filled_colour
+
+        if self.shape == "rounded_rectangle":
+            unfilled_shape = RoundedRectangleShape(
+                bar_rect, theming_parameters, ["normal"], self.ui_manager
+            )
+            filled_shape = RoundedRectangleShape(
+                bar_rect, filled_theming_parameters, ["normal"], self.ui_manager
+            )
+        else:
+            unfilled_shape = RectDrawableShape(
+                bar_rect, theming_parameters, ["normal"], self.ui_manager
+            )
+            filled_shape = RectDrawableShape(
+                bar_rect, filled_theming_parameters, ["normal"], self.ui_manager
+            )
+        unfilled_surface = unfilled_shape.get_surface("normal")
+        filled_surface = filled_shape.get_surface("normal")
+
+        # one row of the atlas for each whole pixel the bar can be filled by
+        self.bar_atlas = pygame.Surface(
+            (bar_rect.width, bar_rect.height * (self.capacity_width + 1)),
+            flags=pygame.SRCALPHA,
+            depth=32,
+        )
+        self._atlas_areas = []
+        for filled_width in range(self.capacity_width + 1):
+            atlas_area = bar_rect.move(0, bar_rect.height * filled_width)
+            self.bar_atlas.blit(
+                unfilled_surface, atlas_area, special_flags=pygame.BLEND_RGBA_ADD
+            )
+            if filled_width > 0:
+                filled_area = pygame.Rect(
+                    self.capacity_x, 0, filled_width, bar_rect.height
+                )
+                self.bar_atlas.fill(
+                    pygame.Color("#00000000"),
+                    filled_area.move(atlas_area.topleft),
+                )
+                self.bar_atlas.blit(
+                    filled_surface,
+                    filled_area.move(atlas_area.topleft),
+                    filled_area,
+                    special_flags=pygame.BLEND_RGBA_ADD,
+                )
+            self._atlas_areas.append(atlas_area)
+
+        self._set_image(pygame.Surface(self.rect.size, flags=pygame.SRCALPHA, depth=32))
+        self._bars_changed = True
+        self.redraw_bars()
+
+    def update(self, time_delta: float):
+        """
+        Read the latest positions and health of the monitored sprites and redraw the bars.
+
+        :param time_delta: time passed in seconds between one call to this method and the next.
+        """
+        super().update(time_delta)
+        if self.alive():
+            self.redraw_bars()
+
+    def redraw_bars(self):
+        """
+        Read the positions and health of the monitored sprites and draw the bars inside the
+        view on to the batch's image. Nothing is drawn if no bar has moved or changed by a whole
+        pixel since the last time.
+        """
+        if self.bar_atlas is None or self.image is None:
+            return
+        x_offset = self.follow_sprite_offset[0] - self.camera_position[0]
+        y_offset = (
+            self.follow_sprite_offset[1] - self.hover_height - self.camera_position[1]
+        )
+        capacity_width = self.capacity_width
+        bar_positions = self.bar_positions
+        bar_filled_widths = self.bar_filled_widths
+
+        changed = self._bars_changed
+        for index, sprite in enumerate(self.sprites):
+            sprite_rect = sprite.rect
+            bar_position = (
+                int(sprite_rect.x + x_offset),
+                int(sprite_rect.y + y_offset),
+            )
+            health_capacity = max(sprite.health_capacity, 1)
+            filled_width = int(
+                min(max(sprite.current_health / health_capacity, 0.0), 1.0)
+                * capacity_width
+            )
+            if (
+                bar_position != bar_positions[index]
+                or filled_width != bar_filled_widths[index]
+            ):
+                bar_positions[index] = bar_position
+                bar_filled_widths[index] = filled_width
+                changed = True
+
+        if not changed:
+            return
+        self._bars_changed = False
+
+        bar_width, bar_height = self.bar_size
+        view_width, view_height = self.rect.size
+        bar_atlas = self.bar_atlas
+        atlas_areas = self._atlas_areas
+        self._drawn_blits = [
+            (bar_atlas, (bar_x, bar_y), atlas_areas[filled_width])
+            for (bar_x, bar_y), filled_width in zip(bar_positions, bar_filled_widths)
+            if bar_x < view_width
+            and bar_y < view_height
+            and bar_x + bar_width > 0
+            and bar_y + bar_height > 0
+        ]
+        # draw straight on to the image rather than copying a new one in every frame
+        self.image.fill(pygame.Color("#00000000"))
+        self.image.blits(self._drawn_blits, doreturn=False)
+        self.dirty = True
+
+    def set_dimensions(self, dimensions: Coordinate, clamp_to_container: bool = False):
+        """
+        Set the size of the batch's view of the game world.
+
+        :param dimensions: The new dimensions to set.
+        :param clamp_to_container: Whether we should clamp the dimensions to the
+                                   dimensions of the container or not.
+        """
+        super().set_dimensions(dimensions, clamp_to_container)
+        self.rebuild()
+
+    def rebuild_from_changed_theme_data(self):
+        """
+        Called by the UIManager to check the theming data and rebuild whatever needs rebuilding
+        for this element when the theme data has changed.
+        """
+        has_any_changed = False
+
+        if self._check_misc_theme_data_changed(
+            attribute_name="follow_sprite_offset",
+            default_value=(0, 0),
+            casting_func=self.tuple_extract,
+        ):
+            has_any_changed = True
+
+        if self._check_misc_theme_data_changed(
+            attribute_name="shape",
+            default_value="rectangle",
+            casting_func=str,
+            allowed_values=["rectangle", "rounded_rectangle"],
+        ):
+            has_any_changed = True
+
+        if self._check_shape_theming_changed(
+            defaults={
+                "border_width": {"left": 1, "right": 1, "top": 1, "bottom": 1},
+                "shadow_width": 2,
+                "border_overlap": 1,
+                "shape_corner_radius": [2, 2, 2, 2],
+            }
+        ):
+            has_any_changed = True
+
+        if self._check_misc_theme_data_changed(
+            attribute_name="hover_height", default_value=1, casting_func=int
+        ):
+            has_any_changed = True
+
+        border_colour = self.ui_theme.get_colour_or_gradient(
+            "normal_border", self.combined_element_ids
+        )
+        if border_colour != self.border_colour:
+            self.border_colour = border_colour
+            has_any_changed = True
+
+        bar_unfilled_colour = self.ui_theme.get_colour_or_gradient(
+            "unfilled_bar", self.combined_element_ids
+        )
+        if bar_unfilled_colour != self.bar_unfilled_colour:
+            self.bar_unfilled_colour = bar_unfilled_colour
+            has_any_changed = True
+
+        bar_filled_colour = self.ui_theme.get_colour_or_gradient(
+            "filled_bar", self.combined_element_ids
+        )
+        if bar_filled_colour != self.bar_filled_colour:
+            self.bar_filled_colour = bar_filled_colour
+            has_any_changed = True
+
+        if has_any_changed or self.bar_atlas is None:
+            self.rebuild()
@@ -1,7 +1,10 @@
 import contextlib
 import os
 import io
-from typing import Tuple, List, Dict, Union, Set, Optional
+import time
+
+from collections import deque
+from typing import Tuple, List, Dict, Union, Set, Optional, Deque
 
 import pygame
 import i18n  # type: ignore
@@ -24,6 +27,7 @@ from pygame_gui.core.ui_container import UIContainer
 from pygame_gui.core.resource_loaders import (
     IResourceLoader,
     BlockingThreadedResourceLoader,
+    StreamingResourceLoader,
 )
 from pygame_gui.core.utility import (
     get_default_manager,
@@ -31,6 +35,7 @@ from pygame_gui.core.utility import (
 )
 from pygame_gui.core.package_resource import PackageResource
 from pygame_gui.core.layered_gui_group import LayeredGUIGroup
+from pygame_gui.core.ui_profiler import UIProfiler
 from pygame_gui.core import ObjectID
 
 from pygame_gui.elements import UITooltip
@@ -46,6 +51,8 @@ class UIManager(IUIManagerInterface):
     :param window_resolution: window resolution.
     :param theme_path: relative file path to theme or theme dictionary.
     :param enable_live_theme_updates: Lets the theme update in-game after we edit the theme file
+    :param shadow_cache_path: An optional directory to keep generated shadow corners and edges in
+                              between runs of the program, to speed up loading themes.
     """
 
     def __init__(
@@ -58,6 +65,7 @@ class UIManager(IUIManagerInterface):
         resource_loader: Optional[IResourceLoader] = None,
         starting_language: str = "en",
         translation_directory_paths: Optional[List[str]] = None,
+        shadow_cache_path: Optional[Union[str, os.PathLike]] = None,
     ):
         super().__init__()
         if get_default_manager() is None:
@@ -85,13 +93,23 @@ class UIManager(IUIManagerInterface):
             auto_load = False
             self.resource_loader = resource_loader
 
+        self._shadow_cache_path = shadow_cache_path
         self.window_resolution: Tuple[int, int] = window_resolution
         self.ui_theme: IUIAppearanceThemeInterface = self.create_new_theme(theme_path)
+        self.ui_theme.clear_theme_changes()
 
         self.universal_empty_surface = pygame.surface.Surface(
             (0, 0), flags=pygame.SRCALPHA, depth=32
         )
+        self.profiler = UIProfiler()
         self.ui_group = LayeredGUIGroup()
+        self.ui_group.profiler = self.profiler
+        self.ui_group.set_spatial_index_bounds(
+            pygame.Rect((0, 0), self.window_resolution)
+        )
+        # elements that need checking for hover every frame, wherever the mouse is, because
+        # they were hovered or blocking hover last frame
+        self._hover_check_elements: Set[IUIElementInterface] = set()
 
         self.focused_set: Optional[set[IUIElementInterface]] = None
         self.root_container: Optional[UIContainer] = (
@@ -116,12 +134,19 @@ class UIManager(IUIManagerInterface):
         self.live_theme_updates = enable_live_theme_updates
         self.theme_update_acc = 0.0
         self.theme_update_check_interval = 1.0
+        self._background_theme_reload_active = False
+        self._theme_file_watcher_running = False
+        self._theme_rebuild_time_budget = 0.004
+        self._theme_rebuild_queue: Deque[IUIElementInterface] = deque()
 
         self.mouse_double_click_time = 0.5
         self.mouse_position = (0, 0)
         self.mouse_pos_scale_factor = [1.0, 1.0]
 
         self.visual_debug_active = False
+        self._shape_cache_memory_budget: Optional[int] = None
+        self.dirty_rect_mode_active = False
+        self._dirty_rect_background: Optional[pygame.Surface] = None
 
         self.resizing_window_cursors: Dict[str, pygame.Cursor] | None = None
         self._load_default_cursors()
@@ -164,7 +189,9 @@ class UIManager(IUIManagerInterface):
         Create a new theme using self information.
         :param theme_path: relative file path to theme or theme dictionary.
         """
-        theme = UIAppearanceTheme(self.resource_loader, self._locale)
+        theme = UIAppearanceTheme(
+            self.resource_loader, self._locale, self._shadow_cache_path
+        )
         if theme_path is not None:
             theme.load_theme(theme_path)
         return theme
@@ -248,6 +275,7 @@ class UIManager(IUIManagerInterface):
         """
         self.window_resolution = window_resolution
         self.ui_window_stack.window_resolution = window_resolution
+        self.ui_group.set_spatial_index_bounds(pygame.Rect((0, 0), window_resolution))
         if self.root_container is not None:
             self.root_container.set_dimensions(window_resolution)
 
@@ -284,6 +312,10 @@ class UIManager(IUIManagerInterface):
         :param event:  pygame.event.Event - the event to process.
         :return: A boolean indicating whether the event was consumed.
         """
+        with self.profiler.time_section("process_events"):
+            return self._process_event_by_layer(event)
+
+    def _process_event_by_layer(self, event: pygame.event.Event) -> bool:
         consumed_event = False
         sorting_consumed_event = False
         sorted_layers = sorted(self.ui_group.layers(), reverse=True)
@@ -341,8 +373,15 @@ class UIManager(IUIManagerInterface):
                 if not update_all_sprites and sprite.ui_theme is not self.ui_theme:
                     continue
                 sprite.ui_theme = theme
+        if self._theme_file_watcher_running:
+            self.ui_theme.stop_background_reload_checks()
+            self._theme_file_watcher_running = False
         self.ui_theme = theme
+        self._update_theme_file_watcher()
+        if self._shape_cache_memory_budget is not None:
+            self.ui_theme.shape_cache.set_memory_budget(self._shape_cache_memory_budget)
         self.rebuild_all_from_changed_theme_data(self.ui_theme)
+        self.ui_theme.clear_theme_changes()
 
     def rebuild_all_from_changed_theme_data(
         self, theme: Optional[IUIAppearanceThemeInterface] = None
@@ -358,6 +397,41 @@ class UIManager(IUIManagerInterface):
                     continue
                 sprite.rebuild_from_changed_theme_data()
 
+    def rebuild_changed_from_theme_data(self, theme: IUIAppearanceThemeInterface):
+        """
+        Rebuild only the elements whose theme data has changed since the theme's record of
+        changes was last cleared, then clear it. Changing one colour in a theme file only
+        rebuilds the elements that use that colour's theme block, rather than everything.
+
+        :param theme: the theme that has changed.
+        """
+        for element in self._get_elements_with_changed_theme_data(theme):
+            element.rebuild_from_changed_theme_data()
+        theme.clear_theme_changes()
+
+    def _get_elements_with_changed_theme_data(
+        self, theme: IUIAppearanceThemeInterface
+    ) -> List[IUIElementInterface]:
+        """
+        Find the elements using a theme whose theme data has changed.
+
+        :param theme: the theme that has changed.
+
+        :return: A list of elements.
+        """
+        changed_elements = []
+        for sprite in self.ui_group.sprites():
+            if isinstance(sprite, IUIElementInterface) and sprite.ui_theme is theme:
+                combined_ids = theme.build_all_combined_ids(
+                    sprite.get_element_base_ids(),
+                    sprite.get_element_ids(),
+                    sprite.get_class_ids(),
+                    sprite.get_object_ids(),
+                )
+                if theme.get_changed_theme_categories(combined_ids):
+                    changed_elements.append(sprite)
+        return changed_elements
+
     def update(self, time_delta: float):
         """
         From here all our UI elements are updated and which element is currently 'hovered' is
@@ -372,25 +446,60 @@ class UIManager(IUIManagerInterface):
 
         :param time_delta: The time passed since the last call to update, in seconds.
         """
-
-        if self.live_theme_updates:
-            self.theme_update_acc += time_delta
-            if self.theme_update_acc > self.theme_update_check_interval:
-                self.theme_update_acc = 0.0
+        if self.profiler.has_section_time("update"):
+            # updated twice without drawing, so count it as a new frame
+            self.profiler.end_frame(self.ui_theme.shape_cache)
+
+        with self.profiler.time_section("theme_checks"):
+            self._update_theme_file_watcher()
+            if self.live_theme_updates and self._background_theme_reload_active:
+                # the watcher thread has done the slow part, so collecting a new theme is cheap
+                # enough to check for every frame
                 if self.ui_theme.check_need_to_reload():
-                    self.rebuild_all_from_changed_theme_data(self.ui_theme)
-
-        if self.ui_theme.check_need_to_rebuild_data_manually_changed():
-            self.rebuild_all_from_changed_theme_data(self.ui_theme)
-
-        self.ui_theme.update_caching(time_delta)
-
-        self._update_mouse_position()
-        self._handle_hovering(time_delta)
+                    # an element still waiting from an earlier reload only needs one rebuild
+                    self._theme_rebuild_queue = deque(
+                        dict.fromkeys(
+                            [
+                                *self._theme_rebuild_queue,
+                                *self._get_elements_with_changed_theme_data(
+                                    self.ui_theme
+                                ),
+                            ]
+                        )
+                    )
+                    self.ui_theme.clear_theme_changes()
+            elif self.live_theme_updates:
+                self.theme_update_acc += time_delta
+                if self.theme_update_acc > self.theme_update_check_interval:
+                    self.theme_update_acc = 0.0
+                    if self.ui_theme.check_need_to_reload():
+                        self.rebuild_changed_from_theme_data(self.ui_theme)
+
+            if self._theme_rebuild_queue:
+                self._rebuild_queued_elements()
+
+            if self.ui_theme.check_need_to_rebuild_data_manually_changed():
+                self.rebuild_changed_from_theme_data(self.ui_theme)
+
+            if isinstance(self.resource_loader, StreamingResourceLoader):
+                # swap placeholder fonts and images for any resources that have arrived
+                self.resource_loader.update()
+                if self.resource_loader.delivered_resources:
+                    self.ui_theme.record_delivered_resources(
+                        self.resource_loader.delivered_resources
+                    )
+                    self.rebuild_changed_from_theme_data(self.ui_theme)
+
+            self.ui_theme.update_caching(time_delta)
+
+        with self.profiler.time_section("hovering"):
+            self._update_mouse_position()
+            self._handle_hovering(time_delta)
 
         self.set_text_hovered(False)  # reset the text hovered status each loop
 
-        self.ui_group.update(time_delta)
+        with self.profiler.time_section("update"):
+            self.ui_group.update(time_delta)
 
         # handle mouse cursors
         if self.text_hovered:
@@ -423,26 +532,48 @@ class UIManager(IUIManagerInterface):
 
     def _handle_hovering(self, time_delta: float):
         hover_handled = False
-        sorted_layers = sorted(self.ui_group.layers(), reverse=True)
-        for layer in sorted_layers:
-            layer_elements = self.ui_group.get_sprites_from_layer(layer)
-            layer_elements.reverse()
-            for ui_element in layer_elements:
-                # Only check hover for visible elements - ignore hidden elements
-                # we need to check hover even after already found what we are hovering,
-                # so, we can unhover previously hovered stuff
-                if (
-                    isinstance(ui_element, IUIElementInterface)
-                    and ui_element.visible
-                    and ui_element.check_hover(time_delta, hover_handled)
-                ):
-                    if ui_element != self.root_container:
-                        hover_handled = True
-                        self.hovering_any_ui_element = True
-                    else:
-                        # if we are just hovering over the root container
-                        # set 'hovering any' to False
-                        self.hovering_any_ui_element = False
+        for ui_element in self._get_hover_candidates():
+            # Only check hover for visible elements - ignore hidden elements
+            # we need to check hover even after already found what we are hovering,
+            # so, we can unhover previously hovered stuff
+            if (
+                not isinstance(ui_element, IUIElementInterface)
+                or not ui_element.visible
+            ):
+                continue
+            if ui_element.check_hover(time_delta, hover_handled):
+                self._hover_check_elements.add(ui_element)
+                if ui_element != self.root_container:
+                    hover_handled = True
+                    self.hovering_any_ui_element = True
+                else:
+                    # if we are just hovering over the root container
+                    # set 'hovering any' to False
+                    self.hovering_any_ui_element = False
+            elif not ui_element.hovered:
+                self._hover_check_elements.discard(ui_element)
+
+    def _get_hover_candidates(self) -> List[IUIElementInterface]:
+        """
+        Find the elements that might be hovered this frame, sorted top first. Uses the sprite
+        group's spatial index to find elements under the mouse pointer, then adds windows (which
+        can be hovered outside their rects by their resizing edges) and anything hovered last
+        frame, so it gets the chance to un-hover.
+        """
+        mouse_x, mouse_y = self.mouse_position
+        near_mouse = self.ui_group.get_sprites_near_point(mouse_x, mouse_y)
+        if near_mouse is None:
+            return list(reversed(self.ui_group.sprites()))
+        candidates = set(near_mouse)
+        candidates.update(self.ui_window_stack.stack)
+        candidates.update(self.ui_window_stack.top_stack)
+        candidates.update(self._hover_check_elements)
+        self._hover_check_elements = {
+            element
+            for element in self._hover_check_elements
+            if self.ui_group.has_internal(element)
+        }
+        return self.ui_group.sort_top_first(candidates)
 
     def get_mouse_position(self) -> Tuple[int, int]:
         """
@@ -450,11 +581,14 @@ class UIManager(IUIManagerInterface):
         """
         return self.mouse_position
 
-    def draw_ui(self, window_surface: pygame.surface.Surface):
+    def draw_ui(self, window_surface: pygame.surface.Surface) -> List[pygame.Rect]:
         """
         Draws all the UI elements on to a surface passed in, usually an opaque surface the size of the screen or window.
         Generally you want this to be after the rest of your game sprites have been drawn.
 
+        When dirty rectangle mode is active (see set_dirty_rect_mode()) only the areas of the
+        surface where the UI has changed since the last frame are redrawn.
+
         If you want to do something particularly unusual with drawing you may have to write your
         own UI manager.
 
@@ -466,8 +600,145 @@ class UIManager(IUIManagerInterface):
          You can read more about premultiplied alpha in this short tutorial:
          https://pyga.me/docs/tutorials/en/premultiplied-alpha.html
 
+        :return: A list of the rectangles on the surface that were drawn to. Pass it to
+                 pygame.display.update() to only update the changed parts of the display.
+        """
+        with self.profiler.time_section("draw"):
+            if self.dirty_rect_mode_active:
+                drawn_rects = self.ui_group.draw_dirty(
+                    window_surface, self._dirty_rect_background
+                )
+            else:
+                self.ui_group.draw(window_surface)
+                drawn_rects = [window_surface.get_rect()]
+        self.profiler.end_frame(self.ui_theme.shape_cache)
+        return drawn_rects
+
+    def set_dirty_rect_mode(
+        self, is_active: bool, background: Optional[pygame.Surface] = None
+    ):
+        """
+        Turn dirty rectangle drawing on or off. In this mode draw_ui() keeps track of which UI
+        elements have changed their image or position since the previous frame and only redraws
+        those parts of the window surface, returning the changed areas so you can pass them to
+        pygame.display.update().
+
+        This mode assumes nothing else draws over the UI's parts of the window surface between
+        frames. Any areas you change yourself should be handled by you.
+
+        :param is_active: True to activate dirty rectangle mode and False to turn it off.
+        :param background: A surface the same size as the window surface that is used to
+                           restore the areas under changed UI elements before they are redrawn.
+                           Usually whatever your game draws behind the UI. If None the changed
+                           areas are not cleared first, which only looks right if the UI is
+                           opaque or you clear those areas yourself.
+        """
+        self.dirty_rect_mode_active = is_active
+        self._dirty_rect_background = background if is_active else None
+
+    def set_profiling_mode(self, is_active: bool, max_frames: Optional[int] = None):
+        """
+        Turn the UI profiler on or off. While it is on, a record of each frame is kept with the
+        time taken to process events, check the theme, handle hovering, update the elements and
+        draw the UI, along with how many of each type of element were updated and rebuilt and
+        how often shapes were found in the surface cache.
+
+        Query the records with get_profiler().
+
+        :param is_active: True to start recording frames and False to stop.
+        :param max_frames: The number of most recent frame records to keep. If None, the
+                           current limit is kept.
+        """
+        if max_frames is not None:
+            self.profiler.max_frames = max_frames
+        if is_active:
+            self.profiler.start()
+        else:
+            self.profiler.stop()
+
+    def set_background_theme_reload_mode(
+        self, is_active: bool, rebuild_time_budget: float = 0.004
+    ):
+        """
+        Turn background reloading of the live theme file on or off. In this mode the theme file
+        is checked for changes on a background thread, which also reads, parses and validates
+        any new version of it. The new theme data is then applied at the start of a frame and
+        the UI elements are rebuilt with it over as many frames as it takes to stay inside the
+        rebuild time budget.
+
+        Only the rebuilds are spread over frames. Applying the new data to the theme - resolving
+        prototypes, parsing colours and loading any new fonts and images - still happens all in
+        the one frame, on the main thread.
+
+        Only has an effect while live theme updates are enabled; the background thread is only
+        running while they are.
+
+        :param is_active: True to check the theme file on a background thread and False to go
+                          back to checking it on the main thread.
+        :param rebuild_time_budget: The most time to spend rebuilding elements with the new
+                                    theme each frame, in seconds. At least one element is
+                                    rebuilt each frame.
+        """
+        self._background_theme_reload_active = is_active
+        self._theme_rebuild_time_budget = rebuild_time_budget
+        self._update_theme_file_watcher()
+
+    def _update_theme_file_watcher(self):
+        """
+        Start or stop the theme's background file watcher, so it only runs while background
+        reloading and live theme updates are both turned on.
+        """
+        should_watch = self.live_theme_updates and self._background_theme_reload_active
+        if should_watch == self._theme_file_watcher_running:
+            return
+        if should_watch:
+            self.ui_theme.start_background_reload_checks(
+                self.theme_update_check_interval
+            )
+        else:
+            self.ui_theme.stop_background_reload_checks()
+        self._theme_file_watcher_running = should_watch
+
+    def _rebuild_queued_elements(self):
+        """
+        Rebuild elements waiting for a new theme, until this frame's time budget runs out.
+        """
+        deadline = time.perf_counter() + self._theme_rebuild_time_budget
+        while self._theme_rebuild_queue:
+            element = self._theme_rebuild_queue.popleft()
+            if element.alive():
+                element.rebuild_from_changed_theme_data()
+            if time.perf_counter() >= deadline:
+                break
+
+    def set_shape_cache_memory_budget(self, max_memory_bytes: Optional[int]):
+        """
+        Cap the memory used by the theme's cache of drawn shapes. Once the cache reaches its
+        budget, the least recently used shapes are evicted to make room for new ones. Useful on
+        hardware with little memory to spare.
+
+        :param max_memory_bytes: The most memory the shape cache may use, in bytes. None removes
+                                 the budget. The cache's memory is used a page at a time, so
+                                 the budget must be 0 or at least one page (4MB by default).
+        """
+        self.ui_theme.shape_cache.set_memory_budget(max_memory_bytes)
+        self._shape_cache_memory_budget = max_memory_bytes
+
+    def get_shape_cache_memory_usage(self) -> int:
+        """
+        Get the memory currently used by the theme's cache of drawn shapes.
+
+        :return: The memory used in bytes.
+        """
+        return self.ui_theme.shape_cache.get_memory_usage()
+
+    def get_profiler(self) -> UIProfiler:
+        """
+        Get the profiler that records what the UI does each frame while profiling mode is on.
+
+        :return: The UIProfiler.
         """
-        self.ui_group.draw(window_surface)
+        return self.profiler
 
     def add_font_paths(
         self,
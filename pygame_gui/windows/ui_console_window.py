@@ -1,5 +1,6 @@
 import html
-from typing import Union, Optional, List
+from collections import deque
+from typing import Union, Optional, List, Deque, Tuple
 
 import pygame
 
@@ -28,6 +29,14 @@ class UIConsoleWindow(UIWindow):
     :param object_id: The object ID for the window, used for theming - defaults to
                       '#console_window'
     :param visible: Whether the element is visible by default.
+    :param preload_bold_log_font: Whether to load the bold font used for output lines when the
+                                  window is created, rather than the first time it is needed.
+    :param always_on_top: Whether the window should always be drawn above other windows.
+    :param max_log_lines: The most lines to keep in the log. When set, the oldest lines are
+                          dropped from the top of the log as new ones arrive, and lines added
+                          in the same frame are laid out together in one go the next time the
+                          window updates. Defaults to None, for an unlimited log that is laid
+                          out every time a line is added.
     """
 
     def __init__(
@@ -39,6 +48,7 @@ class UIConsoleWindow(UIWindow):
         visible: int = 1,
         preload_bold_log_font: bool = True,
         always_on_top: bool = False,
+        max_log_lines: Optional[int] = None,
     ):
         super().__init__(
             rect,
@@ -60,6 +70,10 @@ class UIConsoleWindow(UIWindow):
         self.current_logged_command: Optional[str] = None
         self.logged_commands_below: List[str] = []
 
+        self.max_log_lines = max_log_lines
+        self._queued_log_text: Deque[Tuple[str, bool]] = deque()
+        self._log_line_count = 0
+
         self.command_entry = UITextEntryLine(
             relative_rect=pygame.rect.Rect(
                 (2, -32), (self.get_container().get_size()[0] - 4, 30)
@@ -162,9 +176,64 @@ class UIConsoleWindow(UIWindow):
         output_to_log = html.escape(text_to_add) if escape_html else text_to_add
         line_ending = "" if remove_line_break else "<br>"
         if is_bold:
-            self.log.append_html_text(f"<b>{output_to_log}</b>{line_ending}")
+            self._add_text_to_log(
+                f"<b>{output_to_log}</b>{line_ending}", not remove_line_break
+            )
+        else:
+            self._add_text_to_log(output_to_log + line_ending, not remove_line_break)
+
+    def set_max_log_lines(self, max_log_lines: Optional[int]) -> None:
+        """
+        Set the most lines to keep in the log. Any extra lines are dropped from the top of the
+        log the next time the window updates.
+
+        :param max_log_lines: The maximum number of lines, or None for an unlimited log.
+        """
+        self.max_log_lines = max_log_lines
+        if self.max_log_lines is None:
+            self._flush_queued_log_text()
+
+    def update(self, time_delta: float):
+        """
+        Called every update loop of our UI Manager. Lays out any lines queued up for the log
+        since the last update.
+
+        :param time_delta: The time in seconds between calls to update.
+        """
+        super().update(time_delta)
+        self._flush_queued_log_text()
+
+    def _add_text_to_log(self, text: str, ends_line: bool):
+        if self.max_log_lines is None:
+            self.log.append_html_text(text)
+            if ends_line:
+                self._log_line_count += 1
         else:
-            self.log.append_html_text(output_to_log + line_ending)
+            self._queued_log_text.append((text, ends_line))
+
+    def _flush_queued_log_text(self):
+        queued_line_count = sum(
+            1 for _, ends_line in self._queued_log_text if ends_line
+        )
+        if self.max_log_lines is not None:
+            # no point laying out lines that would be dropped again straight away
+            while queued_line_count > self.max_log_lines:
+                _, ends_line = self._queued_log_text.popleft()
+                if ends_line:
+                    queued_line_count -= 1
+            excess_line_count = (
+                self._log_line_count + queued_line_count - self.max_log_lines
+            )
+            if excess_line_count > 0:
+                self.log.remove_lines_from_start(excess_line_count)
+                self._log_line_count -= min(excess_line_count, self._log_line_count)
+
+        if self._queued_log_text:
+            self.log.append_html_text(
+                "".join(text for text, _ in self._queued_log_text)
+            )
+            self._queued_log_text.clear()
+        self._log_line_count += queued_line_count
 
     def process_event(self, event: pygame.event.Event) -> bool:
         """
@@ -202,7 +271,7 @@ class UIConsoleWindow(UIWindow):
             self.logged_commands_above.append(command_for_log)
             if self.should_logged_commands_escape_html:
                 command_for_log = html.escape(command_for_log)
-            self.log.append_html_text(self.log_prefix + command_for_log + "<br>")
+            self._add_text_to_log(self.log_prefix + command_for_log + "<br>", True)
             self.command_entry.set_text("")
 
             event_data = {
@@ -238,4 +307,6 @@ class UIConsoleWindow(UIWindow):
         self.current_logged_command = None
         self.logged_commands_below = []
 
+        self._queued_log_text.clear()
+        self._log_line_count = 0
         self.log.set_text("")
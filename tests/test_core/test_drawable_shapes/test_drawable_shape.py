@@ -43,6 +43,34 @@ class TestDrawableShapeState:
 
         assert normal_state.transition is None
 
+    def test_blended_result_reuses_surfaces(self, _init_pygame, default_ui_manager: UIManager):
+        normal_state = DrawableShapeState('normal')
+        normal_state.surface = pygame.Surface((20, 20), flags=pygame.SRCALPHA, depth=32)
+        normal_state.surface.fill(pygame.Color(200, 100, 0, 255))
+        selected_state = DrawableShapeState('selected')
+        selected_state.surface = pygame.Surface((20, 20), flags=pygame.SRCALPHA, depth=32)
+        selected_state.surface.fill(pygame.Color(0, 100, 200, 255))
+        states = {'normal': normal_state,
+                  'selected': selected_state}
+
+        transition = DrawableStateTransition(states=states,
+                                             start_state_id='normal',
+                                             target_state_id='selected',
+                                             duration=1.0)
+        transition.update(0.5)
+        first_result = transition.produce_blended_result()
+        assert first_result.get_at((10, 10)) == pygame.Color(100, 100, 100, 255)
+        assert transition.produce_blended_result() is first_result
+
+        transition.update(0.25)
+        second_result = transition.produce_blended_result()
+        assert second_result is first_result
+        assert second_result.get_at((10, 10)) == pygame.Color(50, 100, 150, 255)
+
+        # state surfaces are left untouched
+        assert normal_state.surface.get_at((10, 10)) == pygame.Color(200, 100, 0, 255)
+        assert selected_state.surface.get_at((10, 10)) == pygame.Color(0, 100, 200, 255)
+
 
 class TestDrawableShape:
     def test_creation(self, _init_pygame, default_ui_manager: UIManager):
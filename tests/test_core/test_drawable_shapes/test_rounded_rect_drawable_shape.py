@@ -369,6 +369,62 @@ class TestRoundedRectangleShape:
                                              aa_amount=2,
                                              clear=True)
 
+    def test_nine_slice_matches_supersampled_shape(self, _init_pygame, _display_surface_return_none,
+                                                   default_ui_manager: UIManager):
+        theming_parameters = {'text': '',
+                              'font': default_ui_manager.ui_theme.get_font([]),
+                              'normal_text': pygame.Color('#FFFFFF'),
+                              'normal_text_shadow': pygame.Color('#000000'),
+                              'shadow_width': 2,
+                              'border_width': 0,
+                              'shape_corner_radius': [3, 6, 9, 12],
+                              'normal_border': pygame.Color('#FFFFFF'),
+                              'normal_bg': pygame.Color('#4060A0'),
+                              'text_horiz_alignment': 'center',
+                              'text_vert_alignment': 'center'}
+        shape = RoundedRectangleShape(containing_rect=pygame.Rect(0, 0, 150, 60),
+                                      theming_parameters=theming_parameters,
+                                      states=['normal'], manager=default_ui_manager)
+        assert shape._get_nine_slice_corner_size(pygame.Color('#4060A0'),
+                                                 pygame.Color('#FFFFFF'), 0) is not None
+        nine_sliced = pygame.image.tobytes(shape.states['normal'].surface, 'RGBA')
+
+        shape._get_nine_slice_corner_size = lambda *args: None
+        shape.redraw_state('normal')
+        supersampled = pygame.image.tobytes(shape.states['normal'].surface, 'RGBA')
+
+        assert nine_sliced == supersampled
+
+    def test_nine_slice_source_is_shared(self, _init_pygame, _display_surface_return_none,
+                                         default_ui_manager: UIManager):
+        theming_parameters = {'text': '',
+                              'font': default_ui_manager.ui_theme.get_font([]),
+                              'normal_text': pygame.Color('#FFFFFF'),
+                              'normal_text_shadow': pygame.Color('#000000'),
+                              'shadow_width': 0,
+                              'border_width': 0,
+                              'shape_corner_radius': [5, 5, 5, 5],
+                              'normal_border': pygame.Color('#FFFFFF'),
+                              'normal_bg': pygame.Color('#20A040'),
+                              'text_horiz_alignment': 'center',
+                              'text_vert_alignment': 'center'}
+        shape = RoundedRectangleShape(containing_rect=pygame.Rect(0, 0, 100, 40),
+                                      theming_parameters=theming_parameters,
+                                      states=['normal'], manager=default_ui_manager)
+        shape_cache = default_ui_manager.ui_theme.shape_cache
+        hits = shape_cache.hits
+        RoundedRectangleShape(containing_rect=pygame.Rect(0, 0, 230, 70),
+                              theming_parameters=theming_parameters,
+                              states=['normal'], manager=default_ui_manager)
+        assert shape_cache.hits == hits + 1
+
+        # resizing rebuilds the finished shape straight away
+        shape.set_dimensions((60, 90))
+        assert shape.states['normal'].surface.get_size() == (60, 90)
+        assert not shape.should_trigger_full_rebuild
+        assert shape.states['normal'].surface.get_at((30, 45)) == pygame.Color('#20A040')
+        assert shape.states['normal'].surface.get_at((0, 0)).a == 0
+
 
 if __name__ == '__main__':
     pytest.console_main()
@@ -17,6 +17,20 @@ class MyProperSprite(GUISprite):
         pass
 
 
+class MyIdleSprite(MyProperSprite):
+    def __init__(self, groups: Optional[Union[Iterable[LayeredGUIGroup], LayeredGUIGroup]] = None):
+        super().__init__(groups)
+        self.work_left = 0
+        self.update_count = 0
+
+    def update(self, time_delta: float):
+        self.update_count += 1
+        self.work_left = max(0, self.work_left - 1)
+
+    def is_idle(self) -> bool:
+        return self.work_left == 0
+
+
 class MyDodgySprite1:
     def __init__(self, *groups):
         self.blendmode = 0
@@ -122,6 +136,67 @@ class TestUIElement:
 
         print(sprite1)
 
+    def test_draw_dirty(self, _init_pygame, _display_surface_return_none, default_ui_manager):
+        group = LayeredGUIGroup()
+        surface = pygame.Surface((100, 100))
+        background = pygame.Surface((100, 100))
+
+        sprite1 = MyProperSprite(group)
+        sprite1.image = pygame.Surface((10, 10))
+        sprite1.image.fill(pygame.Color('#FF0000'))
+        sprite1.rect = pygame.Rect(0, 0, 10, 10)
+
+        sprite2 = MyProperSprite(group)
+        sprite2.image = pygame.Surface((10, 10))
+        sprite2.image.fill(pygame.Color('#00FF00'))
+        sprite2.rect = pygame.Rect(50, 50, 10, 10)
+        group.update(0.01)
+
+        assert group.draw_dirty(surface, background) == [pygame.Rect(0, 0, 100, 100)]
+        assert group.draw_dirty(surface, background) == []
+
+        sprite1.rect.topleft = (5, 0)
+        assert group.draw_dirty(surface, background) == [pygame.Rect(0, 0, 15, 10)]
+        assert surface.get_at((2, 2)) == pygame.Color(0, 0, 0)
+        assert surface.get_at((12, 2)) == pygame.Color('#FF0000')
+
+        sprite2.visible = False
+        group.update(0.01)
+        assert group.draw_dirty(surface, background) == [pygame.Rect(50, 50, 10, 10)]
+        assert surface.get_at((55, 55)) == pygame.Color(0, 0, 0)
+
+        sprite1.kill()
+        assert group.draw_dirty(surface, background) == [pygame.Rect(5, 0, 10, 10)]
+
+        group.draw(surface)
+        assert group.draw_dirty(surface, background) == [pygame.Rect(0, 0, 100, 100)]
+
+    def test_update_skips_idle_sprites(self, _init_pygame, _display_surface_return_none,
+                                       default_ui_manager):
+        group = LayeredGUIGroup()
+        busy_sprite = MyProperSprite(group)
+        idle_sprite = MyIdleSprite(group)
+        idle_sprite.work_left = 2
+
+        # sprites are updated until they report they are idle
+        for _ in range(4):
+            group.update(0.01)
+        assert idle_sprite.update_count == 2
+        assert group.get_sprites_to_update() == [busy_sprite]
+
+        idle_sprite.work_left = 1
+        idle_sprite.schedule_update()
+        assert group.get_sprites_to_update() == [busy_sprite, idle_sprite]
+        group.update(0.01)
+        group.update(0.01)
+        assert idle_sprite.update_count == 3
+
+        idle_sprite.kill()
+        idle_sprite.schedule_update()
+        group.update(0.01)
+        assert idle_sprite.update_count == 3
+        assert group.get_sprites_to_update() == [busy_sprite]
+
 
 if __name__ == '__main__':
     pytest.console_main()
@@ -0,0 +1,87 @@
+import time
+
+import pygame
+import pytest
+
+from pygame_gui import PackageResource
+from pygame_gui.core.resource_loaders import StreamingResourceLoader
+from pygame_gui.core.utility import FontResource, ImageResource, SurfaceResource
+
+
+def _load_everything(loader: StreamingResourceLoader, timeout: float = 5.0):
+    delivered = []
+    finished = False
+    start_time = time.perf_counter()
+    while not finished and time.perf_counter() - start_time < timeout:
+        finished, _ = loader.update()
+        delivered.extend(loader.delivered_resources)
+    assert finished
+    return delivered
+
+
+class TestStreamingResourceLoader:
+    def test_creation(self, _init_pygame, _display_surface_return_none):
+        loader = StreamingResourceLoader()
+        assert not loader.started()
+        assert loader.update() == (True, 1.0)
+
+    def test_load_after_start(self, _init_pygame, _display_surface_return_none):
+        loader = StreamingResourceLoader()
+        loader.start()
+        image_resource = ImageResource('splat',
+                                       PackageResource('tests.data.images', 'splat.png'),
+                                       False)
+        surface_resource = SurfaceResource(image_resource, pygame.Rect(0, 0, 8, 8))
+        font_resource = FontResource('roboto_14', 14, {'bold': False, 'italic': False,
+                                                       'antialiased': True},
+                                     (PackageResource('tests.data', 'Roboto-Regular.ttf'), False))
+        # the surface can be added before its image, and waits for it
+        loader.add_resource(surface_resource)
+        loader.add_resource(image_resource)
+
+        loaded = []
+        loader.add_resource(font_resource, priority=10, on_loaded=loaded.append)
+        assert loader.is_loading(font_resource)
+
+        delivered = _load_everything(loader)
+        loader.stop()
+
+        assert loaded == [font_resource]
+        assert font_resource.loaded_font is not None
+        assert image_resource.loaded_surface is not None
+        assert surface_resource.surface.get_size() == (8, 8)
+        assert delivered.index(image_resource) < delivered.index(surface_resource)
+        assert not loader.is_loading(font_resource)
+
+    def test_priority_and_deduplication(self, _init_pygame, _display_surface_return_none):
+        loader = StreamingResourceLoader(num_loading_threads=1)
+        image_resources = [ImageResource(f'image_{index}',
+                                         PackageResource('tests.data.images', 'splat.png'),
+                                         False)
+                           for index in range(5)]
+        for image_resource in image_resources:
+            loader.add_resource(image_resource)
+        # a duplicate ID loads the waiting resource, at the higher priority
+        duplicate = ImageResource('image_4',
+                                  PackageResource('tests.data.images', 'splat.png'),
+                                  False)
+        loaded = []
+        assert loader.add_resource(duplicate, priority=5,
+                                   on_loaded=loaded.append) is image_resources[4]
+
+        loader.start()
+        delivered = _load_everything(loader)
+        loader.stop()
+
+        assert len(delivered) == 5
+        assert delivered[0] is image_resources[4]
+        assert loaded == [image_resources[4]]
+        assert duplicate.loaded_surface is None
+
+    def test_missing_file_warns(self, _init_pygame, _display_surface_return_none):
+        loader = StreamingResourceLoader()
+        loader.start()
+        loader.add_resource(ImageResource('missing', 'not_a_real_file.png', False))
+        with pytest.warns(UserWarning, match='Unable to load resource'):
+            _load_everything(loader)
+        loader.stop()
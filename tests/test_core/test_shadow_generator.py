@@ -38,6 +38,46 @@ class TestShadowGenerator:
         with pytest.warns(UserWarning, match="Tried to make shadow with width <= 0"):
             generator.create_shadow_corners(shadow_width_param=-1, corner_radii=[2, 2, 2, 2])
 
+    def test_persistent_cache(self, _init_pygame, _display_surface_return_none, tmp_path):
+        generator = ShadowGenerator(persistent_cache_path=tmp_path)
+        generated = generator.create_shadow_corners(3, [5, 4, 3, 6])
+        assert len(list(tmp_path.glob("shadow_corners_*.bin"))) == 1
+
+        loading_generator = ShadowGenerator(persistent_cache_path=tmp_path)
+        assert len(loading_generator._persistent_shadow_corners) == 1
+        loaded = loading_generator.create_shadow_corners(3, [5, 4, 3, 6])
+        assert "3x[5, 4, 3, 6]" in loading_generator.preloaded_shadow_corners
+        for piece_name, piece in generated.items():
+            assert loaded[piece_name].get_size() == piece.get_size()
+            assert (pygame.image.tobytes(loaded[piece_name], "RGBA") ==
+                    pygame.image.tobytes(piece, "RGBA"))
+
+        # a different antialiasing amount is a different set of pieces
+        loading_generator.create_shadow_corners(3, [5, 4, 3, 6], aa_amount=2)
+        assert len(list(tmp_path.glob("shadow_corners_*.bin"))) == 2
+
+    def test_persistent_cache_unusual_radii(self, _init_pygame, _display_surface_return_none,
+                                            tmp_path):
+        generator = ShadowGenerator(persistent_cache_path=tmp_path)
+        # radii that don't fit the file format are kept in memory instead of breaking the save
+        generator.create_shadow_corners(3, [2.5, 2, 2, 2])
+        generator.create_shadow_corners(3, [2, 2, 2, 2, 2])
+        assert len(list(tmp_path.glob("shadow_corners_*.bin"))) == 0
+        assert len(generator._persistent_shadow_corners) == 2
+
+        # whole number floats are saved as ints
+        generator.create_shadow_corners(3, [4.0, 4.0, 4.0, 4.0])
+        assert [path.name for path in tmp_path.glob("shadow_corners_*.bin")] == [
+            "shadow_corners_3_4_4_4_4_4.bin"]
+        loading_generator = ShadowGenerator(persistent_cache_path=tmp_path)
+        assert (3, (4, 4, 4, 4), 4) in loading_generator._persistent_shadow_corners
+
+    def test_persistent_cache_bad_file(self, _init_pygame, _display_surface_return_none, tmp_path):
+        (tmp_path / "shadow_corners_2_2_2_2_2_4.bin").write_bytes(b"not a shadow")
+        with pytest.warns(UserWarning, match="Unable to load shadow cache file"):
+            generator = ShadowGenerator(persistent_cache_path=tmp_path)
+        assert isinstance(generator.create_shadow_corners(2, [2, 2, 2, 2])["top"], pygame.Surface)
+
 
 if __name__ == '__main__':
     pytest.console_main()
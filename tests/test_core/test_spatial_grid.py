@@ -0,0 +1,44 @@
+import pytest
+import pygame
+
+from pygame_gui.core.spatial_grid import SpatialGrid
+
+
+class TestSpatialGrid:
+    def test_insert_and_query(self):
+        grid = SpatialGrid(pygame.Rect(0, 0, 800, 600), cell_size=64)
+        grid.insert("a", pygame.Rect(10, 10, 50, 50))
+        grid.insert("b", pygame.Rect(300, 300, 200, 200))
+
+        assert len(grid) == 2
+        assert grid.query_point(20, 20) == {"a"}
+        assert grid.query_point(400, 400) == {"b"}
+        assert grid.query_point(700, 50) == set()
+        assert grid.query_point(900, 50) is None
+
+    def test_move_and_remove(self):
+        grid = SpatialGrid(pygame.Rect(0, 0, 800, 600), cell_size=64)
+        grid.insert("a", pygame.Rect(10, 10, 50, 50))
+        grid.insert("a", pygame.Rect(400, 400, 50, 50))
+
+        assert grid.query_point(20, 20) == set()
+        assert grid.query_point(420, 420) == {"a"}
+
+        grid.remove("a")
+        grid.remove("not there")
+        assert "a" not in grid
+        assert grid.query_point(420, 420) == set()
+
+    def test_set_bounds(self):
+        grid = SpatialGrid(pygame.Rect(0, 0, 100, 100), cell_size=32)
+        grid.insert("big", pygame.Rect(0, 0, 5000, 50))
+
+        assert grid.query_point(50, 10) == {"big"}
+        assert grid.query_point(1000, 10) is None
+
+        grid.set_bounds(pygame.Rect(0, 0, 2000, 100))
+        assert grid.query_point(1000, 10) == {"big"}
+
+
+if __name__ == '__main__':
+    pytest.console_main()
@@ -1,7 +1,7 @@
 import pytest
 import pygame
 
-from pygame_gui.core.surface_cache import SurfaceCache
+from pygame_gui.core.surface_cache import SurfaceCache, SurfaceCachePage
 
 
 class TestSurfaceCache:
@@ -125,6 +125,123 @@ class TestSurfaceCache:
         assert cache.low_on_space
 
 
+    def test_page_packing(self, _init_pygame, _display_surface_return_none):
+        page = SurfaceCachePage((256, 256))
+        sizes = [(64, 32), (30, 50), (100, 10), (70, 70), (16, 16), (128, 40), (50, 90)] * 2
+        for index, size in enumerate(sizes):
+            surface = pygame.Surface(size, flags=pygame.SRCALPHA, depth=32)
+            surface.fill(pygame.Color(255, 255, 255, 255))
+            assert page.add_item(str(index), surface) is not None
+
+        rects = list(page.item_rects.values())
+        for index, rect in enumerate(rects):
+            assert page.surface.get_rect().contains(rect)
+            assert rect.collidelist(rects[index + 1:]) == -1
+        assert page.add_item('too big', pygame.Surface((256, 256))) is None
+
+        for index in range(0, len(sizes), 2):
+            page.remove_item(str(index))
+        assert page.get_wasted_area() > 0
+        new_subsurfaces = page.repack()
+        assert set(new_subsurfaces) == set(page.item_rects)
+        assert page.get_wasted_area() < page.used_area
+        for string_id, subsurface in new_subsurfaces.items():
+            assert subsurface.get_size() == page.item_rects[string_id].size
+            assert subsurface.get_at((0, 0)) == pygame.Color(255, 255, 255, 255)
+
+    def test_batch_promotion_and_defragment(self, _init_pygame, _display_surface_return_none):
+        cache = SurfaceCache(page_size=(128, 128), max_pages=1)
+        for index in range(16):
+            cache.add_surface_to_cache(pygame.Surface((32, 32), flags=pygame.SRCALPHA), str(index))
+        cache.update()
+        assert len(cache.cache_short_term_lookup) == 0
+        assert len(cache.cache_long_term_lookup) == 16
+
+        for index in range(0, 16, 2):
+            cache.remove_user_and_request_clean_up_of_cached_item(str(index))
+        assert len(cache.cache_long_term_lookup) == 8
+
+        # the page is full until it is repacked to reclaim the removed surfaces' space
+        cache.add_surface_to_cache(pygame.Surface((64, 64), flags=pygame.SRCALPHA), 'big')
+        cache.update()
+        assert not cache.low_on_space
+        assert cache.find_surface_in_cache('big').get_size() == (64, 64)
+        assert cache.find_surface_in_cache('1').get_size() == (32, 32)
+
+    def test_larger_page_size(self, _init_pygame, _display_surface_return_none):
+        cache = SurfaceCache(page_size=(2048, 2048))
+        cache.add_surface_to_long_term_cache({"surface": pygame.Surface((2048, 1500)), "uses": 1},
+                                             string_id="test_surface")
+        assert cache.find_surface_in_cache("test_surface").get_size() == (2048, 1500)
+
+    def test_least_recently_used_eviction(self, _init_pygame, _display_surface_return_none):
+        cache = SurfaceCache(page_size=(128, 128), max_pages=1)
+        for index in range(16):
+            cache.add_surface_to_long_term_cache({"surface": pygame.Surface((32, 32)), "uses": 1},
+                                                 string_id=str(index))
+        # use everything apart from the first two surfaces added
+        for index in range(2, 16):
+            cache.find_surface_in_cache(str(index))
+
+        cache.add_surface_to_long_term_cache({"surface": pygame.Surface((32, 32)), "uses": 1},
+                                             string_id='new')
+        assert cache.find_surface_in_cache('new') is not None
+        assert '0' not in cache.cache_long_term_lookup
+        assert '1' not in cache.cache_long_term_lookup
+        assert all(str(index) in cache.cache_long_term_lookup for index in range(2, 16))
+        assert not cache.low_on_space
+
+    def test_memory_budget(self, _init_pygame, _display_surface_return_none):
+        page_bytes = 128 * 128 * 4
+        cache = SurfaceCache(page_size=(128, 128), max_pages=3, max_memory_bytes=page_bytes * 2)
+        for index in range(48):
+            cache.add_surface_to_long_term_cache({"surface": pygame.Surface((32, 32)), "uses": 1},
+                                                 string_id=str(index))
+        assert len(cache.cache_surfaces) == 2
+        assert cache.get_memory_usage() == page_bytes * 2
+        assert len(cache.cache_long_term_lookup) == 32
+        assert '47' in cache.cache_long_term_lookup
+
+        cache.find_surface_in_cache('16')
+        cache.set_memory_budget(page_bytes)
+        assert len(cache.cache_surfaces) == 1
+        assert cache.get_memory_usage() == page_bytes
+        assert '16' in cache.cache_long_term_lookup
+        assert len(cache.cache_long_term_lookup) == 16
+
+        cache.set_memory_budget(0)
+        assert cache.get_memory_usage() == 0
+        cache.add_surface_to_long_term_cache({"surface": pygame.Surface((32, 32)), "uses": 1},
+                                             string_id='nowhere')
+        assert cache.find_surface_in_cache('nowhere') is None
+
+        # budgets smaller than a page would quietly turn the cache off
+        with pytest.raises(ValueError):
+            cache.set_memory_budget(page_bytes - 1)
+        with pytest.raises(ValueError):
+            SurfaceCache(page_size=(128, 128), max_memory_bytes=1024)
+
+    def test_repack_in_place(self, _init_pygame, _display_surface_return_none):
+        page = SurfaceCachePage((128, 128))
+        page_surface = page.surface
+        for index in range(16):
+            surface = pygame.Surface((32, 32), flags=pygame.SRCALPHA, depth=32)
+            surface.fill(pygame.Color(index * 10, 100, 200, 255))
+            page.add_item(str(index), surface)
+        for index in range(0, 16, 3):
+            page.remove_item(str(index))
+
+        new_subsurfaces = page.repack()
+        # no second page is made to repack into
+        assert page.surface is page_surface
+        rects = list(page.item_rects.values())
+        for index, rect in enumerate(rects):
+            assert rect.collidelist(rects[index + 1:]) == -1
+        for string_id, subsurface in new_subsurfaces.items():
+            assert subsurface.get_parent() is page_surface
+            assert subsurface.get_at((0, 0)) == pygame.Color(int(string_id) * 10, 100, 200, 255)
+            assert subsurface.get_at((31, 31)) == pygame.Color(int(string_id) * 10, 100, 200, 255)
+
 if __name__ == '__main__':
     pytest.console_main()
 
@@ -7,7 +7,7 @@ from pygame_gui.ui_manager import UIManager
 
 from pygame_gui.core.text.text_box_layout import TextBoxLayout, TextFloatPosition
 from pygame_gui.core.text import SimpleTestLayoutRect, TextLineChunkFTFont, HyperlinkTextChunk
-from pygame_gui.core.text import ImageLayoutRect, HorizRuleLayoutRect
+from pygame_gui.core.text import ImageLayoutRect, HorizRuleLayoutRect, LineBreakLayoutRect
 from pygame_gui.core.text.text_layout_rect import Padding
 
 
@@ -1122,6 +1122,95 @@ class TestTextBoxLayout:
 
         assert remaining_text == 'hello this is test'
 
+    def test_edits_only_reflow_edited_paragraph(self, _init_pygame, _display_surface_return_none,
+                                                default_ui_manager: UIManager):
+        the_font = GUIFontFreetype(None, 20)
+        input_data = deque([])
+        for line_index in range(20):
+            input_data.append(TextLineChunkFTFont(text=f'line {line_index} of some text',
+                                                  font=the_font,
+                                                  underlined=False,
+                                                  colour=pygame.Color('#FFFFFF'),
+                                                  using_default_text_colour=False,
+                                                  bg_colour=pygame.Color('#00000000')))
+            input_data.append(LineBreakLayoutRect(dimensions=(0, 20), font=the_font))
+        default_font = default_ui_manager.get_theme().get_font_dictionary().get_default_font()
+        default_font_data = {"font": default_font,
+                             "font_colour": pygame.Color("#FFFFFF"),
+                             "bg_colour": pygame.Color("#00000000")
+                             }
+        layout = TextBoxLayout(input_data_queue=input_data,
+                               layout_rect=pygame.Rect(0, 0, 300, 300),
+                               view_rect=pygame.Rect(0, 0, 300, 150),
+                               line_spacing=1.0,
+                               default_font_data=default_font_data)
+        layout.finalise_to_new()
+
+        later_rows = layout.layout_rows[3:]
+        later_row_positions = [row.y for row in later_rows]
+
+        layout.insert_text('more ', 8)
+        layout.set_cursor_position(9)
+        layout.delete_at_cursor()
+        layout.set_cursor_position(9)
+        layout.backspace_at_cursor()
+
+        # the rows after the edited line are kept as they were
+        assert layout.layout_rows[3:] == later_rows
+        assert all(new_row is old_row for new_row, old_row in zip(layout.layout_rows[3:], later_rows))
+        assert [row.y for row in layout.layout_rows[3:]] == later_row_positions
+        assert layout.plain_text.startswith('line 0 ore f some text\nline 1 of some text\n')
+        assert layout.letter_count == len(layout.plain_text)
+
+        # ...unless the edit changes how many rows the edited line needs
+        layout.insert_text(' and a lot more text on the end', 20)
+        assert layout.layout_rows[0].y == 0
+        row_height = later_row_positions[1] - later_row_positions[0]
+        assert layout.layout_rows[4] is later_rows[0]
+        assert layout.layout_rows[4].y == later_row_positions[0] + row_height
+        assert layout.plain_text.count('\n') == 20
+
+    def test_shrinking_edit_matches_full_redraw(self, _init_pygame, _display_surface_return_none,
+                                                default_ui_manager: UIManager):
+        the_font = GUIFontFreetype(None, 20)
+        input_data = deque([])
+        for line_index in range(8):
+            text = f'line {line_index} ' + ('wraps ' * 6 if line_index == 1 else 'of text')
+            input_data.append(TextLineChunkFTFont(text=text,
+                                                  font=the_font,
+                                                  underlined=False,
+                                                  colour=pygame.Color('#FFFFFF'),
+                                                  using_default_text_colour=False,
+                                                  bg_colour=pygame.Color('#00000000')))
+            input_data.append(LineBreakLayoutRect(dimensions=(0, 20), font=the_font))
+        default_font = default_ui_manager.get_theme().get_font_dictionary().get_default_font()
+        default_font_data = {"font": default_font,
+                             "font_colour": pygame.Color("#FFFFFF"),
+                             "bg_colour": pygame.Color("#00000000")
+                             }
+        layout = TextBoxLayout(input_data_queue=input_data,
+                               layout_rect=pygame.Rect(0, 0, 100, 400),
+                               view_rect=pygame.Rect(0, 0, 100, 400),
+                               line_spacing=1.0,
+                               default_font_data=default_font_data)
+        layout.finalise_to_new()
+        row_count = len(layout.layout_rows)
+
+        # deleting most of the wrapped paragraph moves the rows after it up
+        start = layout.plain_text.index('wraps')
+        for _ in range(30):
+            layout.set_cursor_position(start)
+            layout.delete_at_cursor()
+        assert len(layout.layout_rows) < row_count
+
+        edited_surface = layout.finalised_surface.copy()
+        layout.finalise_to_new()
+        redrawn_surface = layout.finalised_surface
+        compare_rect = pygame.Rect((0, 0), redrawn_surface.get_size()).clip(
+            edited_surface.get_rect())
+        assert (edited_surface.subsurface(compare_rect).get_view('2').raw ==
+                redrawn_surface.subsurface(compare_rect).get_view('2').raw)
+
 
 if __name__ == '__main__':
     pytest.console_main()
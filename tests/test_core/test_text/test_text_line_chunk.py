@@ -191,6 +191,33 @@ class TestTextLineChunkFTFont:
         assert original_chunk_width == (chunk.width + new_chunk.width)
         assert chunk.height == new_chunk.height
 
+    def test_split_long_text(self, _init_pygame, _display_surface_return_none,
+                             default_ui_manager: UIManager):
+        the_font = GUIFontFreetype(None, 14)
+        words = [f'word{index}' for index in range(500)]
+        chunk = TextLineChunkFTFont(text=' '.join(words),
+                                    font=the_font,
+                                    underlined=False,
+                                    colour=pygame.Color('#FFFFFF'),
+                                    using_default_text_colour=False,
+                                    bg_colour=pygame.Color('#00000000'))
+
+        measured_texts = []
+        original_get_rect = the_font.get_rect
+
+        def counting_get_rect(text):
+            measured_texts.append(text)
+            return original_get_rect(text)
+
+        the_font.get_rect = counting_get_rect
+        new_chunk = chunk.split(requested_x=300, line_width=300, row_start_x=0)
+
+        # the split point is found with a binary search, not by stepping through every space
+        assert len(measured_texts) <= 12
+        assert chunk.width <= 300
+        assert original_get_rect(chunk.text + new_chunk.text.split(' ')[0]).width > 300
+        assert chunk.text + new_chunk.text == ' '.join(words)
+
     def test_split_index(self, _init_pygame, _display_surface_return_none, default_ui_manager: UIManager):
 
         the_font = GUIFontFreetype(None, 30)
@@ -454,6 +481,36 @@ class TestTextLineChunkFTFont:
         letter_index = chunk.x_pos_to_letter_index(x_pos=100)
         assert letter_index == 8
 
+    def test_x_pos_to_letter_index_remembers_widths(self, _init_pygame, _display_surface_return_none):
+        the_font = GUIFontFreetype(None, 30)
+
+        chunk = TextLineChunkFTFont(text='test this and some more text to drag over',
+                                    font=the_font,
+                                    underlined=False,
+                                    colour=pygame.Color('#FFFFFF'),
+                                    using_default_text_colour=False,
+                                    bg_colour=pygame.Color('#FF00FF'))
+
+        for letter_index in range(len(chunk.text) + 1):
+            x_pos = chunk.get_prefix_width(letter_index)
+            assert chunk.x_pos_to_letter_index(x_pos=x_pos) == letter_index
+
+        measured_texts = []
+        original_get_rect = the_font.get_rect
+
+        def counting_get_rect(text):
+            measured_texts.append(text)
+            return original_get_rect(text)
+
+        the_font.get_rect = counting_get_rect
+        for x_pos in range(0, chunk.width, 3):
+            chunk.x_pos_to_letter_index(x_pos=x_pos)
+        assert measured_texts == []
+
+        chunk.insert_text('A', 2)
+        chunk.x_pos_to_letter_index(x_pos=chunk.width // 2)
+        assert len(measured_texts) > 0
+
     def test_redraw(self, _init_pygame, _display_surface_return_none, default_ui_manager: UIManager):
 
         the_font = GUIFontFreetype(None, 30)
@@ -0,0 +1,100 @@
+import pygame
+
+from pygame_gui.core.gui_font_freetype import GUIFontFreetype
+from pygame_gui.core.text import TextLineChunkFTFont, TextRenderCache
+from pygame_gui.core.text import get_text_render_cache
+
+
+class TestTextRenderCache:
+    def test_creation(self, _init_pygame):
+        cache = TextRenderCache(max_memory_bytes=1024)
+        assert cache.max_memory_bytes == 1024
+        assert len(cache) == 0
+
+    def test_render_premul_to(self, _init_pygame):
+        cache = TextRenderCache()
+        font = GUIFontFreetype(None, 20)
+
+        surface = cache.render_premul_to(font, 'OK', pygame.Color('#FFFFFFFF'),
+                                         (40, 30), (0, 20))
+        assert surface.get_size() == (40, 30)
+        assert cache.misses == 1 and cache.hits == 0
+
+        # the same text, font, colour and layout finds the same surface
+        assert cache.render_premul_to(font, 'OK', pygame.Color('#FFFFFFFF'),
+                                      (40, 30), (0, 20)) is surface
+        assert cache.hits == 1
+
+        # anything different is rendered again
+        assert cache.render_premul_to(font, 'OK', pygame.Color('#FF0000FF'),
+                                      (40, 30), (0, 20)) is not surface
+        assert cache.render_premul_to(font, 'OK', pygame.Color('#FFFFFFFF'),
+                                      (40, 30), (0, 20),
+                                      multiply_colour=pygame.Color('#FF0000FF')) is not surface
+        font.underline = True
+        assert cache.render_premul_to(font, 'OK', pygame.Color('#FFFFFFFF'),
+                                      (40, 30), (0, 20)) is not surface
+        font.underline = False
+        assert cache.misses == 4
+        assert len(cache) == 4
+
+        tinted = cache.render_premul_to(font, 'OK', pygame.Color('#FFFFFFFF'),
+                                        (40, 30), (0, 20),
+                                        multiply_colour=pygame.Color('#FF0000FF'))
+        assert tinted.get_bounding_rect() == surface.get_bounding_rect()
+        pixel = tinted.get_at(tinted.get_bounding_rect().center)
+        assert pixel.g == 0 and pixel.b == 0
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.memory_usage == 0
+
+    def test_memory_cap(self, _init_pygame):
+        font = GUIFontFreetype(None, 20)
+        surface_bytes = pygame.Surface((40, 30), depth=32,
+                                       flags=pygame.SRCALPHA).get_pitch() * 30
+        cache = TextRenderCache(max_memory_bytes=surface_bytes * 8)
+
+        for index in range(10):
+            cache.render_premul_to(font, str(index), pygame.Color('#FFFFFFFF'),
+                                   (40, 30), (0, 20))
+            # touch the first surface so it is never the least recently used
+            cache.render_premul_to(font, '0', pygame.Color('#FFFFFFFF'),
+                                   (40, 30), (0, 20))
+
+        assert len(cache) == 8
+        assert cache.memory_usage == surface_bytes * 8
+
+        hits = cache.hits
+        cache.render_premul_to(font, '0', pygame.Color('#FFFFFFFF'), (40, 30), (0, 20))
+        assert cache.hits == hits + 1
+        cache.render_premul_to(font, '1', pygame.Color('#FFFFFFFF'), (40, 30), (0, 20))
+        assert cache.hits == hits + 1
+
+        cache.set_max_memory_bytes(surface_bytes * 16)
+        # too big a surface for this cache is rendered, but not kept
+        cache.render_premul_to(font, 'big', pygame.Color('#FFFFFFFF'), (100, 100), (0, 20))
+        assert len(cache) == 8
+
+        cache.set_max_memory_bytes(surface_bytes * 2)
+        assert len(cache) == 2
+        assert cache.memory_usage == surface_bytes * 2
+
+    def test_shared_by_text_chunks(self, _init_pygame, _display_surface_return_none):
+        font = GUIFontFreetype(None, 20)
+        cache = get_text_render_cache()
+        cache.clear()
+
+        for _ in range(2):
+            chunk = TextLineChunkFTFont(text='Price',
+                                        font=font,
+                                        underlined=False,
+                                        colour=pygame.Color('#FFFFFF'),
+                                        using_default_text_colour=False,
+                                        bg_colour=pygame.Color('#00000000'))
+            chunk.finalise(pygame.Surface((200, 30), flags=pygame.SRCALPHA, depth=32),
+                           pygame.Rect(0, 0, 200, 30),
+                           chunk.y_origin, chunk.height, chunk.height, chunk.height)
+
+        assert cache.misses >= 1
+        assert cache.hits >= 1
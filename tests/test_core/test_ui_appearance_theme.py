@@ -5,7 +5,9 @@ import warnings
 
 from pygame_gui.core.interfaces.gui_font_interface import IGUIFontInterface
 from pygame_gui.core.ui_appearance_theme import UIAppearanceTheme, UIThemeValidator, UIThemeValidationError
+from pygame_gui.core.ui_appearance_theme import compile_theme
 from pygame_gui.core.resource_loaders import BlockingThreadedResourceLoader
+from pygame_gui.core.colour_gradient import ColourGradient
 from pygame_gui import PackageResource
 
 
@@ -132,6 +134,43 @@ class TestUIAppearanceTheme:
                                          class_ids=[None],
                                          object_ids=['whut', 'the', 'heck'])
 
+    def test_build_all_combined_ids_order(self, _init_pygame, _display_surface_return_none):
+        theme = UIAppearanceTheme(BlockingThreadedResourceLoader(), locale='en')
+        combined_ids = theme.build_all_combined_ids(element_base_ids=[None, None],
+                                                    element_ids=['window', 'button'],
+                                                    class_ids=['@windows', None],
+                                                    object_ids=['#my_window', '#ok'])
+        assert combined_ids == ['#my_window.#ok', '#my_window.button',
+                                '@windows.#ok', '@windows.button',
+                                'window.#ok', 'window.button',
+                                '#ok', 'button', '#ok', 'button', '#ok', 'button']
+        assert theme.build_all_combined_ids(element_base_ids=[None, None],
+                                            element_ids=['window', 'button'],
+                                            class_ids=['@windows', None],
+                                            object_ids=['#my_window', '#ok']) is combined_ids
+
+    def test_resolved_style_lookups(self, _init_pygame, _display_surface_return_none):
+        theme = UIAppearanceTheme(BlockingThreadedResourceLoader(), locale='en')
+        theme.update_theming({"button": {"colours": {"normal_bg": "#FF0000"},
+                                         "misc": {"shape": "rounded_rectangle"}},
+                              "#ok": {"colours": {"normal_bg": "#00FF00"}}})
+        combined_ids = theme.build_all_combined_ids(element_base_ids=[None],
+                                                    element_ids=['button'],
+                                                    class_ids=[None],
+                                                    object_ids=['#ok'])
+
+        assert theme.get_colour('normal_bg', combined_ids) == pygame.Color('#00FF00')
+        assert theme.get_colour('normal_bg', ['button']) == pygame.Color('#FF0000')
+        assert theme.get_misc_data('shape', combined_ids) == 'rounded_rectangle'
+        with pytest.raises(LookupError):
+            theme.get_misc_data('not_a_thing', combined_ids)
+
+        # changing the theme should be picked up by the resolved styles
+        theme.update_theming({"#ok": {"colours": {"normal_bg": "#0000FF"},
+                                      "misc": {"shape": "rectangle"}}})
+        assert theme.get_colour('normal_bg', combined_ids) == pygame.Color('#0000FF')
+        assert theme.get_misc_data('shape', combined_ids) == 'rectangle'
+
     def test_load_theme_bad_path(self, _init_pygame, _display_surface_return_none):
         theme = UIAppearanceTheme(BlockingThreadedResourceLoader(), locale='en')
         with pytest.warns(UserWarning, match='Failed to open theme file at path'):
@@ -570,6 +609,86 @@ class TestUIAppearanceTheme:
             assert len(errors) >= 1, f"Invalid theme should have errors: {theme_data}"
             assert expected_message in str(errors), f"Expected message '{expected_message}' not found in errors: {errors}"
 
+    def test_compiled_theme(self, _init_pygame, _display_surface_return_none, tmp_path):
+        theme_paths = [os.path.join("tests", "data", "themes", "ui_window_prototype.json"),
+                       os.path.join("tests", "data", "themes", "ui_button_with_images.json"),
+                       os.path.join("tests", "data", "themes", "ui_2d_slider_non_default.json"),
+                       {"button": {"misc": {"shape_corner_radius": [5, 10, 15, 20]}}}]
+        compiled_theme_path = tmp_path / "theme.compiled.json"
+        compile_theme(theme_paths, compiled_theme_path)
+
+        parsed_theme = UIAppearanceTheme(BlockingThreadedResourceLoader(), locale='en')
+        for theme_path in theme_paths:
+            parsed_theme.load_theme(theme_path)
+
+        compiled_theme = UIAppearanceTheme(BlockingThreadedResourceLoader(), locale='en')
+        compiled_theme._parse_theme_data_from_json_dict = None  # must not be parsed
+        compiled_theme.load_theme(str(compiled_theme_path))
+
+        assert compiled_theme.base_colours == parsed_theme.base_colours
+        assert compiled_theme.ui_element_colours == parsed_theme.ui_element_colours
+        assert compiled_theme.ui_element_fonts_info == parsed_theme.ui_element_fonts_info
+        assert compiled_theme.ui_element_misc_data == parsed_theme.ui_element_misc_data
+        assert (compiled_theme.ui_element_image_locs.keys() ==
+                parsed_theme.ui_element_image_locs.keys())
+        assert (compiled_theme.ui_element_image_surfaces.keys() ==
+                parsed_theme.ui_element_image_surfaces.keys())
+        assert isinstance(compiled_theme.get_colour_or_gradient('dark_bg', ['2d_slider']),
+                          ColourGradient)
+
+    def test_background_reload_checks(self, _init_pygame, _display_surface_return_none, tmp_path):
+        theme_path = tmp_path / "theme.json"
+        theme_path.write_text('{"button": {"colours": {"normal_bg": "#101010"}}}')
+        theme = UIAppearanceTheme(BlockingThreadedResourceLoader(), locale='en')
+        theme.load_theme(str(theme_path))
+        theme.start_background_reload_checks(check_interval=60.0)
+        try:
+            watcher = theme._theme_file_watcher
+            assert watcher.is_watching()
+            assert not watcher.check_for_changes()
+
+            theme_path.write_text('{"button": {"colours": {"normal_bg": "#202020"}}}')
+            os.utime(theme_path, (0, theme._theme_file_last_modified + 10))
+            assert watcher.check_for_changes()
+            # already read, so no change to report
+            assert not watcher.check_for_changes()
+
+            assert theme.get_colour('normal_bg', ['button']) == pygame.Color('#101010')
+            assert theme.check_need_to_reload()
+            assert theme.get_colour('normal_bg', ['button']) == pygame.Color('#202020')
+            assert not theme.check_need_to_reload()
+        finally:
+            theme.stop_background_reload_checks()
+        assert theme._theme_file_watcher is None
+
+    def test_changed_theme_categories(self, _init_pygame, _display_surface_return_none):
+        theme = UIAppearanceTheme(BlockingThreadedResourceLoader(), locale='en')
+        theme_dict = {"#ok_button": {"colours": {"normal_bg": "#101010"}},
+                      "#cancel_button": {"misc": {"shape": "rounded_rectangle"}}}
+        theme.clear_theme_changes()
+        theme.load_theme(theme_dict)
+        ok_ids = theme.build_all_combined_ids(['button'], ['button'], [None], ['#ok_button'])
+        cancel_ids = theme.build_all_combined_ids(['button'], ['button'], [None], ['#cancel_button'])
+        assert theme.get_changed_theme_categories(ok_ids) == {'colours'}
+        assert theme.get_changed_theme_categories(cancel_ids) == {'misc'}
+
+        theme.clear_theme_changes()
+        theme.load_theme(theme_dict)
+        assert theme.get_changed_theme_categories(ok_ids) == set()
+        assert theme.get_changed_theme_categories(cancel_ids) == set()
+
+        theme.update_theming('{"#ok_button": {"colours": {"normal_bg": "#202020"}}}')
+        assert theme.get_changed_theme_categories(ok_ids) == {'colours'}
+        assert theme.get_changed_theme_categories(cancel_ids) == set()
+
+        theme.update_theming('{"defaults": {"colours": {"normal_bg": "#303030"}}}')
+        assert theme.get_changed_theme_categories(cancel_ids) == {'colours'}
+
+    def test_compiled_theme_wrong_version(self, _init_pygame, _display_surface_return_none):
+        theme = UIAppearanceTheme(BlockingThreadedResourceLoader(), locale='en')
+        with pytest.warns(UserWarning, match="Unable to load compiled theme of version 0"):
+            theme.load_theme({"pygame_gui_compiled_theme_version": 0})
+
 
 if __name__ == '__main__':
     pytest.console_main()
@@ -586,26 +586,60 @@ class TestUIElement:
         coloured_surface.fill(pygame.Color(200, 80, 80, 255))
         element._set_image(coloured_surface)
 
-        after_clip_in_clip_colour = element.image.get_at((15, 25))
-        after_clip_out_clip_colour = element.image.get_at((35, 25))
+        def draw_element():
+            screen = pygame.Surface((50, 50), flags=pygame.SRCALPHA, depth=32)
+            screen.blits([element.blit_data])
+            return screen
+
+        after_clip_in_clip_colour = draw_element().get_at((15, 25))
+        after_clip_out_clip_colour = draw_element().get_at((35, 25))
         assert after_clip_in_clip_colour == pygame.Color(200, 80, 80, 255)
         assert after_clip_out_clip_colour == pygame.Color(200, 80, 80, 255)
         element._set_image_clip(None)
-        after_clip_in_clip_colour = element.image.get_at((15, 25))
-        after_clip_out_clip_colour = element.image.get_at((35, 25))
+        after_clip_in_clip_colour = draw_element().get_at((15, 25))
+        after_clip_out_clip_colour = draw_element().get_at((35, 25))
         assert after_clip_in_clip_colour == pygame.Color(200, 80, 80, 255)
         assert after_clip_out_clip_colour == pygame.Color(200, 80, 80, 255)
         element._set_image_clip(pygame.Rect(0, 0, 25, 50))
-        after_clip_in_clip_colour = element.image.get_at((15, 25))
-        after_clip_out_clip_colour = element.image.get_at((35, 25))
+        after_clip_in_clip_colour = draw_element().get_at((15, 25))
+        after_clip_out_clip_colour = draw_element().get_at((35, 25))
         assert after_clip_in_clip_colour == pygame.Color(200, 80, 80, 255)
         assert after_clip_out_clip_colour == pygame.Color(0, 0, 0, 0)
         element._set_image_clip(None)
-        after_clip_in_clip_colour = element.image.get_at((15, 25))
-        after_clip_out_clip_colour = element.image.get_at((35, 25))
+        after_clip_in_clip_colour = draw_element().get_at((15, 25))
+        after_clip_out_clip_colour = draw_element().get_at((35, 25))
         assert after_clip_in_clip_colour == pygame.Color(200, 80, 80, 255)
         assert after_clip_out_clip_colour == pygame.Color(200, 80, 80, 255)
 
+    def test_set_image_clip_keeps_image(self, _init_pygame, _display_surface_return_none,
+                                        default_ui_manager: IUIManagerInterface):
+        element = UIElement(relative_rect=pygame.Rect(10, 20, 50, 50),
+                            manager=default_ui_manager,
+                            container=None,
+                            starting_height=0,
+                            layer_thickness=1)
+
+        coloured_surface = pygame.Surface((50, 50), flags=pygame.SRCALPHA, depth=32)
+        coloured_surface.fill(pygame.Color(200, 80, 80, 255))
+        element._set_image(coloured_surface)
+        image = element.image
+
+        element._set_image_clip(pygame.Rect(5, 15, 25, 30))
+        assert element.image is image
+        assert element.blit_data[2] == pygame.Rect(5, 15, 25, 30)
+        assert element.blit_data[1].topleft == (15, 35)
+
+        # moving the element moves the clipped area with it
+        element.rect.topleft = (40, 40)
+        element.notify_rect_changed()
+        assert element.image is image
+        assert element.blit_data[1].topleft == (45, 55)
+
+        element._set_image_clip(None)
+        assert element.image is image
+        assert element.blit_data[1] is element.rect
+        assert element.blit_data[2] is None
+
     def test_set_image(self, _init_pygame, _display_surface_return_none, default_ui_manager: IUIManagerInterface):
         element = UIElement(relative_rect=pygame.Rect(0, 0, 50, 50),
                             manager=default_ui_manager,
@@ -626,7 +660,8 @@ class TestUIElement:
 
         element._set_image_clip(pygame.Rect(0, 0, 0, 0))
         element._set_image(coloured_surface_1)
-        assert element.image == default_ui_manager.get_universal_empty_surface()
+        assert element.image.get_at((10, 10)) == pygame.Color(200, 80, 80, 255)
+        assert element.blit_data[2].size == (0, 0)
 
         element._set_image_clip(None)
         element._set_image(None)
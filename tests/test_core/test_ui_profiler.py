@@ -0,0 +1,66 @@
+import json
+
+import pytest
+
+from pygame_gui.core.surface_cache import SurfaceCache
+from pygame_gui.core.ui_profiler import UIProfiler
+
+
+class TestUIProfiler:
+    def test_inactive_records_nothing(self):
+        profiler = UIProfiler()
+        with profiler.time_section("update"):
+            pass
+        profiler.count_element_update(object())
+        profiler.end_frame()
+
+        assert profiler.get_frames() == []
+
+    def test_frame_records(self, _init_pygame):
+        profiler = UIProfiler(max_frames=3)
+        cache = SurfaceCache()
+        profiler.start()
+        for _ in range(5):
+            with profiler.time_section("process_events"):
+                pass
+            with profiler.time_section("process_events"):
+                pass
+            with profiler.time_section("update"):
+                profiler.count_element_update(1)
+                profiler.count_element_update(2)
+                profiler.count_element_rebuild("a string")
+            cache.find_surface_in_cache("not there")
+            profiler.end_frame(cache)
+
+        frames = profiler.get_frames()
+        assert [frame["frame"] for frame in frames] == [2, 3, 4]
+        assert frames[-1]["process_events_calls"] == 2
+        assert frames[-1]["element_updates"] == {"int": 2}
+        assert frames[-1]["element_rebuilds"] == {"str": 1}
+        assert frames[-1]["surface_cache"] == {"hits": 0, "misses": 1}
+        assert profiler.get_surface_cache_hit_rate() == 0.0
+        assert set(profiler.get_average_timings()) == {"process_events", "update"}
+        assert profiler.get_frames(1) == frames[-1:]
+        assert json.loads(profiler.to_json()) == frames
+
+        profiler.max_frames = 2
+        assert len(profiler.get_frames()) == 2
+
+        profiler.stop()
+        profiler.clear()
+        assert profiler.get_frames() == []
+
+    def test_save_to_json_file(self, tmp_path):
+        profiler = UIProfiler()
+        profiler.start()
+        profiler.add_section_time("draw", 2.0)
+        profiler.end_frame()
+
+        file_path = tmp_path / "profile.json"
+        profiler.save_to_json_file(str(file_path))
+        with open(file_path, encoding="utf-8") as json_file:
+            assert json.load(json_file)[0]["timings_ms"] == {"draw": 2.0}
+
+
+if __name__ == '__main__':
+    pytest.console_main()
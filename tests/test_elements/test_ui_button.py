@@ -221,6 +221,61 @@ class TestUIButton:
         assert button.pressed is True and redraw_queue_length_post_update == (
                 redraw_queue_length_pre_update - 1)
 
+    def test_idle_until_pressed(self, _init_pygame, default_ui_manager,
+                                _display_surface_return_none):
+        button = UIButton(relative_rect=pygame.Rect(10, 10, 150, 30),
+                          text="Test Button",
+                          manager=default_ui_manager,
+                          allow_double_clicks=True)
+        sprite_group = default_ui_manager.get_sprite_group()
+        for _ in range(50):
+            default_ui_manager.update(0.01)
+        assert button.is_idle()
+        assert button not in sprite_group.get_sprites_to_update()
+
+        default_ui_manager.process_events(
+            pygame.event.Event(pygame.MOUSEBUTTONDOWN, {'button': 1, 'pos': (50, 25)}))
+        default_ui_manager.process_events(
+            pygame.event.Event(pygame.MOUSEBUTTONUP, {'button': 1, 'pos': (50, 25)}))
+        assert button in sprite_group.get_sprites_to_update()
+
+        default_ui_manager.update(0.01)
+        assert button.check_pressed()
+        default_ui_manager.update(0.01)
+        assert not button.check_pressed()
+        assert not button.is_idle()
+
+        # stays updated while it is timing a double click, then goes idle again
+        for _ in range(100):
+            default_ui_manager.update(0.01)
+        assert button.is_idle()
+        assert button not in sprite_group.get_sprites_to_update()
+
+    def test_transition_frames_not_copied(self, _init_pygame, _display_surface_return_none):
+        manager = UIManager((800, 600))
+        manager.get_theme().update_theming('{"button": {"misc": {"state_transitions": '
+                                           '{"normal_hovered": "0.5"}}}}')
+        button = UIButton(relative_rect=pygame.Rect(10, 10, 150, 30),
+                          text="Test Button",
+                          manager=manager)
+        manager.update(0.01)
+
+        # hover the button to start the transition
+        manager._update_mouse_position = lambda: setattr(manager, 'mouse_position', (50, 25))
+        manager.update(0.01)
+        manager.update(0.1)
+        blend_surface = button.drawable_shape.transition_blend_buffers.result_surface
+        assert blend_surface is not None
+        assert button.image is blend_surface
+        manager.update(0.1)
+        assert button.image is blend_surface
+
+        # once the transition is over the image is a copy of the state's surface again
+        manager.update(0.5)
+        manager.update(0.01)
+        assert button.image is not blend_surface
+        assert button.image is not button.drawable_shape.get_surface("hovered")
+
     def test_set_relative_position(self, _init_pygame, default_ui_manager,
                                    _display_surface_return_none):
         test_container = UIContainer(relative_rect=pygame.Rect(100, 100, 300, 60),
@@ -125,6 +125,37 @@ class TestUISelectionList:
                          if item['button_element'] is not None]
         assert visible_items == ['item 5', 'item 6', 'item 7', 'item 8', 'item 9']
 
+    def test_rows_are_pooled(self, _init_pygame, default_ui_manager, _display_surface_return_none: None):
+        selection_list = UISelectionList(relative_rect=pygame.Rect(50, 50, 150, 80),
+                                         item_list=[f'item {i}' for i in range(100000)],
+                                         manager=default_ui_manager,
+                                         default_selection=['item 50000'],
+                                         allow_multi_select=True)
+
+        assert len(selection_list.item_list_container.elements) == 4
+        first_button = selection_list.item_list[0]['button_element']
+
+        selection_list.scroll_bar.has_moved_recently = True
+        selection_list.scroll_bar.start_percentage = 0.5
+        selection_list.update(time_delta=0.05)
+
+        visible_items = [(item['text'], item['button_element'].text, item['button_element'].is_selected)
+                         for item in selection_list.item_list[49990:50010]
+                         if item['button_element'] is not None]
+        assert visible_items == [('item 49999', 'item 49999', False),
+                                 ('item 50000', 'item 50000', True),
+                                 ('item 50001', 'item 50001', False),
+                                 ('item 50002', 'item 50002', False),
+                                 ('item 50003', 'item 50003', False)]
+        assert len(selection_list.item_list_container.elements) <= 5
+        assert first_button.alive()
+        assert selection_list.item_list[0]['button_element'] is None
+
+        selection_list.set_item_list(['new item 1', 'new item 2'])
+        assert selection_list.item_list[0]['button_element'] is first_button
+        assert first_button.text == 'new item 1'
+        assert len(selection_list.item_list_container.elements) <= 5
+
     def test_set_item_list(self, _init_pygame, default_ui_manager,
                            _display_surface_return_none: None):
         selection_list = UISelectionList(relative_rect=pygame.Rect(50, 50, 150, 80),
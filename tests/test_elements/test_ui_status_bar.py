@@ -41,6 +41,33 @@ class TestUIStatusBar:
 
         assert health_bar.percent_full == 0.5
 
+    def test_update_redraws_only_filled_bar(self, _init_pygame, _display_surface_return_none,
+                                            default_ui_manager):
+        healthy_sprite = HealthySprite()
+        health_bar = UIStatusBar(relative_rect=pygame.Rect(100, 100, 150, 30),
+                                 sprite=healthy_sprite,
+                                 percent_method=healthy_sprite.health_percent,
+                                 manager=default_ui_manager)
+        health_bar.update(0.01)
+        shape = health_bar.drawable_shape
+
+        healthy_sprite.current_health = 20
+        health_bar.update(0.01)
+        assert health_bar.drawable_shape is shape
+
+        fresh_health_bar = UIStatusBar(relative_rect=pygame.Rect(100, 100, 150, 30),
+                                       sprite=healthy_sprite,
+                                       percent_method=healthy_sprite.health_percent,
+                                       manager=default_ui_manager)
+        fresh_health_bar.update(0.01)
+        assert compare_surfaces(health_bar.image, fresh_health_bar.image)
+
+        # changes smaller than a pixel of bar don't redraw anything
+        image = health_bar.image
+        healthy_sprite.current_health = 20.1
+        health_bar.update(0.01)
+        assert health_bar.image is image
+
     def test_rebuild_from_theme_data_non_default(self, _init_pygame, _display_surface_return_none):
         manager = UIManager((800, 600), os.path.join("tests", "data", "themes", "ui_status_bar_non_default.json"))
         healthy_sprite = HealthySprite()
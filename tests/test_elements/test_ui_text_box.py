@@ -8,6 +8,7 @@ import i18n
 import pygame_gui
 from pygame_gui.core.utility import clipboard_paste
 from pygame_gui.elements.ui_text_box import UITextBox
+from pygame_gui.elements.ui_text_entry_box import UITextEntryBox
 from pygame_gui.ui_manager import UIManager
 from tests.shared_comparators import compare_surfaces
 from pygame_gui.core.text.text_line_chunk import TextLineChunkFTFont
@@ -997,5 +998,157 @@ class TestUITextBox:
         assert processed_key_event and clipboard_paste() == 'dan'
 
 
+    def test_remove_lines_from_start(self, _init_pygame: None,
+                                     default_ui_manager: UIManager,
+                                     _display_surface_return_none):
+        text_box = UITextBox(html_text="",
+                             relative_rect=pygame.Rect(0, 0, 200, 100),
+                             manager=default_ui_manager)
+        for line_index in range(20):
+            text_box.append_html_text(f"line {line_index}<br>")
+        assert text_box.scroll_bar is not None
+        layout = text_box.text_box_layout
+        first_row_y = layout.layout_rows[0].y
+        row_height = layout.layout_rows[1].y - first_row_y
+        full_height = layout.layout_rect.height
+
+        text_box.remove_lines_from_start(15)
+
+        assert text_box.appended_text == ''.join(f"line {line_index}<br>"
+                                                 for line_index in range(15, 20))
+        assert text_box.text_box_layout is layout
+        assert layout.plain_text.startswith("line 15\n")
+        assert layout.layout_rows[0].y == first_row_y
+        assert layout.layout_rows[1].y == first_row_y + row_height
+        assert [row.row_index for row in layout.layout_rows] == list(range(len(layout.layout_rows)))
+        assert layout.layout_rect.height == max(text_box.text_wrap_rect[3], full_height - 15 * row_height)
+
+        text_box.remove_lines_from_start(10)
+        assert text_box.appended_text == ''
+        assert text_box.image is not None
+
+    def test_tiled_finalisation_mode(self, _init_pygame: None,
+                                     default_ui_manager: UIManager,
+                                     _display_surface_return_none):
+        html_text = ''.join(f"line <b>{line_index}</b> of a long "
+                            f"<a href='link_{line_index}'>document</a><br>"
+                            for line_index in range(200))
+        full_box = UITextBox(html_text=html_text,
+                             relative_rect=pygame.Rect(0, 0, 200, 100),
+                             manager=default_ui_manager)
+        tiled_box = UITextBox(html_text=html_text,
+                              relative_rect=pygame.Rect(0, 0, 200, 100),
+                              manager=default_ui_manager)
+        tiled_box.set_tiled_finalisation_mode(True, tile_height=64)
+        layout = tiled_box.text_box_layout
+        assert layout.finalised_surface is None
+        assert layout.is_finalised()
+
+        def images_match():
+            return all(full_box.image.get_at((x, y)) == tiled_box.image.get_at((x, y))
+                       for x in range(full_box.image.get_width())
+                       for y in range(full_box.image.get_height()))
+
+        assert images_match()
+        for start_percentage in (0.1, 0.55, 0.9):
+            for text_box in (full_box, tiled_box):
+                text_box.scroll_bar.set_scroll_from_start_percentage(start_percentage)
+                text_box.update(0.01)
+            assert images_match()
+            # only the tiles near the view are kept
+            assert len(layout.finalised_tiles) <= 100 // 64 + 2
+
+        tiled_box.append_html_text("one more line")
+        tiled_box.scroll_bar.set_scroll_from_start_percentage(1.0)
+        tiled_box.update(0.01)
+        assert "one more line" in layout.plain_text
+
+        tiled_box.set_tiled_finalisation_mode(False)
+        assert layout.finalised_surface is not None
+        assert layout.finalised_tiles is None
+
+    def test_tiled_finalisation_mode_editing(self, _init_pygame: None,
+                                             default_ui_manager: UIManager,
+                                             _display_surface_return_none):
+        text = "\n".join(f"line {line_index} with enough words to wrap around"
+                         for line_index in range(30))
+        full_box = UITextEntryBox(relative_rect=pygame.Rect(0, 0, 200, 150),
+                                  initial_text=text,
+                                  manager=default_ui_manager)
+        tiled_box = UITextEntryBox(relative_rect=pygame.Rect(0, 0, 200, 150),
+                                   initial_text=text,
+                                   manager=default_ui_manager)
+        tiled_box.set_tiled_finalisation_mode(True, tile_height=64)
+
+        def delete_many(layout):
+            for _ in range(40):
+                layout.set_cursor_position(6)
+                layout.delete_at_cursor()
+
+        edits = [lambda layout: layout.insert_text("ZZZZZZ", 0),
+                 lambda layout: layout.insert_text(" and a lot more words on the end", 5),
+                 lambda layout: layout.insert_line_break(10, full_box.parser),
+                 lambda layout: (layout.set_cursor_position(20),
+                                 layout.backspace_at_cursor()),
+                 delete_many]
+        for edit in edits:
+            for text_box in (full_box, tiled_box):
+                edit(text_box.text_box_layout)
+                text_box.redraw_from_text_block()
+                text_box.update(0.01)
+            assert compare_surfaces(full_box.image, tiled_box.image)
+
+    def test_link_hover_redraw(self, _init_pygame: None,
+                               default_ui_manager: UIManager,
+                               _display_surface_return_none):
+        html_text = ''.join(f"line {line_index} <a href='link_{line_index}'>link</a><br>"
+                            for line_index in range(100))
+        text_box = UITextBox(html_text=html_text,
+                             relative_rect=pygame.Rect(0, 0, 200, 100),
+                             manager=default_ui_manager)
+        text_box.scroll_bar.set_scroll_from_start_percentage(0.5)
+        default_ui_manager.update(0.01)
+        layout = text_box.text_box_layout
+        height_adjustment = int(text_box.scroll_bar.start_percentage * layout.layout_rect.height)
+        base_x, base_y = text_box._calculate_hyperlinks_offsets()
+
+        # pick a link in the middle of the view
+        view_middle = height_adjustment + text_box.text_wrap_rect[3] // 2
+        link_chunk = layout.get_link_chunks_near_y(view_middle)[0]
+        assert len(layout.get_link_chunks_near_y(view_middle)) <= 3
+        old_image = text_box.image
+
+        default_ui_manager.mouse_position = (base_x + link_chunk.centerx,
+                                             base_y + link_chunk.centery)
+        text_box.update(0.01)
+        assert link_chunk.is_hovered
+        assert text_box.dirty
+        # the image is redrawn in place, and matches a full redraw
+        assert text_box.image is old_image
+        hovered_image = text_box.image.copy()
+        text_box.redraw_from_text_block()
+        assert all(hovered_image.get_at((x, y)) == text_box.image.get_at((x, y))
+                   for x in range(hovered_image.get_width())
+                   for y in range(hovered_image.get_height()))
+
+        default_ui_manager.mouse_position = (0, 0)
+        text_box.update(0.01)
+        assert not link_chunk.is_hovered
+        assert not any(chunk.is_hovered for chunk in text_box.link_hover_chunks)
+
+        # tiled text boxes redraw the tiles under the link
+        text_box.set_tiled_finalisation_mode(True, tile_height=32)
+        default_ui_manager.mouse_position = (base_x + link_chunk.centerx,
+                                             base_y + link_chunk.centery)
+        text_box.update(0.01)
+        assert link_chunk.is_hovered
+        hovered_image = text_box.image.copy()
+        text_box.set_tiled_finalisation_mode(False)
+        text_box.redraw_from_text_block()
+        assert all(hovered_image.get_at((x, y)) == text_box.image.get_at((x, y))
+                   for x in range(hovered_image.get_width())
+                   for y in range(hovered_image.get_height()))
+
+
 if __name__ == '__main__':
     pytest.console_main()
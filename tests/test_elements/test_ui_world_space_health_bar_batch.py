@@ -0,0 +1,108 @@
+import pytest
+import pygame
+
+from tests.shared_comparators import compare_surfaces
+
+from pygame_gui.elements.ui_world_space_health_bar import UIWorldSpaceHealthBar
+from pygame_gui.elements.ui_world_space_health_bar_batch import UIWorldSpaceHealthBarBatch
+
+
+class HealthySpriteNoCapacity(pygame.sprite.Sprite):
+    def __init__(self, *groups):
+        super().__init__(*groups)
+        self.current_health = 75
+        self.rect = pygame.Rect(150, 150, 50, 75)
+
+
+class TestUIWorldSpaceHealthBarBatch:
+
+    def test_creation(self, _init_pygame, _display_surface_return_none, default_ui_manager):
+        sprites = [UIWorldSpaceHealthBar.ExampleHealthSprite() for _ in range(3)]
+        batch = UIWorldSpaceHealthBarBatch(relative_rect=pygame.Rect(0, 0, 800, 600),
+                                           bar_size=(50, 10),
+                                           sprites_to_monitor=sprites,
+                                           manager=default_ui_manager)
+        assert batch.image is not None
+        assert batch.bar_atlas is not None
+        assert len(batch.sprites) == 3
+
+    def test_creation_sprite_no_capacity(self, _init_pygame, _display_surface_return_none, default_ui_manager):
+        with pytest.raises(AttributeError, match="Sprite does not have health_capacity attribute"):
+            UIWorldSpaceHealthBarBatch(relative_rect=pygame.Rect(0, 0, 800, 600),
+                                       bar_size=(50, 10),
+                                       sprites_to_monitor=[HealthySpriteNoCapacity()],
+                                       manager=default_ui_manager)
+
+    def test_bars_match_single_health_bars(self, _init_pygame, _display_surface_return_none, default_ui_manager):
+        healthy_sprite = UIWorldSpaceHealthBar.ExampleHealthSprite()
+        healthy_sprite.rect.topleft = (100, 100)
+        healthy_sprite.current_health = 37
+        batch = UIWorldSpaceHealthBarBatch(relative_rect=pygame.Rect(0, 0, 800, 600),
+                                           bar_size=(50, 10),
+                                           sprites_to_monitor=[healthy_sprite],
+                                           manager=default_ui_manager)
+        health_bar = UIWorldSpaceHealthBar(relative_rect=pygame.Rect(0, 0, 50, 10),
+                                           sprite_to_monitor=healthy_sprite,
+                                           manager=default_ui_manager)
+        batch.update(0.01)
+        health_bar.update(0.01)
+
+        bar_x, bar_y = batch.bar_positions[0]
+        assert (bar_x, bar_y) == health_bar.rect.topleft
+        assert compare_surfaces(batch.image.subsurface(pygame.Rect(bar_x, bar_y, 50, 10)),
+                                health_bar.image)
+
+    def test_update(self, _init_pygame, _display_surface_return_none, default_ui_manager):
+        sprites = [UIWorldSpaceHealthBar.ExampleHealthSprite() for _ in range(2)]
+        sprites[0].rect.topleft = (100, 100)
+        sprites[1].rect.topleft = (2000, 100)
+        batch = UIWorldSpaceHealthBarBatch(relative_rect=pygame.Rect(0, 0, 800, 600),
+                                           bar_size=(50, 10),
+                                           sprites_to_monitor=sprites,
+                                           manager=default_ui_manager)
+        batch.update(0.01)
+        full_width = batch.bar_filled_widths[0]
+
+        sprites[0].current_health = 10
+        batch.update(0.01)
+        assert batch.bar_filled_widths[0] < full_width
+        # bars outside the view aren't drawn
+        assert len(batch._drawn_blits) == 1
+
+        # nothing is redrawn when no bar has changed
+        drawn_blits = batch._drawn_blits
+        batch.update(0.01)
+        assert batch._drawn_blits is drawn_blits
+
+        batch.add_sprite(UIWorldSpaceHealthBar.ExampleHealthSprite())
+        batch.update(0.01)
+        assert len(batch._drawn_blits) == 2
+        batch.remove_sprite(batch.sprites[-1])
+
+        batch.set_camera_position((100, 0))
+        batch.update(0.01)
+        assert batch.bar_positions[0][0] == 0
+
+        batch.remove_sprite(sprites[0])
+        assert batch.sprites == [sprites[1]]
+        batch.clear_sprites()
+        assert batch.sprites == []
+        assert len(batch.bar_positions) == 0
+
+    def test_does_not_block_hover(self, _init_pygame, _display_surface_return_none, default_ui_manager):
+        batch = UIWorldSpaceHealthBarBatch(relative_rect=pygame.Rect(0, 0, 800, 600),
+                                           bar_size=(50, 10),
+                                           manager=default_ui_manager)
+        assert not batch.hover_point(100, 100)
+        assert not batch.check_hover(0.01, False)
+
+    def test_set_dimensions(self, _init_pygame, _display_surface_return_none, default_ui_manager):
+        batch = UIWorldSpaceHealthBarBatch(relative_rect=pygame.Rect(0, 0, 800, 600),
+                                           bar_size=(50, 10),
+                                           manager=default_ui_manager)
+        batch.set_dimensions((400, 300))
+        assert batch.image.get_size() == (400, 300)
+
+
+if __name__ == '__main__':
+    pytest.console_main()
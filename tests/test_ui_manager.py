@@ -1,5 +1,7 @@
 import os
+import json
 import platform
+import time
 import pygame
 import pytest
 
@@ -14,6 +16,7 @@ from pygame_gui.windows.ui_message_window import UIMessageWindow
 from pygame_gui.elements.ui_window import UIWindow
 from pygame_gui import PackageResource
 from pygame_gui.core.resource_loaders import IncrementalThreadedResourceLoader
+from pygame_gui.core.resource_loaders import StreamingResourceLoader
 from pygame_gui.core.layered_gui_group import LayeredGUIGroup
 
 
@@ -241,6 +244,83 @@ class TestUIManager:
             pass
         pygame.display.quit()
 
+    def test_draw_ui_dirty_rect_mode(self, _init_pygame, _display_surface_return_none):
+        test_surface = pygame.display.set_mode((300, 200), 0, 32)
+        manager = UIManager((300, 200))
+        background = pygame.Surface((300, 200))
+        button = UIButton(relative_rect=pygame.Rect(10, 10, 150, 30), text="Test", manager=manager)
+        UIButton(relative_rect=pygame.Rect(10, 100, 150, 30), text="Other", manager=manager)
+
+        assert manager.draw_ui(test_surface) == [test_surface.get_rect()]
+
+        manager.set_dirty_rect_mode(True, background)
+        manager.update(0.01)
+        assert manager.draw_ui(test_surface) == [test_surface.get_rect()]
+        manager.update(0.01)
+        assert manager.draw_ui(test_surface) == []
+
+        button.set_position((20, 10))
+        manager.update(0.01)
+        assert manager.draw_ui(test_surface) == [pygame.Rect(10, 10, 160, 30)]
+
+        manager.set_dirty_rect_mode(False)
+        assert manager.draw_ui(test_surface) == [test_surface.get_rect()]
+        pygame.display.quit()
+
+    def test_profiling_mode(self, _init_pygame, _display_surface_return_none):
+        test_surface = pygame.display.set_mode((300, 200), 0, 32)
+        manager = UIManager((300, 200))
+        button = UIButton(relative_rect=pygame.Rect(10, 10, 150, 30), text="Test", manager=manager)
+
+        manager.update(0.01)
+        manager.draw_ui(test_surface)
+        assert manager.get_profiler().get_frames() == []
+
+        manager.set_profiling_mode(True, max_frames=2)
+        for _ in range(3):
+            manager.process_events(pygame.event.Event(pygame.MOUSEMOTION, {'pos': (20, 20)}))
+            button.schedule_update()
+            manager.update(0.01)
+            manager.draw_ui(test_surface)
+
+        frames = manager.get_profiler().get_frames()
+        assert len(frames) == 2
+        assert frames[-1]['frame'] == 2
+        assert set(frames[-1]['timings_ms']) == {'process_events', 'theme_checks', 'hovering',
+                                                 'update', 'draw'}
+        assert frames[-1]['process_events_calls'] == 1
+        assert frames[-1]['element_updates']['UIButton'] == 1
+        # only elements with work to do are updated
+        assert 'UIContainer' not in frames[-1]['element_updates']
+        assert json.loads(manager.get_profiler().to_json()) == frames
+
+        # swapping images, as state changes do, doesn't rebuild the button
+        button.drawable_shape.set_active_state('hovered')
+        manager.update(0.01)
+        manager.draw_ui(test_surface)
+        assert manager.get_profiler().get_frames()[-1]['element_rebuilds'] == {}
+
+        button.rebuild()
+        manager.update(0.01)
+        manager.draw_ui(test_surface)
+        assert manager.get_profiler().get_frames()[-1]['element_rebuilds'] == {'UIButton': 1}
+
+        manager.set_profiling_mode(False)
+        manager.update(0.01)
+        manager.draw_ui(test_surface)
+        assert len(manager.get_profiler().get_frames()) == 2
+        pygame.display.quit()
+
+    def test_shape_cache_memory_budget(self, _init_pygame, default_ui_manager,
+                                       _display_surface_return_none):
+        assert default_ui_manager.get_shape_cache_memory_usage() > 0
+        default_ui_manager.set_shape_cache_memory_budget(0)
+        assert default_ui_manager.get_shape_cache_memory_usage() == 0
+        default_ui_manager.set_ui_theme(UIAppearanceTheme(default_ui_manager.resource_loader,
+                                                          default_ui_manager.get_locale()))
+        assert default_ui_manager.get_shape_cache_memory_usage() == 0
+        default_ui_manager.set_shape_cache_memory_budget(None)
+
     def test_add_font_paths_and_preload_fonts(self, _init_pygame, default_ui_manager, _display_surface_return_none):
         """
         Combined test of setting font paths and preloading.
@@ -297,6 +377,61 @@ class TestUIManager:
             finished, progress = incremental_loader.update()
         assert finished
 
+    def test_hover_moves_between_elements(self, _init_pygame, _display_surface_return_none):
+        manager = UIManager((800, 600))
+        button1 = UIButton(relative_rect=pygame.Rect(100, 100, 100, 100), text="First",
+                           manager=manager)
+        button2 = UIButton(relative_rect=pygame.Rect(500, 400, 100, 100), text="Second",
+                           manager=manager)
+
+        manager._update_mouse_position = update_mouse_position_override_factory(manager, 150, 150)
+        manager.update(0.01)
+        assert button1.hovered is True
+        assert button2.hovered is False
+
+        manager._update_mouse_position = update_mouse_position_override_factory(manager, 550, 450)
+        manager.update(0.01)
+        assert button1.hovered is False
+        assert button2.hovered is True
+
+        # moving an element under the mouse should update the spatial index
+        button1.set_position((520, 420))
+        button1.change_layer(5)
+        manager.update(0.01)
+        assert button1.hovered is True
+        assert button2.hovered is False
+
+        # off the window entirely we fall back to checking everything
+        manager._update_mouse_position = update_mouse_position_override_factory(manager, -50, -50)
+        manager.update(0.01)
+        assert button1.hovered is False
+        assert button2.hovered is False
+
+    def test_hover_after_resize(self, _init_pygame, _display_surface_return_none):
+        manager = UIManager((800, 600))
+        text_box = UITextBox(html_text="Some text", relative_rect=pygame.Rect(0, 0, 100, 100),
+                             manager=manager)
+        button = UIButton(relative_rect=pygame.Rect(400, 0, 100, 100), text="Button",
+                          manager=manager)
+
+        manager._update_mouse_position = update_mouse_position_override_factory(manager, 250, 250)
+        manager.update(0.01)
+        assert text_box.hovered is False
+
+        # the newly covered area should be found in the spatial index
+        text_box.set_dimensions((300, 300))
+        manager.update(0.5)
+        manager.update(0.5)
+        manager.update(0.01)
+        assert text_box.hovered is True
+
+        manager._update_mouse_position = update_mouse_position_override_factory(manager, 450, 250)
+        manager.update(0.01)
+        assert button.hovered is False
+        button.set_dimensions((100, 300))
+        manager.update(0.01)
+        assert button.hovered is True
+
     def test_hover_of_hidden_elements(self, _init_pygame, _display_surface_return_none):
         manager = UIManager((800, 600))
         button1 = UIButton(relative_rect=pygame.Rect(100, 100, 100, 100), text="Lower button test",
@@ -372,6 +507,84 @@ class TestUIManager:
             finished, _ = incremental_loader.update()
         assert finished
 
+    def test_streaming_loading(self, _init_pygame, _display_surface_return_none):
+        streaming_loader = StreamingResourceLoader()
+        streaming_loader.start()
+
+        theme_package = PackageResource('tests.data.themes', 'image_loading_test.json')
+        manager = UIManager((800, 600), theme_package,
+                            resource_loader=streaming_loader)
+        # the images are loaded in the background, and handed over as the manager updates
+        image_resource = manager.ui_theme.image_resources['tests.data.images/splat.png']
+        start_time = time.perf_counter()
+        while (image_resource.loaded_surface is None
+               and time.perf_counter() - start_time < 5.0):
+            manager.update(0.01)
+        assert image_resource.loaded_surface is not None
+
+        # late fonts go through the loader too, rather than stalling the frame
+        manager.preload_fonts([{'name': 'noto_sans', 'point_size': 31, 'style': 'bold'}])
+        font_dict = manager.ui_theme.get_font_dictionary()
+        start_time = time.perf_counter()
+        while (not streaming_loader.update()[0]
+               and time.perf_counter() - start_time < 5.0):
+            manager.update(0.01)
+        assert font_dict.find_font(31, 'noto_sans', bold=True) is not font_dict.get_default_font()
+        streaming_loader.stop()
+
+    def test_streaming_loading_shared_resources(self, _init_pygame, _display_surface_return_none):
+        streaming_loader = StreamingResourceLoader()
+
+        # two managers asking the loader for the same resources get the same ones back
+        theme_package = PackageResource('tests.data.themes', 'image_loading_test.json')
+        managers = [UIManager((800, 600), theme_package, resource_loader=streaming_loader)
+                    for _ in range(2)]
+        for manager in managers:
+            manager.preload_fonts([{'name': 'noto_sans', 'point_size': 33, 'style': 'bold'}])
+
+        streaming_loader.start()
+        start_time = time.perf_counter()
+        while (not streaming_loader.update()[0]
+               and time.perf_counter() - start_time < 5.0):
+            pass
+        streaming_loader.stop()
+
+        for manager in managers:
+            image_resource = manager.ui_theme.image_resources['tests.data.images/splat.png']
+            assert image_resource.loaded_surface is not None
+            font_dict = manager.ui_theme.get_font_dictionary()
+            assert (font_dict.find_font(33, 'noto_sans', bold=True) is not
+                    font_dict.get_default_font())
+
+    def test_streaming_loading_rebuilds_users(self, _init_pygame, _display_surface_return_none):
+        streaming_loader = StreamingResourceLoader()
+        theme_package = PackageResource('tests.data.themes', 'image_loading_test.json')
+        manager = UIManager((800, 600), theme_package, resource_loader=streaming_loader)
+        splat_button = UIButton(pygame.Rect(0, 0, 100, 100), "", manager=manager,
+                                object_id='#1')
+        plain_button = UIButton(pygame.Rect(100, 0, 100, 100), "Plain", manager=manager)
+
+        rebuilt = []
+        for button in (splat_button, plain_button):
+            def rebuild(rebuilt_button=button,
+                        rebuild_button=button.rebuild_from_changed_theme_data):
+                rebuilt.append(rebuilt_button)
+                rebuild_button()
+            button.rebuild_from_changed_theme_data = rebuild
+
+        # only the button using the image is rebuilt when it arrives
+        streaming_loader.start()
+        image_resource = manager.ui_theme.image_resources['tests.data.images/splat.png']
+        start_time = time.perf_counter()
+        while (splat_button not in rebuilt
+               and time.perf_counter() - start_time < 5.0):
+            manager.update(0.01)
+        streaming_loader.stop()
+        assert image_resource.loaded_surface is not None
+        assert splat_button in rebuilt
+        assert plain_button not in rebuilt
+        assert splat_button.normal_images[0] is not None
+
     def test_set_ui_theme(self, _init_pygame, _display_surface_return_none):
         manager = UIManager((800, 600))
         theme_dict = {"text_box": {"colours": {"dark_bg": "#25f92e"}}}
@@ -394,6 +607,110 @@ class TestUIManager:
 
         assert manager.get_hovering_any_element()
 
+    def test_background_theme_reload_mode(self, _init_pygame, _display_surface_return_none, tmp_path):
+        theme_path = tmp_path / "theme.json"
+        theme_path.write_text('{"button": {"colours": {"normal_bg": "#101010"}}}')
+        manager = UIManager((800, 600), str(theme_path))
+        buttons = [UIButton((10, 10 + (i * 30)), "Button", manager=manager) for i in range(3)]
+        manager.set_background_theme_reload_mode(True, rebuild_time_budget=0.0)
+        try:
+            theme_path.write_text('{"button": {"colours": {"normal_bg": "#202020"}}}')
+            os.utime(theme_path, (0, manager.get_theme()._theme_file_last_modified + 10))
+            assert manager.get_theme()._theme_file_watcher.check_for_changes()
+
+            # only the buttons use the changed theme data, and with no time budget one is
+            # rebuilt each frame
+            manager.update(0.01)
+            assert len(manager._theme_rebuild_queue) == len(buttons) - 1
+
+            # a reload while buttons are still waiting doesn't queue them twice
+            theme_path.write_text('{"button": {"colours": {"normal_bg": "#303030"}}}')
+            os.utime(theme_path, (0, manager.get_theme()._theme_file_last_modified + 10))
+            assert manager.get_theme()._theme_file_watcher.check_for_changes()
+            manager.update(0.01)
+            assert len(manager._theme_rebuild_queue) == len(buttons) - 1
+            for _ in range(len(buttons) - 1):
+                manager.update(0.01)
+            assert len(manager._theme_rebuild_queue) == 0
+            assert all(button.colours["normal_bg"] == pygame.Color("#303030")
+                       for button in buttons)
+        finally:
+            manager.set_background_theme_reload_mode(False)
+
+    def test_background_theme_reload_needs_live_updates(self, _init_pygame,
+                                                        _display_surface_return_none, tmp_path):
+        theme_path = tmp_path / "theme.json"
+        theme_path.write_text('{"button": {"colours": {"normal_bg": "#101010"}}}')
+        manager = UIManager((800, 600), str(theme_path), enable_live_theme_updates=False)
+        manager.set_background_theme_reload_mode(True)
+        try:
+            # no point watching a file whose changes would never be applied
+            assert manager.get_theme()._theme_file_watcher is None
+
+            manager.live_theme_updates = True
+            manager.update(0.01)
+            assert manager.get_theme()._theme_file_watcher is not None
+
+            manager.live_theme_updates = False
+            manager.update(0.01)
+            assert manager.get_theme()._theme_file_watcher is None
+        finally:
+            manager.set_background_theme_reload_mode(False)
+        assert manager.get_theme()._theme_file_watcher is None
+
+    def test_rebuild_changed_from_theme_data(self, _init_pygame, _display_surface_return_none):
+        manager = UIManager((800, 600))
+        ok_button = UIButton((10, 10), "OK", manager=manager, object_id="#ok_button")
+        cancel_button = UIButton((10, 50), "Cancel", manager=manager,
+                                 object_id="#cancel_button")
+        rebuilt = []
+        for button in (ok_button, cancel_button):
+            button.rebuild_from_changed_theme_data = (
+                lambda rebuilt_button=button: rebuilt.append(rebuilt_button))
+
+        manager.get_theme().update_theming('{"#ok_button": {"colours": {"normal_bg": "#202020"}}}')
+        manager.update(0.01)
+        assert rebuilt == [ok_button]
+
+        rebuilt.clear()
+        manager.update(0.01)
+        assert rebuilt == []
+
+    def test_unchanged_images_not_rebuilt(self, _init_pygame, _display_surface_return_none):
+        manager = UIManager((800, 600))
+        image_theme = {"#image_button": {"images": {"normal_image": {
+            "package": "tests.data.images", "resource": "splat.png"}}}}
+        manager.get_theme().update_theming(json.dumps(image_theme))
+        manager.update(0.01)
+        image_button = UIButton((10, 10), "", manager=manager, object_id="#image_button")
+        label_button = UIButton((10, 50), "Label", manager=manager, object_id="#label_button")
+        rebuilt = []
+        for button in (image_button, label_button):
+            button.rebuild_from_changed_theme_data = (
+                lambda rebuilt_button=button: rebuilt.append(rebuilt_button))
+
+        # reloading the same images alongside an unrelated change leaves the images alone
+        image_theme["#label_button"] = {"colours": {"normal_text": "#FF0000"}}
+        manager.get_theme().update_theming(json.dumps(image_theme))
+        manager.update(0.01)
+        assert rebuilt == [label_button]
+
+        rebuilt.clear()
+        image_theme["#image_button"]["images"]["normal_image"]["sub_surface_rect"] = "0,0,8,8"
+        manager.get_theme().update_theming(json.dumps(image_theme))
+        manager.update(0.01)
+        assert rebuilt == [image_button]
+
+    def test_shadow_cache_path(self, _init_pygame, _display_surface_return_none, tmp_path):
+        UIManager((800, 600), shadow_cache_path=tmp_path)
+        cache_files = list(tmp_path.glob("shadow_corners_*.bin"))
+        assert len(cache_files) > 0
+
+        manager = UIManager((800, 600), shadow_cache_path=tmp_path)
+        assert len(list(tmp_path.glob("shadow_corners_*.bin"))) == len(cache_files)
+        shadow_generator = manager.get_theme().get_shadow_generator()
+        assert len(shadow_generator._persistent_shadow_corners) == len(cache_files)
+
 
 if __name__ == '__main__':
     os.chdir('..')
@@ -368,6 +368,42 @@ class TestUIConsoleWindow:
         assert console_window.logged_commands_below == []
 
 
+    def test_max_log_lines(self, _init_pygame, default_ui_manager,
+                           _display_surface_return_none):
+        console_window = UIConsoleWindow(rect=pygame.rect.Rect((0, 0), (700, 500)),
+                                         manager=default_ui_manager,
+                                         max_log_lines=10)
+
+        for line_index in range(25):
+            console_window.add_output_line_to_log(f'line {line_index}', is_bold=False)
+
+        # lines are queued up until the window next updates
+        assert console_window.log.appended_text == ''
+
+        console_window.update(0.01)
+        assert console_window.log.appended_text == ''.join(f'line {line_index}<br>'
+                                                           for line_index in range(15, 25))
+
+        console_window.add_output_line_to_log('partial ', is_bold=False, remove_line_break=True)
+        console_window.add_output_line_to_log('line', is_bold=False)
+        console_window.update(0.01)
+        assert console_window.log.appended_text == (''.join(f'line {line_index}<br>'
+                                                            for line_index in range(16, 25)) +
+                                                    'partial line<br>')
+        assert console_window.log.text_box_layout.plain_text.startswith('line 16\n')
+
+        console_window.set_max_log_lines(None)
+        console_window.add_output_line_to_log('unbounded', is_bold=False)
+        assert console_window.log.appended_text.endswith('partial line<br>unbounded<br>')
+
+        console_window.set_max_log_lines(2)
+        console_window.update(0.01)
+        assert console_window.log.appended_text == 'partial line<br>unbounded<br>'
+
+        console_window.clear_log()
+        assert console_window.log.appended_text == ''
+
+
 if __name__ == '__main__':
     pytest.console_main()
 